@@ -0,0 +1,277 @@
+"""Build ``sw_minified.lua`` from ``sw.lua``.
+
+Stormworks limits the size of a Lua script, so the script pasted into the
+game is a minified copy: comments and whitespace are dropped and every
+local variable and parameter gets a one or two letter name.  Globals are
+kept, since the game calls ``onTick``/``httpReply``/``onDraw`` by name and
+the constants at the top are meant to be edited.
+
+    python SW_lua/minify.py           # rewrite sw_minified.lua
+    python SW_lua/minify.py --check   # exit 1 if it is out of date
+
+The renaming understands the Lua that ``sw.lua`` uses (``local``,
+``function`` parameters and ``for`` variables) and rejects
+``repeat ... until``, whose condition can see the loop body's locals.
+"""
+
+import os
+import re
+import string
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SOURCE = os.path.join(HERE, "sw.lua")
+TARGET = os.path.join(HERE, "sw_minified.lua")
+
+KEYWORDS = frozenset("""
+    and break do else elseif end false for function goto if in local nil not
+    or repeat return then true until while
+""".split())
+# keywords that can appear inside an expression
+_EXPRESSION_KEYWORDS = frozenset(("and", "or", "not", "nil", "true", "false", "function"))
+
+_TOKEN = re.compile(r"""
+    (?P<space>\s+)
+  | (?P<comment>--(?:\[(?P<ceq>=*)\[[\s\S]*?\](?P=ceq)\]|[^\n]*))
+  | (?P<longstring>\[(?P<seq>=*)\[[\s\S]*?\](?P=seq)\])
+  | (?P<string>"(?:\\[\s\S]|[^"\\\n])*"|'(?:\\[\s\S]|[^'\\\n])*')
+  | (?P<number>0[xX][0-9a-fA-F]*(?:\.[0-9a-fA-F]*)?(?:[pP][+-]?\d+)?
+              |(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<op>\.\.\.|\.\.|==|~=|<=|>=|<<|>>|//|::|[-+*/%^#&~|<>=(){}\[\];:,.])
+""", re.VERBOSE)
+
+
+def tokenize(source):
+    """Split Lua source into ``(kind, text)`` tokens, dropping whitespace and comments."""
+    tokens = []
+    position = 0
+    while position < len(source):
+        match = _TOKEN.match(source, position)
+        if match is None:
+            raise ValueError(f"cannot tokenize Lua at {source[position:position + 20]!r}")
+        position = match.end()
+        if match.group("space") or match.group("comment"):
+            continue
+        text = match.group()
+        if match.group("name"):
+            kind = "keyword" if text in KEYWORDS else "name"
+        elif match.group("number"):
+            kind = "number"
+        elif match.group("op"):
+            kind = "op"
+        else:
+            kind = "string"
+        tokens.append((kind, text))
+    return tokens
+
+
+def _ends_operand(token):
+    kind, text = token
+    return kind in ("name", "number", "string") or text in (")", "}", "]", "nil", "true", "false", "end")
+
+
+def _starts_statement(token):
+    kind, text = token
+    return kind in ("name", "number") or (kind == "keyword" and text not in _EXPRESSION_KEYWORDS)
+
+
+def _function_end(tokens, start):
+    """Index just past the ``end`` closing the function starting at ``start``."""
+    depth = 0
+    for i in range(start, len(tokens)):
+        kind, text = tokens[i]
+        if kind == "keyword" and text in ("function", "if", "do"):
+            depth += 1
+        elif kind == "keyword" and text == "end":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    return len(tokens)
+
+
+def _expression_list_end(tokens, start):
+    """Index just past the expression list starting at ``start``."""
+    depth = 0
+    i = start
+    while i < len(tokens):
+        kind, text = tokens[i]
+        if depth == 0 and i > start and _ends_operand(tokens[i - 1]) and _starts_statement(tokens[i]):
+            return i
+        if kind == "keyword" and text == "function":
+            i = _function_end(tokens, i)
+            continue
+        if kind == "op" and text in "({[":
+            depth += 1
+        elif kind == "op" and text in ")}]":
+            depth -= 1
+            if depth < 0:
+                return i
+        i += 1
+    return len(tokens)
+
+
+def _short_names(avoid):
+    letters = string.ascii_lowercase + string.ascii_uppercase
+    for length in range(1, 4):
+        for index in range(len(letters) ** length):
+            name = ""
+            for _ in range(length):
+                index, digit = divmod(index, len(letters))
+                name = letters[digit] + name
+            if name not in avoid and name not in KEYWORDS:
+                yield name
+
+
+def rename_locals(tokens):
+    """Give every local variable a short unique name; globals stay untouched."""
+    scopes = [{}]
+    brackets = []
+    staged = []  # (position where it becomes visible, scope, name, placeholder)
+    result = []
+    count = 0
+    opens_loop = False
+
+    def placeholder():
+        nonlocal count
+        count += 1
+        return f"\0{count}"
+
+    def declare_names(i, scope):
+        # names (and commas) up to the first other token; returns the new index
+        while i < len(tokens) and tokens[i][0] in ("name", "op") and tokens[i][1] not in ("=", ")"):
+            kind, text = tokens[i]
+            if kind == "name":
+                new = placeholder()
+                scope[text] = new
+                text = new
+            result.append((kind, text))
+            i += 1
+        return i
+
+    def lookup(name):
+        for scope in reversed(scopes):
+            if name in scope:
+                return scope[name]
+        return name
+
+    i = 0
+    while i < len(tokens):
+        for entry in [entry for entry in staged if entry[0] <= i]:
+            staged.remove(entry)
+            entry[1][entry[2]] = entry[3]
+
+        kind, text = tokens[i]
+        if kind == "keyword":
+            if text == "repeat":
+                raise ValueError("repeat ... until is not supported")
+            if text in ("end", "else", "elseif"):
+                scopes.pop()
+            if text in ("then", "else") or (text == "do" and not opens_loop):
+                scopes.append({})
+            if text == "do":
+                opens_loop = False
+            result.append((kind, text))
+            i += 1
+            if text == "for":
+                # the loop variables live in the loop body's scope
+                scopes.append({})
+                opens_loop = True
+                i = declare_names(i, scopes[-1])
+            elif text == "function":
+                # a named function keeps its name; its parameters are new locals
+                while tokens[i][1] != "(":
+                    name_kind, name = tokens[i]
+                    if name_kind == "name" and tokens[i - 1][1] not in (".", ":"):
+                        name = lookup(name)
+                    result.append((name_kind, name))
+                    i += 1
+                result.append(tokens[i])
+                scopes.append({})
+                i = declare_names(i + 1, scopes[-1])
+            elif text == "local" and tokens[i][1] == "function":
+                # visible inside its own body, so declare before the parameters
+                result.append(tokens[i])
+                new = placeholder()
+                scopes[-1][tokens[i + 1][1]] = new
+                result.append(("name", new))
+                result.append(tokens[i + 2])
+                scopes.append({})
+                i = declare_names(i + 3, scopes[-1])
+            elif text == "local":
+                # the new names only become visible after the values
+                scope = {}
+                i = declare_names(i, scope)
+                visible_at = i
+                if i < len(tokens) and tokens[i][1] == "=":
+                    visible_at = _expression_list_end(tokens, i + 1)
+                for name, new in scope.items():
+                    staged.append((visible_at, scopes[-1], name, new))
+            continue
+
+        if kind == "name":
+            previous = tokens[i - 1][1] if i else ""
+            following = tokens[i + 1][1] if i + 1 < len(tokens) else ""
+            table_key = brackets and brackets[-1] == "{" and previous in ("{", ",", ";") \
+                and following == "="
+            if previous not in (".", ":") and not table_key:
+                text = lookup(text)
+        elif kind == "op" and text in "({[":
+            brackets.append(text)
+        elif kind == "op" and text in ")}]" and brackets:
+            brackets.pop()
+        result.append((kind, text))
+        i += 1
+
+    # the most used locals get the shortest names
+    uses = {}
+    for kind, text in result:
+        if text.startswith("\0"):
+            uses[text] = uses.get(text, 0) + 1
+    avoid = {text for kind, text in result if kind == "name" and not text.startswith("\0")}
+    order = sorted(uses, key=lambda text: (-uses[text], int(text[1:])))
+    mapping = dict(zip(order, _short_names(avoid)))
+    return [(kind, mapping.get(text, text)) for kind, text in result]
+
+
+def _needs_space(left, right):
+    """True if writing the two tokens together would tokenize differently."""
+    if re.match(r"\.?\d", left) and (right[0].isalnum() or right[0] in "._"):
+        # Lua reads hex digits and dots after a numeral into it ("1and")
+        return True
+    try:
+        return [text for _, text in tokenize(left + right)] != [left, right]
+    except ValueError:
+        return True
+
+
+def minify(source):
+    """Return the minified form of the Lua ``source``."""
+    out = []
+    previous = None
+    for _, text in rename_locals(tokenize(source)):
+        if previous is not None and _needs_space(previous, text):
+            out.append(" ")
+        out.append(text)
+        previous = text
+    return "".join(out)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    with open(SOURCE) as f:
+        minified = minify(f.read()) + "\n"
+    if "--check" in argv:
+        with open(TARGET) as f:
+            if f.read() != minified:
+                print("sw_minified.lua is out of date; run python SW_lua/minify.py")
+                return 1
+        return 0
+    with open(TARGET, "w") as f:
+        f.write(minified)
+    print(f"wrote {TARGET} ({len(minified) - 1} characters)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
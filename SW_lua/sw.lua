@@ -1,10 +1,39 @@
 -- Constants
 API_PORT = 5000
-API_ENDPOINT = '/'
+-- Vehicle name when the server is a StormworkspyHub hosting several
+-- vehicles; leave empty when talking to a single Stormworkspy instance.
+VEHICLE = ''
+API_BASE = VEHICLE == '' and '/' or ('/' .. VEHICLE .. '/')
+API_ENDPOINT = API_BASE
+-- Compact wire format: one packed parameter instead of 64 and a plain
+-- text reply that decodes in one pass. Set to false for the JSON '/' endpoint.
+COMPACT = true
+COMPACT_ENDPOINT = API_BASE .. 'c'
+-- Channel page served by this bridge. A Stormworkspy(pages=N) instance has
+-- N x 32 channels; give every bridge script on the vehicle its own page
+-- (0 to N-1) and a SEND_INTERVAL matching how fast its channels change.
+PAGE = 0
+-- Ticks between requests (without PIPELINE)
+SEND_INTERVAL = 5
+-- Delta replies: send the last output sequence number and only receive the
+-- channels that changed since then.
+DELTA = false
+-- Pipelining: send on every tick with up to MAX_IN_FLIGHT requests pending
+-- instead of one request per tick_interval. Requests are numbered ('f') so
+-- the server drops inputs that arrive out of order and late replies are
+-- ignored here.
+PIPELINE = false
+MAX_IN_FLIGHT = 2
+-- Ticks without any reply after which pending requests count as lost
+REPLY_TIMEOUT = 60
 
 -- Initial Variables
 tick_interval = 10
 is_reply_pending = true
+in_flight = 0
+frame_seq = 0
+applied_seq = 0
+ticks_since_reply = 0
 
 http_response_body = ''
 http_request_body = ''
@@ -12,14 +41,29 @@ http_request_body = ''
 -- Tables to hold the received values
 receivedNums = {}
 receivedBools = {}
+-- Boolean bitmask of the last compact reply
+received_mask = 0
+-- Output sequence number of the last applied reply (0 asks for a snapshot)
+output_seq = 0
 
 -- Main Tick Function
 function onTick()
     tick_interval = tick_interval - 1
 
-    if tick_interval < 1 and is_reply_pending then
-        tick_interval = 5
-        transmit()
+    if PIPELINE then
+        ticks_since_reply = ticks_since_reply + 1
+        if ticks_since_reply > REPLY_TIMEOUT then
+            in_flight = 0
+            ticks_since_reply = 0
+        end
+        if in_flight < MAX_IN_FLIGHT then
+            in_flight = in_flight + 1
+            frame_seq = frame_seq + 1
+            send()
+        end
+    elseif tick_interval < 1 and is_reply_pending then
+        tick_interval = SEND_INTERVAL
+        send()
     end
 
     for i = 1, 32 do
@@ -33,23 +77,59 @@ function onTick()
     
 end
 
+function send()
+    if COMPACT then
+        transmitCompact()
+    else
+        transmit()
+    end
+end
+
 -- Transmit function: Encodes 32 numerical and 32 boolean values into a GET request.
 function transmit()
-    local query = "?"
-    -- Append 32 numerical values
+    local parts = {}
     for i = 1, 32 do
-        local value = input.getNumber(i)
-        query = query .. "num" .. i .. "=" .. value .. "&"
+        parts[i] = "num" .. i .. "=" .. input.getNumber(i)
+        parts[i + 32] = "bool" .. i .. "=" .. tostring(input.getBool(i))
+    end
+    if PAGE > 0 then
+        parts[#parts + 1] = "b=" .. PAGE
+    end
+    if PIPELINE then
+        parts[#parts + 1] = "f=" .. frame_seq
     end
-    -- Append 32 boolean values
+    if DELTA then
+        parts[#parts + 1] = "seq=" .. output_seq
+    end
+
+    async.httpGet(API_PORT, API_ENDPOINT .. "?" .. table.concat(parts, "&"))
+    is_reply_pending = false
+end
+
+-- Compact transmit: 32 numbers followed by the 32 booleans folded into one
+-- bitmask (bool1 is bit 0), sent as a single comma separated parameter.
+function transmitCompact()
+    local parts = {}
+    local mask = 0
     for i = 1, 32 do
-        local boolVal = input.getBool(i)
-        query = query .. "bool" .. i .. "=" .. tostring(boolVal) .. "&"
+        parts[i] = input.getNumber(i)
+        if input.getBool(i) then
+            mask = mask | (1 << (i - 1))
+        end
     end
-    -- Remove the trailing '&'
-    query = string.sub(query, 1, -2)
+    parts[33] = mask
 
-    async.httpGet(API_PORT, API_ENDPOINT .. query)
+    local query = "?d=" .. table.concat(parts, ",")
+    if PAGE > 0 then
+        query = query .. "&b=" .. PAGE
+    end
+    if PIPELINE then
+        query = query .. "&f=" .. frame_seq
+    end
+    if DELTA then
+        query = query .. "&s=" .. output_seq
+    end
+    async.httpGet(API_PORT, COMPACT_ENDPOINT .. query)
     is_reply_pending = false
 end
 
@@ -58,16 +138,45 @@ function httpReply(port, request_body, response_body)
     http_response_body = response_body
     http_request_body = request_body
 
+    if PIPELINE then
+        in_flight = math.max(in_flight - 1, 0)
+        ticks_since_reply = 0
+        -- skip replies older than one already applied
+        local f = tonumber(request_body:match("[?&]f=(%d+)")) or 0
+        if f <= applied_seq then
+            return
+        end
+        applied_seq = f
+    end
+
+    if COMPACT then
+        if DELTA then
+            deltaDecode(response_body)
+        else
+            compactDecode(response_body)
+        end
+        is_reply_pending = true
+        return
+    end
+
     local data = jsonDecode(response_body)
     if data then
-        -- Extract numerical values
+        -- Extract numerical values (delta replies omit unchanged channels)
         for i = 1, 32 do
-            receivedNums[i] = tonumber(data["num" .. i])
+            local val = data["num" .. i]
+            if val ~= nil then
+                receivedNums[i] = tonumber(val)
+            end
         end
         -- Extract boolean values (assuming the JSON returns "true"/"false" as strings)
         for i = 1, 32 do
             local val = data["bool" .. i]
-            receivedBools[i] = (val == "true")
+            if val ~= nil then
+                receivedBools[i] = (val == "true")
+            end
+        end
+        if data.seq then
+            output_seq = data.seq
         end
     else
         -- You can set an error message or default values if needed
@@ -77,20 +186,56 @@ function httpReply(port, request_body, response_body)
     is_reply_pending = true
 end
 
--- Custom JSON Decode Function
+-- Compact Decode Function: same layout as transmitCompact
+function compactDecode(body)
+    local i = 0
+    for v in body:gmatch("[^,]+") do
+        i = i + 1
+        if i > 32 then
+            maskDecode(v)
+            return
+        end
+        receivedNums[i] = tonumber(v) or 0
+    end
+end
+
+-- Delta Decode Function: sequence, bool mask, then index/value pairs
+function deltaDecode(body)
+    local i = 0
+    local index = nil
+    for v in body:gmatch("[^,]+") do
+        i = i + 1
+        if index then
+            receivedNums[index] = tonumber(v) or 0
+            index = nil
+        elseif i > 2 then
+            index = tonumber(v)
+        elseif i == 2 then
+            maskDecode(v)
+        else
+            output_seq = v
+        end
+    end
+end
+
+-- Mask Decode Function: expands the boolean bitmask, skipping the work
+-- when it is the same as in the previous reply
+function maskDecode(v)
+    local mask = math.tointeger(tonumber(v)) or 0
+    if mask ~= received_mask then
+        received_mask = mask
+        for b = 1, 32 do
+            receivedBools[b] = mask >> (b - 1) & 1 == 1
+        end
+    end
+end
+
+-- JSON Decode Function: the server sends flat objects without whitespace,
+-- so a single pattern picks out every key and its (possibly quoted) value
 function jsonDecode(json_string)
     local json = {}
-    local key, value
-    json_string = json_string:gsub('"%s*:', '":')
-    json_string = json_string:gsub(',%s*"', ',"')
-    json_string = json_string:gsub(':%s*"', ': "')
-    json_string = json_string:gsub(',%s*}', '}')
-    json_string = json_string:gsub('{%s*"', '{"')
-    
-    for k, v in json_string:gmatch('"(.-)":%s*(.-)[,%}]') do
-        key = k:gsub('%s*$', '')
-        value = v:gsub('^%s*', ''):gsub('%s*$', ''):gsub('^"', ''):gsub('"$', '')
-        json[key] = value
+    for k, v in json_string:gmatch('"([^"]+)":"?([^,"}]*)') do
+        json[k] = v
     end
     return json
 end
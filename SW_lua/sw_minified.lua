@@ -1 +1 @@
-API_PORT=5000;API_ENDPOINT='/'tick_interval=10;is_reply_pending=true;http_response_body=''http_request_body=''receivedNums={}receivedBools={}function onTick()tick_interval=tick_interval-1;if tick_interval<1 and is_reply_pending then tick_interval=5;transmit()end;for a=1,32 do output.setNumber(a,receivedNums[a]or 0)end;for a=1,32 do output.setNumber(a+32,receivedBools[a]and 1 or 0)end end;function transmit()local b="?"for a=1,32 do local c=input.getNumber(a)b=b.."num"..a.."="..c.."&"end;for a=1,32 do local d=input.getBool(a)b=b.."bool"..a.."="..tostring(d).."&"end;b=string.sub(b,1,-2)async.httpGet(API_PORT,API_ENDPOINT..b)is_reply_pending=false end;function httpReply(e,f,g)http_response_body=g;http_request_body=f;local h=jsonDecode(g)if h then for a=1,32 do receivedNums[a]=tonumber(h["num"..a])end;for a=1,32 do local i=h["bool"..a]receivedBools[a]=i=="true"end else http_response_body="Invalid JSON response"end;is_reply_pending=true end;function jsonDecode(j)local k={}local l,c;j=j:gsub('"%s*:','":')j=j:gsub(',%s*"',',"')j=j:gsub(':%s*"',': "')j=j:gsub(',%s*}','}')j=j:gsub('{%s*"','{"')for m,n in j:gmatch('"(.-)":%s*(.-)[,%}]')do l=m:gsub('%s*$','')c=n:gsub('^%s*',''):gsub('%s*$',''):gsub('^"',''):gsub('"$','')k[l]=c end;return k end;function onDraw()width=screen.getWidth()height=screen.getHeight()screen.drawTextBox(1,1,width,height,http_response_body,0,0)end
\ No newline at end of file
+API_PORT=5000 VEHICLE=''API_BASE=VEHICLE==''and'/'or('/'..VEHICLE..'/')API_ENDPOINT=API_BASE COMPACT=true COMPACT_ENDPOINT=API_BASE..'c'PAGE=0 SEND_INTERVAL=5 DELTA=false PIPELINE=false MAX_IN_FLIGHT=2 REPLY_TIMEOUT=60 tick_interval=10 is_reply_pending=true in_flight=0 frame_seq=0 applied_seq=0 ticks_since_reply=0 http_response_body=''http_request_body=''receivedNums={}receivedBools={}received_mask=0 output_seq=0 function onTick()tick_interval=tick_interval-1 if PIPELINE then ticks_since_reply=ticks_since_reply+1 if ticks_since_reply>REPLY_TIMEOUT then in_flight=0 ticks_since_reply=0 end if in_flight<MAX_IN_FLIGHT then in_flight=in_flight+1 frame_seq=frame_seq+1 send()end elseif tick_interval<1 and is_reply_pending then tick_interval=SEND_INTERVAL send()end for n=1,32 do output.setNumber(n,receivedNums[n]or 0)end for o=1,32 do output.setNumber(o+32,receivedBools[o]and 1 or 0)end end function send()if COMPACT then transmitCompact()else transmit()end end function transmit()local a={}for c=1,32 do a[c]="num"..c.."="..input.getNumber(c)a[c+32]="bool"..c.."="..tostring(input.getBool(c))end if PAGE>0 then a[#a+1]="b="..PAGE end if PIPELINE then a[#a+1]="f="..frame_seq end if DELTA then a[#a+1]="seq="..output_seq end async.httpGet(API_PORT,API_ENDPOINT.."?"..table.concat(a,"&"))is_reply_pending=false end function transmitCompact()local k={}local l=0 for e=1,32 do k[e]=input.getNumber(e)if input.getBool(e)then l=l|(1<<(e-1))end end k[33]=l local b="?d="..table.concat(k,",")if PAGE>0 then b=b.."&b="..PAGE end if PIPELINE then b=b.."&f="..frame_seq end if DELTA then b=b.."&s="..output_seq end async.httpGet(API_PORT,COMPACT_ENDPOINT..b)is_reply_pending=false end function httpReply(E,p,f)http_response_body=f http_request_body=p if PIPELINE then in_flight=math.max(in_flight-1,0)ticks_since_reply=0 local q=tonumber(p:match("[?&]f=(%d+)"))or 0 if q<=applied_seq then return end applied_seq=q end if COMPACT then if DELTA then deltaDecode(f)else compactDecode(f)end is_reply_pending=true return end local d=jsonDecode(f)if d then for r=1,32 do local s=d["num"..r]if s~=nil then receivedNums[r]=tonumber(s)end end for t=1,32 do local u=d["bool"..t]if u~=nil then receivedBools[t]=(u=="true")end end if d.seq then output_seq=d.seq end else http_response_body="Invalid JSON response"end is_reply_pending=true end function compactDecode(y)local g=0 for v in y:gmatch("[^,]+")do g=g+1 if g>32 then maskDecode(v)return end receivedNums[g]=tonumber(v)or 0 end end function deltaDecode(z)local h=0 local i=nil for j in z:gmatch("[^,]+")do h=h+1 if i then receivedNums[i]=tonumber(j)or 0 i=nil elseif h>2 then i=tonumber(j)elseif h==2 then maskDecode(j)else output_seq=j end end end function maskDecode(A)local m=math.tointeger(tonumber(A))or 0 if m~=received_mask then received_mask=m for w=1,32 do receivedBools[w]=m>>(w-1)&1==1 end end end function jsonDecode(B)local x={}for C,D in B:gmatch('"([^"]+)":"?([^,"}]*)')do x[C]=D end return x end function onDraw()width=screen.getWidth()height=screen.getHeight()screen.drawTextBox(1,1,width,height,http_response_body,0,0)end
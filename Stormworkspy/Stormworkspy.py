@@ -1,26 +1,142 @@
-import threading
-from flask import Flask, Request, jsonify, request
+import asyncio
+import itertools
 import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from . import codec, metrics
+from .channels import ChannelBank, Frame, VersionClock
+from .recorder import TelemetryRecorder
+from .sensors import compile_gather
+from .transport import AsyncioTransport, make_flask_app, start_transport
+
+logger = logging.getLogger(__name__)
+
+_BANKS = ('innums', 'inbools', 'outnums', 'outbools')
+# a frame number this far below the newest one means the client restarted
+FRAME_REORDER_WINDOW = 64
+# no client pipelines more requests than this (sw.lua's MAX_IN_FLIGHT is 2),
+# so a frame number this low and this far behind starts a new run
+MAX_FRAMES_IN_FLIGHT = 8
+
+
+def _resolve(future, frame):
+    if not future.done():
+        future.set_result(frame)
+
+
+class _SensorAttribute:
+    """Class attribute that serves a registered sensor.
+
+    Reading it refreshes all sensors at most once per input version, and
+    being a real class attribute it bypasses ``__getattr__``.
+    """
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        obj._refresh_sensors()
+        return obj.sensors[self.name]
+
+    def __set__(self, obj, value):
+        obj.sensors[self.name] = value
+        obj._invalidate_sensors()
+
+
+class _ChannelAttribute:
+    """Class attribute that reads and writes one named channel slot.
+
+    Installed on the instance's own class when a name is registered, so a
+    named access is a single indexed bank access instead of a lookup in
+    ``__getattr__``.
+    """
+    __slots__ = ("bank", "index")
+
+    def __init__(self, bank, index):
+        self.bank = bank
+        self.index = index
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return obj.__dict__[self.bank][self.index]
+
+    def __set__(self, obj, value):
+        obj.__dict__[self.bank][self.index] = value
 
 
 class Stormworkspy():
-    def __init__(self, name="default"):
-        # mappings for named channels
-        object.__setattr__(self, "num_out_names", {})
-        object.__setattr__(self, "num_in_names", {})
-        object.__setattr__(self, "bool_out_names", {})
-        object.__setattr__(self, "bool_in_names", {})
+    def __new__(cls, *args, **kwargs):
+        # Give every instance its own subclass so that registered sensors
+        # (and their annotations) live on a class nobody else shares.
+        base = cls.__dict__.get("_instance_base", cls)
+        instance_cls = type(base.__name__, (base,), {
+            "__module__": base.__module__,
+            "__qualname__": base.__qualname__,
+            "_instance_base": base,
+        })
+        return object.__new__(instance_cls)
+
+    def __init__(self, name="default", pages=1):
+        # mappings for named channels: name -> index per bank, plus one
+        # name -> (bank, index) table and a bitmap of used slots per bank
+        self.num_out_names = {}
+        self.num_in_names = {}
+        self.bool_out_names = {}
+        self.bool_in_names = {}
+        self._channel_names = {}
+        self._used_slots = dict.fromkeys(_BANKS, 0)
         # registered sensors
         object.__setattr__(self, "sensors", {})
+        self._invalidate_sensors()
 
         self.name = name
-        self.innums = [0.0] * 32
-        self.inbools = [False] * 32
-        self.outnums = [0.0] * 32
-        self.outbools = [False] * 32
+        # every page is one bridge's worth of channels, selected by 'b'
+        if pages < 1:
+            raise ValueError("pages must be at least 1")
+        self.pages = pages
+        self.channels = codec.CHANNELS * pages
+        # the input clock ticks on every frame and every direct input write
+        self._in_clock = VersionClock()
+        self.innums = ChannelBank([0.0] * self.channels, self._in_clock)
+        self.inbools = ChannelBank([False] * self.channels, self._in_clock)
+        self._frame_counter = itertools.count(1)
+        self._frame = Frame(self.innums, self.inbools, 0.0, 0)
+        # newest frame number 'f' applied per page from pipelining clients;
+        # the lock also serialises merging pages into a new frame
+        self._order_lock = threading.Lock()
+        self._last_frame_seq = {}
+        # frame notification: blocked threads, awaiting coroutines, callbacks
+        self._frame_cond = threading.Condition()
+        self._frame_waiters = 0
+        self._async_waiters = []
+        self._num_callbacks = {}
+        self._bool_callbacks = {}
+        # outputs remember when each slot was written so replies can be deltas
+        self._out_clock = VersionClock()
+        self.outnums = ChannelBank([0.0] * self.channels, self._out_clock)
+        self.outbools = ChannelBank([False] * self.channels, self._out_clock)
+        # the banks replies read; a batch swaps in new ones with one assignment
+        self._outputs = (self.outnums, self.outbools)
+        self._batch_depth = 0
+        # (path, page, full reply?) -> (output clock, requested seq, encoded body)
+        self._reply_cache = {}
+        # delta reply scheduling: index -> (priority, minimum interval)
+        self._num_schedule = {}
+        self._bool_schedule = {}
+        self._last_sent = {}
+        self.reply_budget = None
 
-        self.app = Flask(__name__)
-        self._setup_routes()
+        self.app = make_flask_app(self)
+        self.recorder = None
+        # request counters and timings served on /metrics; None turns them off
+        self.metrics = metrics.Metrics()
+        self.transport = None
         self.thread = None
         self.host = None
         self.port = None
@@ -34,42 +150,59 @@ class Stormworkspy():
 
     # ------------------------------------------------------------------
     # Registration helpers
-    def _register_name(self, mapping, name, index, length):
-        if name in mapping:
+    def _register_name(self, mapping, bank, name, index):
+        if name in self._channel_names or name in self.sensors:
             raise ValueError(f"{name} already registered")
+        if hasattr(self.__class__, name) or name in self.__dict__:
+            raise ValueError(f"{name} is already an attribute")
 
-        used = set(mapping.values())
+        used = self._used_slots[bank]
         if index is None:
-            for i in range(length):
-                if i not in used:
-                    index = i
-                    break
-            else:
+            # lowest clear bit of the bitmap
+            index = (~used & (used + 1)).bit_length() - 1
+            if index >= self.channels:
                 raise ValueError("No free slots available")
         else:
-            if not 0 <= index < length:
+            if not 0 <= index < self.channels:
                 raise IndexError("index out of range")
-            if index in used:
+            if used >> index & 1:
                 raise ValueError(f"Index {index} already used")
 
+        self._used_slots[bank] = used | 1 << index
         mapping[name] = index
+        self._channel_names[name] = (bank, index)
+        setattr(self.__class__, name, _ChannelAttribute(bank, index))
         return index
 
-    def set_num_output(self, name, index=None):
-        """Register a numeric output channel name."""
-        return self._register_name(self.num_out_names, name, index, 32)
+    def set_num_output(self, name, index=None, priority=0, max_rate=None):
+        """Register a numeric output channel name.
 
-    def set_bool_output(self, name, index=None):
-        """Register a boolean output channel name."""
-        return self._register_name(self.bool_out_names, name, index, 32)
+        ``priority`` and ``max_rate`` (updates per second) decide how the
+        channel competes for room in delta replies; see ``reply_budget``.
+        """
+        index = self._register_name(self.num_out_names, 'outnums', name, index)
+        self._set_schedule(self._num_schedule, index, priority, max_rate)
+        return index
+
+    def set_bool_output(self, name, index=None, priority=0, max_rate=None):
+        """Register a boolean output channel name (see :meth:`set_num_output`)."""
+        index = self._register_name(self.bool_out_names, 'outbools', name, index)
+        self._set_schedule(self._bool_schedule, index, priority, max_rate)
+        return index
+
+    def _set_schedule(self, schedule, index, priority, max_rate):
+        if max_rate is not None and max_rate <= 0:
+            raise ValueError("max_rate must be positive")
+        if priority or max_rate is not None:
+            schedule[index] = (priority, None if max_rate is None else 1.0 / max_rate)
 
     def set_num_input(self, name, index=None):
         """Register a numeric input channel name."""
-        return self._register_name(self.num_in_names, name, index, 32)
+        return self._register_name(self.num_in_names, 'innums', name, index)
 
     def set_bool_input(self, name, index=None):
         """Register a boolean input channel name."""
-        return self._register_name(self.bool_in_names, name, index, 32)
+        return self._register_name(self.bool_in_names, 'inbools', name, index)
 
     def register_sensor(self, name, sensor_cls, **channels):
         """Register a sensor and expose it as an attribute.
@@ -78,115 +211,538 @@ class Stormworkspy():
         autocompletion for the sensor's methods.
         """
 
-        if name in self.sensors:
+        if name in self.sensors or name in self._channel_names:
             raise ValueError(f"{name} already registered")
+        if hasattr(self.__class__, name) or name in self.__dict__:
+            raise ValueError(f"{name} is already an attribute")
         sensor = sensor_cls(**channels)
         self.sensors[name] = sensor
+        setattr(self.__class__, name, _SensorAttribute(name))
+        self._invalidate_sensors()
         # update type hints for IDE autocompletion
         annotations = dict(getattr(self.__class__, "__annotations__", {}))
         annotations[name] = sensor_cls
         self.__class__.__annotations__ = annotations
         return sensor
 
-    def _setup_routes(self):
-        # Define the Flask route as a closure so it has access to self.
-        @self.app.route('/', methods=['GET'])
-        def sw_controller():
-            # Update self.innums from GET parameters.
-            for i in range(1, 33):
-                param = f'num{i}'
+    def _invalidate_sensors(self):
+        object.__setattr__(self, "_sensor_gather", None)
+        object.__setattr__(self, "_sensor_version", None)
+
+    def _refresh_sensors(self):
+        """Refresh every registered sensor if the inputs changed since last time."""
+        # read the version before the channels; a frame published in between
+        # only causes one extra refresh on the next access
+        version = self._in_clock.value
+        if self._sensor_version == version:
+            return
+        gather = self._sensor_gather
+        if gather is None:
+            # one generated function copies the wired channels of all sensors
+            gather = compile_gather(list(self.sensors.values()))
+            self._sensor_gather = gather
+        gather(self.innums, self.inbools)
+        self._sensor_version = version
+
+    def handle_request(self, path, query):
+        """Serve one GET request, independent of the HTTP server in use.
+
+        Returns a ``(status, content_type, body)`` tuple.
+        """
+        started = time.perf_counter()
+        malformed = []
+        if path == '/':
+            nums, mask, args = codec.parse_query(query, malformed)
+            bools = codec.unpack_bools(mask)
+            parsed = time.perf_counter()
+            page = self._request_page(args)
+            if page is None:
+                return 400, 'text/plain', b'Bad page'
+            fresh = self._receive_frame(args.get('f'), nums, bools, page)
+            # A client sending 'seq' only gets the channels written since then.
+            body = self._encode_reply(path, page, args.get('seq'))
+            content_type = 'application/json'
+
+        elif path == '/c':
+            # Compact variant of '/': one packed parameter in, one packed body out.
+            _, _, args = codec.parse_query(query)
+            nums, bools = codec.decode_frame(args.get('d', ''), malformed=malformed)
+            parsed = time.perf_counter()
+            page = self._request_page(args)
+            if page is None:
+                return 400, 'text/plain', b'Bad page'
+            fresh = self._receive_frame(args.get('f'), nums, bools, page)
+            body = self._encode_reply(path, page, args.get('s'))
+            content_type = 'text/plain'
+
+        elif path == '/metrics' and self.metrics is not None:
+            return 200, metrics.CONTENT_TYPE, self.metrics.render().encode()
+
+        else:
+            return 404, 'text/plain', b'Not Found'
+
+        recorder = self.recorder
+        if recorder is not None and fresh and page == 0:
+            frame = self._frame
+            outnums, outbools = self._page_outputs(self._outputs, 0)
+            try:
+                recorder.append(
+                    frame.timestamp, frame.nums[:codec.CHANNELS],
+                    codec.pack_bools(frame.bools[:codec.CHANNELS]),
+                    outnums, codec.pack_bools(outbools),
+                )
+            except Exception:
+                # the frame is already applied; losing a record must not fail the reply
+                logger.exception("telemetry recording failed")
+        if self.metrics is not None:
+            self.metrics.observe_request(path, started, parsed, time.perf_counter(), malformed)
+        return 200, content_type, body
+
+    def _encode_reply(self, path, page, seq):
+        """Encoded reply body for ``path``, or a delta if ``seq`` is given.
+
+        The last full and the last delta body per path and page are served
+        again until an output is written, so steady polling does no
+        encoding at all. Scheduled delta replies depend on the time and are
+        neither stored nor looked up.
+        """
+        # read the clock before the banks so a racing write is re-sent
+        current = self._out_clock.value
+        key = (path, page, seq is None)
+        cacheable = seq is None or (
+            self.reply_budget is None and not self._num_schedule and not self._bool_schedule)
+        cached = self._reply_cache.get(key) if cacheable else None
+        if cached is not None and cached[0] == current and cached[1] == seq:
+            if self.metrics is not None:
+                self.metrics.reply_cache.inc('hit')
+            return cached[2]
+
+        outputs = self._outputs
+        outnums, outbools = self._page_outputs(outputs, page)
+        if path == '/':
+            if seq is None:
+                body = codec.encode_json(outnums, outbools)
+            else:
+                seq_out, num_idx, bool_idx = self._output_delta(seq, current, outputs, page)
+                body = codec.encode_json_delta(seq_out, outnums, outbools, num_idx, bool_idx)
+        elif seq is None:
+            body = codec.encode_frame(outnums, outbools)
+        else:
+            # the bitmask always carries every boolean
+            seq_out, num_idx, _ = self._output_delta(seq, current, outputs, page, bools=False)
+            body = codec.encode_delta(seq_out, outnums, outbools, num_idx)
+        body = body.encode()
+        if cacheable:
+            self._reply_cache[key] = (current, seq, body)
+        if self.metrics is not None:
+            self.metrics.reply_cache.inc('miss')
+        return body
+
+    def _request_page(self, args):
+        """Zero-based page addressed by the ``b`` parameter, or ``None`` if invalid."""
+        page = args.get('b')
+        if page is None:
+            return 0
+        try:
+            page = int(page)
+        except ValueError:
+            return None
+        return page if 0 <= page < self.pages else None
+
+    def _page_outputs(self, outputs, page):
+        outnums, outbools = outputs
+        if self.pages == 1:
+            return outnums, outbools
+        start = page * codec.CHANNELS
+        stop = start + codec.CHANNELS
+        return outnums[start:stop], outbools[start:stop]
+
+    def _receive_frame(self, frame_seq, nums, bools, page=0):
+        """Publish the inputs of a request unless they arrived out of order.
+
+        A pipelining client numbers its requests with ``f``. Frames numbered
+        at or below the newest one applied for the same page are dropped,
+        except when the game script restarted: a jump far backwards, or a
+        number back at the start of a run that no in-flight request could
+        carry. Inputs of one page replace that page's slice of the
+        channel banks. Returns whether the inputs were published.
+        """
+        if frame_seq is not None:
+            try:
+                frame_seq = int(frame_seq)
+            except ValueError:
+                frame_seq = None
+        if frame_seq is None and self.pages == 1:
+            self._publish_inputs(nums, bools)
+            return True
+        # requests in flight together must not overtake or overwrite each other
+        with self._order_lock:
+            if frame_seq is not None:
+                last = self._last_frame_seq.get(page)
+                restarted = (frame_seq <= MAX_FRAMES_IN_FLIGHT
+                             and last is not None and last - frame_seq >= MAX_FRAMES_IN_FLIGHT)
+                if (last is not None and not restarted
+                        and last - FRAME_REORDER_WINDOW < frame_seq <= last):
+                    if self.metrics is not None:
+                        self.metrics.stale_frames.inc()
+                    return False
+                self._last_frame_seq[page] = frame_seq
+            if self.pages > 1:
+                start = page * codec.CHANNELS
+                stop = start + codec.CHANNELS
+                merged_nums = list(self.innums)
+                merged_bools = list(self.inbools)
+                merged_nums[start:stop] = nums
+                merged_bools[start:stop] = bools
+                nums, bools = merged_nums, merged_bools
+            self._publish_inputs(nums, bools)
+        return True
+
+    def _publish_inputs(self, nums, bools):
+        # Every request parses into fresh lists that are swapped in by
+        # reference, so a reader holding the previous frame never sees it
+        # change underneath and the request thread takes no lock.
+        nums = ChannelBank(nums, self._in_clock)
+        bools = ChannelBank(bools, self._in_clock)
+        frame = Frame(nums, bools, time.time(), next(self._frame_counter))
+        previous = self._frame
+        object.__setattr__(self, 'innums', nums)
+        object.__setattr__(self, 'inbools', bools)
+        self._frame = frame
+        # tick after the swap so sensors never cache the old frame as current
+        self._in_clock.tick()
+        self._notify_frame(previous, frame)
+
+    def _notify_frame(self, previous, frame):
+        # Waiters register before checking the counter, so skipping the
+        # notification when nobody is registered cannot lose a wake-up.
+        if self._frame_waiters:
+            with self._frame_cond:
+                self._frame_cond.notify_all()
+        if self._async_waiters:
+            waiters, self._async_waiters = self._async_waiters, []
+            for loop, future in waiters:
                 try:
-                    self.innums[i - 1] = float(request.args.get(param, 0.0))
-                except ValueError:
-                    self.innums[i - 1] = 0.0
-            
-            # Update self.inbools from GET parameters.
-            for i in range(1, 33):
-                param = f'bool{i}'
-                bool_str = request.args.get(param, "false").lower()
-                self.inbools[i - 1] = bool_str in ["true", "1", "yes"]
-            
-            # Build the JSON response using self.outnums and self.outbools.
-            response_data = {}
-            for i in range(1, 33):
-                response_data[f'num{i}'] = self.outnums[i - 1]
-                response_data[f'bool{i}'] = str(self.outbools[i - 1]).lower()
-            
-            return jsonify(response_data)
-
-        @self.app.route('/shutdown', methods=['POST'])
-        def shutdown():
-            func = request.environ.get('werkzeug.server.shutdown')
-            if func:
-                func()
-            return 'Server shutting down...'
-        
-
-    def run_api(self, host='localhost', port=5000, debug=False):
-        def run():
-            self.app.run(host=host, port=port, debug=debug)
-
-        # Start the Flask app in a daemon thread so it runs in the background.
+                    loop.call_soon_threadsafe(_resolve, future, frame)
+                except RuntimeError:
+                    # the waiter's event loop is closed; nobody is listening
+                    pass
+        if self._num_callbacks or self._bool_callbacks:
+            self._fire_callbacks(previous, frame)
+
+    def _fire_callbacks(self, previous, frame):
+        for values, old_values, callbacks in (
+            (frame.nums, previous.nums, self._num_callbacks),
+            (frame.bools, previous.bools, self._bool_callbacks),
+        ):
+            for index, funcs in list(callbacks.items()):
+                old, new = old_values[index], values[index]
+                if old == new:
+                    continue
+                for func in funcs:
+                    try:
+                        func(old, new)
+                    except Exception:
+                        logger.exception("input change callback failed")
+
+    def snapshot(self):
+        """Return the latest input :class:`~Stormworkspy.channels.Frame`.
+
+        Unlike reading ``innums`` and ``inbools`` one after the other, the
+        numeric and boolean channels of a snapshot always belong to the
+        same request.
+        """
+        return self._frame
+
+    def to_numpy(self):
+        """Return ``(innums, inbools, outnums, outbools)`` as NumPy arrays.
+
+        The inputs come from one :meth:`snapshot` and the outputs from the
+        banks replies read, so each pair is consistent. The arrays are
+        copies; write outputs back with ``sw.outnums[:] = array.tolist()``.
+        """
+        import numpy as np
+
+        frame = self._frame
+        outnums, outbools = self._outputs
+        return (np.array(frame.nums, dtype=np.float64), np.array(frame.bools, dtype=bool),
+                np.array(outnums, dtype=np.float64), np.array(outbools, dtype=bool))
+
+    def wait_for_frame(self, timeout=None, after=None):
+        """Block until a new input frame arrives and return it.
+
+        ``after`` is the counter of the last frame already seen (defaults to
+        the current one). Returns ``None`` if ``timeout`` seconds pass first.
+        """
+        if after is None:
+            after = self._frame.counter
+        with self._frame_cond:
+            self._frame_waiters += 1
+            try:
+                self._frame_cond.wait_for(lambda: self._frame.counter > after, timeout)
+            finally:
+                self._frame_waiters -= 1
+        frame = self._frame
+        return frame if frame.counter > after else None
+
+    async def _next_frame_async(self, after):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiter = (loop, future)
+        self._async_waiters.append(waiter)
+        try:
+            frame = self._frame
+            if frame.counter > after:
+                return frame
+            return await future
+        finally:
+            # a timed out or cancelled waiter must not stay registered
+            try:
+                self._async_waiters.remove(waiter)
+            except ValueError:
+                pass
+
+    async def next_frame(self, timeout=None, after=None):
+        """Wait for a new input frame without blocking the event loop.
+
+        The coroutine counterpart of :meth:`wait_for_frame`: returns the
+        frame, or ``None`` if ``timeout`` seconds pass first.
+        """
+        if after is None:
+            after = self._frame.counter
+        try:
+            return await asyncio.wait_for(self._next_frame_async(after), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def read_sensor(self, name, fresh=False):
+        """Return the registered sensor ``name`` refreshed from the inputs.
+
+        With ``fresh`` the read first waits for the next input frame, so
+        the values are newer than anything seen before the call.
+        """
+        if name not in self.sensors:
+            raise KeyError(f"{name} is not a registered sensor")
+        if fresh:
+            await self._next_frame_async(self._frame.counter)
+        return getattr(self, name)
+
+    async def frames(self):
+        """Asynchronously iterate over incoming input frames.
+
+        ``async for frame in sw.frames(): ...`` yields each new frame as it
+        arrives; a consumer slower than the game skips to the latest frame.
+        """
+        counter = self._frame.counter
+        while True:
+            frame = await self._next_frame_async(counter)
+            counter = frame.counter
+            yield frame
+
+    def _input_index(self, channel, names):
+        if isinstance(channel, str):
+            if channel not in names:
+                raise KeyError(f"{channel} is not a registered input")
+            return names[channel]
+        if not 0 <= channel < self.channels:
+            raise IndexError("index out of range")
+        return channel
+
+    def on_num_input_change(self, channel, callback):
+        """Call ``callback(old, new)`` when a numeric input changes.
+
+        ``channel`` is a zero-based index or a name registered with
+        :meth:`set_num_input`. Callbacks run on the server thread right
+        after the request is applied.
+        """
+        index = self._input_index(channel, self.num_in_names)
+        self._num_callbacks.setdefault(index, []).append(callback)
+
+    def on_bool_input_change(self, channel, callback):
+        """Call ``callback(old, new)`` when a boolean input changes."""
+        index = self._input_index(channel, self.bool_in_names)
+        self._bool_callbacks.setdefault(index, []).append(callback)
+
+    def _output_delta(self, seq, current, outputs, page=0, bools=True):
+        """Return the reply sequence and the channels changed since ``seq``.
+
+        ``current`` is the output clock read before taking the published
+        ``outputs``. Indices are relative to ``page``. Unknown, malformed or
+        stale sequence numbers get a full snapshot. Pass ``bools=False``
+        when the reply carries all booleans anyway.
+        """
+        try:
+            seq = int(seq)
+        except (TypeError, ValueError):
+            seq = None
+        if not self._out_clock.is_current(seq):
+            return current, range(codec.CHANNELS), range(codec.CHANNELS)
+        start = page * codec.CHANNELS
+        stop = start + codec.CHANNELS
+        outnums, outbools = outputs
+        num_idx = outnums.changed_since(seq, start, stop)
+        bool_idx = outbools.changed_since(seq, start, stop) if bools else []
+        if self.reply_budget is None and not self._num_schedule and not self._bool_schedule:
+            return current, num_idx, bool_idx
+        return self._schedule_outputs(current, outputs, start, num_idx, bool_idx)
+
+    def _schedule_outputs(self, current, outputs, start, num_idx, bool_idx):
+        """Pick the changed channels a delta reply carries.
+
+        Rate limited channels wait for their interval, then the highest
+        priority (and among equals the longest waiting) channels fill
+        ``reply_budget``. The returned sequence is rolled back to just
+        before the oldest change left out, so the client asks for it again.
+        """
+        now = time.monotonic()
+        last_sent = self._last_sent
+        candidates = []
+        seq = current
+        for kind, indices, bank, schedule in (
+            ('num', num_idx, outputs[0], self._num_schedule),
+            ('bool', bool_idx, outputs[1], self._bool_schedule),
+        ):
+            versions = bank.versions
+            for i in indices:
+                version = versions[start + i]
+                priority, interval = schedule.get(start + i, (0, None))
+                key = (kind, start + i)
+                if interval is not None and now - last_sent.get(key, -interval) < interval:
+                    seq = min(seq, version - 1)
+                    continue
+                candidates.append((-priority, version, kind, i, interval))
+        candidates.sort()
+        budget = self.reply_budget
+        if budget is not None and len(candidates) > budget:
+            for _, version, _, _, _ in candidates[budget:]:
+                seq = min(seq, version - 1)
+            del candidates[budget:]
+        num_sent = []
+        bool_sent = []
+        for _, _, kind, i, interval in candidates:
+            (num_sent if kind == 'num' else bool_sent).append(i)
+            if interval is not None:
+                last_sent[kind, start + i] = now
+        num_sent.sort()
+        bool_sent.sort()
+        return seq, num_sent, bool_sent
+
+    @contextmanager
+    def batch(self):
+        """Stage output writes and publish them to replies all at once.
+
+        Inside the block every output write (named, indexed or a whole
+        bank) goes to a private copy of ``outnums``/``outbools``; leaving
+        it swaps the copies in, so a reply carries all of the writes or
+        none. An exception discards them and nested blocks join the
+        outer one. A batch replaces the bank objects, so do not keep
+        references to them across it, and write from one thread.
+        """
+        if self._batch_depth:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+            return
+        published = self._outputs
+        since = self._out_clock.value
+        banks = self.__dict__
+        banks['outnums'], banks['outbools'] = published[0].copy(), published[1].copy()
+        self._batch_depth = 1
+        try:
+            yield self
+        except BaseException:
+            banks['outnums'], banks['outbools'] = published
+            raise
+        else:
+            self._commit_outputs(since)
+        finally:
+            self._batch_depth = 0
+
+    def _commit_outputs(self, since):
+        # Stamp everything staged since 'since' with one version that the
+        # clock only reaches after the swap: a reply that reads the clock
+        # first either sees the new banks or asks for the changes again.
+        outnums, outbools = self.__dict__['outnums'], self.__dict__['outbools']
+        version = self._out_clock.value + 1
+        for bank in (outnums, outbools):
+            versions = bank.versions
+            for i, stamp in enumerate(versions):
+                if stamp > since:
+                    versions[i] = version
+        self._outputs = (outnums, outbools)
+        self._out_clock.tick()
+
+    def write_outputs(self, values):
+        """Write ``{name: value}`` to registered outputs as one batch."""
+        with self.batch():
+            for name, value in values.items():
+                bank, index = self._channel_names.get(name, (None, None))
+                if bank not in ('outnums', 'outbools'):
+                    raise KeyError(f"{name} is not a registered output")
+                self.__dict__[bank][index] = value
+
+    def start_recording(self, path, capacity=216000):
+        """Append every exchange to a memory-mapped telemetry ring file.
+
+        ``capacity`` is the number of records kept; the default holds one
+        hour at 60 requests per second. With several pages only the
+        exchanges of page 0 are recorded. Returns the
+        :class:`~Stormworkspy.recorder.TelemetryRecorder`, which can also
+        read the data back.
+        """
+        self.stop_recording()
+        self.recorder = TelemetryRecorder(path, capacity)
+        return self.recorder
+
+    def stop_recording(self):
+        recorder, self.recorder = self.recorder, None
+        if recorder is not None:
+            recorder.close()
+
+    def run_api(self, host='localhost', port=5000, debug=False, backend='flask'):
+        """Start serving the API in the background.
+
+        ``backend`` selects the HTTP server: ``'flask'`` (default),
+        ``'http'`` for the lean keep-alive ``http.server`` handler or
+        ``'asyncio'``.
+        """
+        self.transport = start_transport(self, host, port, debug, backend)
+        self.host = host
+        self.port = port
+        self.thread = self.transport.thread
+        print(f"{backend} API started on {host}:{port} in the background.")
+
+    async def start(self, host='localhost', port=5000):
+        """Serve the API from the running event loop, without a thread.
+
+        Many instances (or a hub) can share one loop with their controller
+        coroutines; stop with :meth:`stop`.
+        """
+        self.transport = AsyncioTransport(self, host, port)
+        await self.transport.serve()
         self.host = host
         self.port = port
-        self.thread = threading.Thread(target=run)
-        self.thread.daemon = True
-        self.thread.start()
-        print(f"Flask API started on {host}:{port} in the background.")
+
+    async def stop(self):
+        """Stop a server started with :meth:`start`."""
+        transport, self.transport = self.transport, None
+        if transport is not None:
+            await transport.close()
 
     def stop_api(self):
         if not self.thread:
             return
 
-        # Trigger Flask shutdown via the dedicated route
-        try:
-            import urllib.request
-            req = urllib.request.Request(
-                f'http://{self.host}:{self.port}/shutdown',
-                method='POST'
-            )
-            urllib.request.urlopen(req)
-        except Exception:
-            pass
-
-        self.thread.join()
+        self.transport.stop()
+        self.thread = None
 
     # ------------------------------------------------------------------
-    # Attribute access for named channels
-    def __getattr__(self, name):
-        if name in self.sensors:
-            sensor = self.sensors[name]
-            sensor.update(self.innums, self.inbools)
-            return sensor
-        if name in self.num_out_names:
-            return self.outnums[self.num_out_names[name]]
-        if name in self.bool_out_names:
-            return self.outbools[self.bool_out_names[name]]
-        if name in self.num_in_names:
-            return self.innums[self.num_in_names[name]]
-        if name in self.bool_in_names:
-            return self.inbools[self.bool_in_names[name]]
-        raise AttributeError(name)
-
+    # Attribute access; named channels and sensors are class attributes
     def __setattr__(self, name, value):
-        mappings_ready = 'num_out_names' in self.__dict__
-        if mappings_ready:
-            if name in self.sensors:
-                self.sensors[name] = value
-                object.__setattr__(self, name, value)
-                return
-
-            if name in self.num_out_names:
-                self.outnums[self.num_out_names[name]] = value
-                return
-            if name in self.bool_out_names:
-                self.outbools[self.bool_out_names[name]] = value
-                return
-            if name in self.num_in_names:
-                self.innums[self.num_in_names[name]] = value
-                return
-            if name in self.bool_in_names:
-                self.inbools[self.bool_in_names[name]] = value
-                return
-
+        if name in _BANKS and name in self.__dict__:
+            # keep the tracked bank and copy the new values into it
+            self.__dict__[name][:] = value
+            return
         object.__setattr__(self, name, value)
@@ -1,3 +1,4 @@
 from .Stormworkspy import Stormworkspy
+from .hub import StormworkspyHub
 
 __version__ = '0.1.0'
@@ -0,0 +1,99 @@
+"""Channel storage with per-slot write tracking."""
+
+import itertools
+import time
+from collections import namedtuple
+
+Frame = namedtuple('Frame', 'nums bools timestamp counter')
+Frame.__doc__ = """One input frame received from the game.
+
+``nums`` and ``bools`` are the channel lists as of that request (all
+pages, when the instance has several), ``timestamp``
+is the receive time (``time.time()``) and ``counter`` numbers the frames
+from 1.  The server never modifies a published frame.
+"""
+
+
+class VersionClock:
+    """Monotonic sequence shared by the channel banks it orders.
+
+    The clock starts at the current time in microseconds, so a sequence
+    number handed out by an earlier run is always older than ``base`` and
+    can be recognised as stale.
+    """
+    __slots__ = ("base", "value", "_counter")
+
+    def __init__(self):
+        self.base = time.time_ns() // 1000
+        self.value = self.base
+        self._counter = itertools.count(self.base + 1)
+
+    def tick(self) -> int:
+        self.value = next(self._counter)
+        return self.value
+
+    def is_current(self, seq) -> bool:
+        """True if ``seq`` was issued by this clock and can be diffed against."""
+        return seq is not None and self.base <= seq <= self.value
+
+
+class ChannelBank(list):
+    """Fixed size list of channel values that records when each slot changed.
+
+    Every write that changes a slot stamps it with a fresh ``clock`` value,
+    so readers can ask which channels changed after a given sequence
+    number. Writing the value a slot already holds is not a change, so
+    control loops that re-assert their outputs every tick keep delta
+    replies empty.
+    """
+    __slots__ = ("clock", "versions")
+
+    def __init__(self, values, clock: VersionClock):
+        super().__init__(values)
+        self.clock = clock
+        self.versions = [clock.value] * len(self)
+
+    def __setitem__(self, index, value):
+        get = list.__getitem__
+        if isinstance(index, slice):
+            indices = range(*index.indices(len(self)))
+            value = list(value)
+            if len(value) != len(indices):
+                raise ValueError("channel banks have a fixed size")
+            changed = [i for i, new in zip(indices, value) if get(self, i) != new]
+            list.__setitem__(self, index, value)
+            if changed:
+                version = self.clock.tick()
+                for i in changed:
+                    self.versions[i] = version
+        elif get(self, index) != value:
+            list.__setitem__(self, index, value)
+            self.versions[index] = self.clock.tick()
+
+    def _fixed_size(self, *args, **kwargs):
+        raise TypeError("channel banks have a fixed size")
+
+    append = extend = insert = pop = remove = clear = _fixed_size
+    __delitem__ = __iadd__ = __imul__ = _fixed_size
+
+    def sort(self, *, key=None, reverse=False):
+        list.sort(self, key=key, reverse=reverse)
+        self.versions[:] = [self.clock.tick()] * len(self)
+
+    def reverse(self):
+        list.reverse(self)
+        self.versions[:] = [self.clock.tick()] * len(self)
+
+    def copy(self) -> 'ChannelBank':
+        """Return an independent bank with the same values and versions."""
+        bank = ChannelBank(self, self.clock)
+        bank.versions = list(self.versions)
+        return bank
+
+    def changed_since(self, seq: int, start: int = 0, stop: int | None = None) -> list[int]:
+        """Indices of the slots in ``[start, stop)`` written after ``seq``.
+
+        The indices are relative to ``start``.
+        """
+        versions = self.versions if start == 0 and stop is None else self.versions[start:stop]
+        return [i for i, version in enumerate(versions) if version > seq]
@@ -0,0 +1,192 @@
+"""Wire formats for the ``/`` and ``/c`` endpoints.
+
+The ``/`` endpoint takes ``num1``..``num32`` and ``bool1``..``bool32`` query
+parameters and answers with a JSON object holding the same 64 keys.
+
+A compact frame (``/c``) is a single comma separated list: the 32 numeric
+channels in order followed by the 32 boolean channels folded into one
+bitmask integer (bit 0 is ``bool1``).  Requests carry the frame in the ``d``
+query parameter and responses return it as a plain text body, e.g.::
+
+    GET /c?d=1.5,0,0,...,0,5      ->      0,0,...,0,1
+
+When the request also carries the client's last output sequence number in
+``s`` the reply is a delta frame instead: the current sequence number, the
+boolean bitmask and then ``index,value`` pairs (1-based) for the numeric
+channels written since that sequence::
+
+    GET /c?d=...&s=1700000000000042      ->      1700000000000045,1,3,0.5
+
+The game has no null, so an unset (``None``) numeric output is sent as
+``0`` in compact frames; ``decode_frame`` and the Lua script both read it
+as 0.
+"""
+
+from urllib.parse import unquote
+
+CHANNELS = 32
+
+# precomputed lookup tables so the hot path never formats key names
+_NUM_KEYS = {f'num{i + 1}': i for i in range(CHANNELS)}
+_BOOL_KEYS = {f'bool{i + 1}': 1 << i for i in range(CHANNELS)}
+NUM_NAMES = tuple(f'num{i + 1}' for i in range(CHANNELS))
+BOOL_NAMES = tuple(f'bool{i + 1}' for i in range(CHANNELS))
+_TRUE = frozenset(("true", "1", "yes"))
+_ZEROS = [0.0] * CHANNELS
+_BYTE_BITS = [tuple(bool(b >> i & 1) for i in range(8)) for b in range(256)]
+_JSON_TEMPLATE = "{%s}" % ",".join(
+    [f'"num{i + 1}":%s' for i in range(CHANNELS)]
+    + [f'"bool{i + 1}":"%s"' for i in range(CHANNELS)]
+)
+_JSON_BOOLS = ("false", "true")
+
+
+def pack_bools(bools) -> int:
+    """Fold a sequence of booleans into a bitmask (first value is bit 0)."""
+    mask = 0
+    for i, value in enumerate(bools):
+        if value:
+            mask |= 1 << i
+    return mask
+
+
+def unpack_bools(mask: int, length: int = CHANNELS) -> list[bool]:
+    """Expand a bitmask into ``length`` booleans."""
+    bools = []
+    for shift in range(0, length, 8):
+        bools += _BYTE_BITS[mask >> shift & 255]
+    del bools[length:]
+    return bools
+
+
+def parse_query(query: str, malformed: list | None = None) -> tuple[list[float], int, dict]:
+    """Parse a raw ``/`` query string in a single pass.
+
+    Returns the numeric channels, the boolean channels as a bitmask and a
+    dict of any other parameters.  Missing or malformed numbers read as
+    ``0.0`` and a repeated key keeps its first value.  ``+`` is kept
+    literally so exponents such as ``1e+20`` survive.  The key of every
+    malformed number is appended to ``malformed`` if a list is given.
+    """
+    nums = _ZEROS[:]
+    mask = 0
+    args = {}
+    num_keys = _NUM_KEYS
+    bool_keys = _BOOL_KEYS
+    # walk backwards so the first occurrence of a key is applied last
+    for pair in reversed(query.split('&')):
+        key, _, value = pair.partition('=')
+        if '%' in value:
+            value = unquote(value)
+        index = num_keys.get(key)
+        if index is not None:
+            try:
+                nums[index] = float(value)
+            except ValueError:
+                nums[index] = 0.0
+                if malformed is not None:
+                    malformed.append(key)
+            continue
+        bit = bool_keys.get(key)
+        if bit is not None:
+            if value.lower() in _TRUE:
+                mask |= bit
+            else:
+                mask &= ~bit
+            continue
+        if key:
+            args[unquote(key)] = value
+    return nums, mask, args
+
+
+def encode_query(nums, bools) -> str:
+    """Encode input channels as the ``/`` query string the Lua bridge sends."""
+    return "&".join(
+        [f"{key}={float(value)!r}" for key, value in zip(NUM_NAMES, nums)]
+        + [f"{key}={_JSON_BOOLS[bool(value)]}" for key, value in zip(BOOL_NAMES, bools)]
+    )
+
+
+def _json_number(value) -> str:
+    # the one coercion for numeric outputs in JSON replies; an unset (None)
+    # output is sent as null, like the Flask reply always did
+    return 'null' if value is None else repr(float(value))
+
+
+def encode_json(nums, bools) -> str:
+    """Encode all 64 output channels as the ``/`` JSON object."""
+    return _JSON_TEMPLATE % (
+        *map(_json_number, nums),
+        *[_JSON_BOOLS[bool(b)] for b in bools],
+    )
+
+
+def encode_json_delta(seq: int, nums, bools, num_indices, bool_indices) -> str:
+    """Encode the given output channels and ``seq`` as a JSON object."""
+    parts = [f'"seq":{int(seq)}']
+    parts += [f'"{NUM_NAMES[i]}":{_json_number(nums[i])}' for i in num_indices]
+    parts += [f'"{BOOL_NAMES[i]}":"{_JSON_BOOLS[bool(bools[i])]}"' for i in bool_indices]
+    return '{%s}' % ','.join(parts)
+
+
+def _compact_number(value) -> str:
+    # the one coercion for numeric outputs in compact frames (see above)
+    return '0' if value is None else repr(float(value))
+
+
+def encode_frame(nums, bools) -> str:
+    """Encode numeric and boolean channels as a compact frame."""
+    try:
+        parts = list(map(repr, map(float, nums)))
+    except TypeError:
+        parts = list(map(_compact_number, nums))
+    parts.append(str(pack_bools(bools)))
+    return ",".join(parts)
+
+
+def decode_frame(data: str, length: int = CHANNELS,
+                 malformed: list | None = None) -> tuple[list[float], list[bool]]:
+    """Decode a compact frame into numeric and boolean channel lists.
+
+    Missing or malformed values decode as ``0.0``/``False``, matching the
+    behaviour of the JSON query string endpoint; the position of each
+    malformed value is appended to ``malformed`` if a list is given.
+    """
+    parts = data.split(",") if data else []
+    nums = [0.0] * length
+    for i, value in enumerate(parts[:length]):
+        try:
+            nums[i] = float(value)
+        except ValueError:
+            nums[i] = 0.0
+            if malformed is not None:
+                malformed.append(i)
+
+    mask = 0
+    if len(parts) > length:
+        try:
+            mask = int(parts[length])
+        except ValueError:
+            mask = 0
+            if malformed is not None:
+                malformed.append(length)
+    return nums, unpack_bools(mask, length)
+
+
+def encode_delta(seq: int, nums, bools, indices) -> str:
+    """Encode a delta frame carrying the numeric channels in ``indices``."""
+    parts = [str(seq), str(pack_bools(bools))]
+    for i in indices:
+        parts.append(str(i + 1))
+        parts.append(_compact_number(nums[i]))
+    return ",".join(parts)
+
+
+def apply_delta(data: str, nums: list, bools: list) -> int:
+    """Apply a delta frame to ``nums``/``bools`` in place and return its sequence."""
+    parts = data.split(",")
+    seq = int(parts[0])
+    bools[:] = unpack_bools(int(parts[1]), len(bools))
+    for i in range(2, len(parts) - 1, 2):
+        nums[int(parts[i]) - 1] = float(parts[i + 1])
+    return seq
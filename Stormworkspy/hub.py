@@ -0,0 +1,101 @@
+"""Serve many :class:`~Stormworkspy.Stormworkspy` instances from one listener."""
+
+from urllib.parse import unquote
+
+from . import metrics
+from .Stormworkspy import Stormworkspy
+from .transport import AsyncioTransport, make_flask_app, start_transport
+
+
+class StormworkspyHub:
+    """Route requests for many vehicles to their ``Stormworkspy`` instances.
+
+    Each instance is registered under its ``name``. A request reaches it
+    either through a leading path segment (``/truck/`` and ``/truck/c``) or
+    through a ``vehicle`` query parameter (``/?vehicle=truck&num1=...``).
+    One HTTP server and one thread serve the whole fleet.
+    """
+
+    def __init__(self):
+        self.vehicles = {}
+        self.app = make_flask_app(self)
+        self.app.logger.disabled = True
+        self.transport = None
+        self.thread = None
+        self.host = None
+        self.port = None
+
+    def add(self, sw):
+        """Register an existing instance under its ``name`` and return it."""
+        if sw.name in self.vehicles:
+            raise ValueError(f"{sw.name} already registered")
+        if not sw.name or "/" in sw.name:
+            raise ValueError(f"{sw.name!r} is not a valid vehicle name")
+        self.vehicles[sw.name] = sw
+        return sw
+
+    def create(self, name):
+        """Create, register and return a new instance called ``name``."""
+        return self.add(Stormworkspy(name))
+
+    def remove(self, name):
+        return self.vehicles.pop(name)
+
+    def __getitem__(self, name):
+        return self.vehicles[name]
+
+    def __contains__(self, name):
+        return name in self.vehicles
+
+    def handle_request(self, path, query):
+        """Dispatch a GET request to the vehicle it addresses."""
+        _, _, rest = path.partition('/')
+        name, _, sub_path = rest.partition('/')
+        sw = self.vehicles.get(name)
+        if sw is not None:
+            return sw.handle_request('/' + sub_path, query)
+
+        if 'vehicle=' in query:
+            for pair in query.split('&'):
+                if pair.startswith('vehicle='):
+                    sw = self.vehicles.get(unquote(pair[8:]))
+                    break
+            if sw is not None:
+                return sw.handle_request(path, query)
+        if path == '/metrics':
+            return 200, metrics.CONTENT_TYPE, self.render_metrics().encode()
+        return 404, 'text/plain', b'Unknown vehicle'
+
+    def render_metrics(self) -> str:
+        """Metrics of every vehicle, labelled with its name, in Prometheus format."""
+        return metrics.render(
+            ({'vehicle': name}, sw.metrics)
+            for name, sw in self.vehicles.items() if sw.metrics is not None
+        )
+
+    def run_api(self, host='localhost', port=5000, debug=False, backend='flask'):
+        """Serve all registered vehicles in the background (see ``Stormworkspy.run_api``)."""
+        self.transport = start_transport(self, host, port, debug, backend)
+        self.host = host
+        self.port = port
+        self.thread = self.transport.thread
+        print(f"{backend} hub started on {host}:{port} in the background.")
+
+    async def start(self, host='localhost', port=5000):
+        """Serve all vehicles from the running event loop (see ``Stormworkspy.start``)."""
+        self.transport = AsyncioTransport(self, host, port)
+        await self.transport.serve()
+        self.host = host
+        self.port = port
+
+    async def stop(self):
+        transport, self.transport = self.transport, None
+        if transport is not None:
+            await transport.close()
+
+    def stop_api(self):
+        if not self.thread:
+            return
+
+        self.transport.stop()
+        self.thread = None
@@ -0,0 +1,177 @@
+"""Request metrics in the Prometheus text exposition format.
+
+Counters and histograms are plain Python objects updated from the request
+thread without locks; each update is a few attribute increments, cheap
+enough to leave on in production.  ``Stormworkspy.metrics`` collects them
+per instance and ``GET /metrics`` returns them as text.
+"""
+
+from bisect import bisect_left
+
+CONTENT_TYPE = 'text/plain; version=0.0.4'
+
+#: Bucket bounds in seconds for parse and handler durations.
+DURATION_BUCKETS = (1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 1e-2, 0.1)
+#: Bucket bounds in seconds for the gap between two frames.
+INTERVAL_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(labels):
+    if not labels:
+        return ''
+    return '{%s}' % ','.join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+
+
+class Counter:
+    """Monotonic count, optionally split by one label."""
+    kind = 'counter'
+
+    def __init__(self, name, help, label=None):
+        self.name = name
+        self.help = help
+        self.label = label
+        self.values = {}
+
+    def inc(self, label_value=None, amount=1):
+        values = self.values
+        values[label_value] = values.get(label_value, 0) + amount
+
+    @property
+    def value(self):
+        """Total over all label values."""
+        return sum(self.values.values())
+
+    def snapshot(self):
+        if self.label is None:
+            return self.values.get(None, 0)
+        return dict(self.values)
+
+    def samples(self, labels):
+        if not self.values and self.label is None:
+            yield self.name, labels, 0
+        # request threads may add a label value while /metrics is rendered
+        for label_value, value in list(self.values.items()):
+            if self.label is None:
+                yield self.name, labels, value
+            else:
+                yield self.name, {**labels, self.label: label_value}, value
+
+
+class Histogram:
+    """Distribution of observed values over fixed buckets."""
+    kind = 'histogram'
+
+    def __init__(self, name, help, buckets):
+        self.name = name
+        self.help = help
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q) -> float:
+        """Estimate quantile ``q`` (0-1) by interpolating within its bucket."""
+        if not self.count:
+            return float('nan')
+        rank = q * self.count
+        seen = 0
+        lower = 0.0
+        for bound, count in zip(self.buckets, self.counts):
+            if count and seen + count >= rank:
+                return lower + (bound - lower) * (rank - seen) / count
+            seen += count
+            lower = bound
+        return self.buckets[-1]
+
+    def snapshot(self):
+        return {
+            'buckets': dict(zip((*self.buckets, float('inf')), self.counts)),
+            'sum': self.sum,
+            'count': self.count,
+        }
+
+    def samples(self, labels):
+        cumulative = 0
+        for bound, count in zip((*self.buckets, '+Inf'), self.counts):
+            cumulative += count
+            yield self.name + '_bucket', {**labels, 'le': bound}, cumulative
+        yield self.name + '_sum', labels, self.sum
+        yield self.name + '_count', labels, self.count
+
+
+class Metrics:
+    """Counters and histograms describing the requests one instance served."""
+
+    def __init__(self):
+        self.requests = Counter(
+            'stormworkspy_requests_total', 'Requests served per endpoint.', 'endpoint')
+        self.malformed_values = Counter(
+            'stormworkspy_malformed_values_total',
+            'Numeric input values that failed to parse and were read as 0.')
+        self.stale_frames = Counter(
+            'stormworkspy_stale_frames_total',
+            'Pipelined frames dropped because a newer frame was already applied.')
+        self.reply_cache = Counter(
+            'stormworkspy_reply_cache_total',
+            'Reply bodies served from the cache (hit) or encoded anew (miss).', 'result')
+        self.parse_seconds = Histogram(
+            'stormworkspy_parse_seconds', 'Time spent decoding the request inputs.',
+            DURATION_BUCKETS)
+        self.handler_seconds = Histogram(
+            'stormworkspy_handler_seconds', 'Time spent handling a request.',
+            DURATION_BUCKETS)
+        self.frame_interval_seconds = Histogram(
+            'stormworkspy_frame_interval_seconds', 'Time between two input frames.',
+            INTERVAL_BUCKETS)
+        self._last_frame = None
+
+    def __iter__(self):
+        return iter((self.requests, self.malformed_values, self.stale_frames,
+                     self.reply_cache, self.parse_seconds, self.handler_seconds, self.frame_interval_seconds))
+
+    def observe_request(self, endpoint, started, parsed, finished, malformed):
+        """Record one exchange timed with ``time.perf_counter`` readings."""
+        self.requests.inc(endpoint)
+        if malformed:
+            self.malformed_values.inc(amount=len(malformed))
+        self.parse_seconds.observe(parsed - started)
+        self.handler_seconds.observe(finished - started)
+        last, self._last_frame = self._last_frame, started
+        if last is not None:
+            self.frame_interval_seconds.observe(started - last)
+
+    def snapshot(self) -> dict:
+        """Return every metric as plain Python values keyed by metric name."""
+        return {metric.name: metric.snapshot() for metric in self}
+
+    def render(self) -> str:
+        """Return the metrics in the Prometheus text format."""
+        return render([({}, self)])
+
+
+def render(sources) -> str:
+    """Render ``(labels, Metrics)`` pairs as one Prometheus text document.
+
+    Samples of the same metric from different sources are grouped under a
+    single ``HELP``/``TYPE`` header, distinguished by their labels.
+    """
+    sources = list(sources)
+    if not sources:
+        return ''
+    lines = []
+    for position, metric in enumerate(sources[0][1]):
+        lines.append(f'# HELP {metric.name} {metric.help}')
+        lines.append(f'# TYPE {metric.name} {metric.kind}')
+        for labels, metrics in sources:
+            for name, sample_labels, value in list(metrics)[position].samples(labels):
+                lines.append(f'{name}{_labels(sample_labels)} {value}')
+    return '\n'.join(lines) + '\n'
@@ -0,0 +1,208 @@
+"""Telemetry recorder backed by a memory-mapped ring file.
+
+Every record holds one exchange with the game: the receive timestamp, the
+32 numeric inputs and outputs and the boolean inputs and outputs as 32-bit
+masks. Records have a fixed size, so appending is a single ``pack_into``
+at a computed offset and the file never grows; once ``capacity`` records
+are written the oldest ones are overwritten.
+
+File layout (little endian)::
+
+    header   magic b"SWTR", version u32, record size u32, capacity u64, count u64
+    records  timestamp f8, in_mask u4, out_mask u4, innums 32*f8, outnums 32*f8
+"""
+
+import mmap
+import os
+import struct
+import threading
+from collections import namedtuple
+
+from .codec import CHANNELS, unpack_bools
+
+MAGIC = b"SWTR"
+VERSION = 1
+_HEADER = struct.Struct("<4sIIQQ")
+HEADER_SIZE = 64
+_COUNT = struct.Struct("<Q")
+_COUNT_OFFSET = _HEADER.size - _COUNT.size
+_RECORD = struct.Struct(f"<dII{CHANNELS}d{CHANNELS}d")
+_TIMESTAMP = struct.Struct("<d")
+RECORD_SIZE = _RECORD.size
+
+#: NumPy dtype description of one record, usable as ``numpy.dtype(RECORD_DTYPE)``.
+RECORD_DTYPE = [
+    ("timestamp", "<f8"),
+    ("in_mask", "<u4"),
+    ("out_mask", "<u4"),
+    ("innums", "<f8", (CHANNELS,)),
+    ("outnums", "<f8", (CHANNELS,)),
+]
+
+Record = namedtuple("Record", "timestamp innums inbools outnums outbools")
+
+
+def _as_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+class TelemetryReader:
+    """Read-only access to a telemetry ring file.
+
+    The file may be written by a recorder in another process at the same
+    time; records are returned oldest first.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._check_header()
+
+    def _check_header(self):
+        magic, version, record_size, capacity, _ = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION or record_size != RECORD_SIZE:
+            raise ValueError(f"{self.path} is not a telemetry file of this version")
+        self.capacity = capacity
+
+    @property
+    def count(self) -> int:
+        """Total number of records ever appended, including overwritten ones."""
+        return _COUNT.unpack_from(self._mm, _COUNT_OFFSET)[0]
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    def _slot(self, index, count):
+        # physical slot of the index-th retained record, oldest first
+        return (count - min(count, self.capacity) + index) % self.capacity
+
+    def _timestamp(self, index, count):
+        offset = HEADER_SIZE + self._slot(index, count) * RECORD_SIZE
+        return _TIMESTAMP.unpack_from(self._mm, offset)[0]
+
+    def _bisect(self, timestamp, count, length):
+        low, high = 0, length
+        while low < high:
+            mid = (low + high) // 2
+            if self._timestamp(mid, count) < timestamp:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+
+    def views(self, start=None, end=None) -> list[memoryview]:
+        """Return raw record memory for timestamps in ``[start, end)``.
+
+        The result holds one memoryview, or two when the range wraps around
+        the end of the ring. Each view is a whole number of records laid out
+        as :data:`RECORD_DTYPE`, so ``numpy.frombuffer(view, RECORD_DTYPE)``
+        maps it without copying. Release the views before :meth:`close`.
+        """
+        count = self.count
+        length = min(count, self.capacity)
+        first = 0 if start is None else self._bisect(start, count, length)
+        last = length if end is None else self._bisect(end, count, length)
+        if first >= last:
+            return []
+        memory = memoryview(self._mm)
+        begin = self._slot(first, count)
+        stop = begin + (last - first)
+        if stop <= self.capacity:
+            return [memory[HEADER_SIZE + begin * RECORD_SIZE:HEADER_SIZE + stop * RECORD_SIZE]]
+        wrapped = stop - self.capacity
+        return [
+            memory[HEADER_SIZE + begin * RECORD_SIZE:HEADER_SIZE + self.capacity * RECORD_SIZE],
+            memory[HEADER_SIZE:HEADER_SIZE + wrapped * RECORD_SIZE],
+        ]
+
+    def to_numpy(self, start=None, end=None):
+        """Return the records in ``[start, end)`` as a NumPy structured array.
+
+        The array is a view of the file unless the range wraps around the
+        ring, in which case the two parts are concatenated into a copy.
+        """
+        import numpy as np
+
+        dtype = np.dtype(RECORD_DTYPE)
+        arrays = [np.frombuffer(view, dtype=dtype) for view in self.views(start, end)]
+        if not arrays:
+            return np.empty(0, dtype=dtype)
+        if len(arrays) == 1:
+            return arrays[0]
+        return np.concatenate(arrays)
+
+    def frames(self, start=None, end=None):
+        """Iterate over the records in ``[start, end)`` as :class:`Record` tuples."""
+        for view in self.views(start, end):
+            for timestamp, in_mask, out_mask, *values in _RECORD.iter_unpack(view):
+                yield Record(
+                    timestamp,
+                    values[:CHANNELS],
+                    unpack_bools(in_mask),
+                    values[CHANNELS:],
+                    unpack_bools(out_mask),
+                )
+
+    def close(self):
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class TelemetryRecorder(TelemetryReader):
+    """Append-only writer for a telemetry ring file.
+
+    Opening an existing file with the same capacity continues after its
+    last record; otherwise the file is (re)created.
+    """
+
+    def __init__(self, path, capacity=216000):
+        self.path = path
+        self.capacity = capacity
+        size = HEADER_SIZE + capacity * RECORD_SIZE
+        exists = os.path.exists(path) and os.path.getsize(path) == size
+        self._file = open(path, "r+b" if exists else "w+b")
+        if not exists:
+            self._file.truncate(size)
+        self._mm = mmap.mmap(self._file.fileno(), size)
+        if exists:
+            self._check_header()
+            count = self.count
+        else:
+            _HEADER.pack_into(self._mm, 0, MAGIC, VERSION, RECORD_SIZE, capacity, 0)
+            count = 0
+        self._count = count
+        # pipelined requests append concurrently; the count must never
+        # move backwards past a record that is already written
+        self._lock = threading.Lock()
+
+    def append(self, timestamp, innums, in_mask, outnums, out_mask):
+        """Write one record; O(1) and safe to call from several threads.
+
+        Channel values that are not numbers, such as an unset (``None``)
+        output, are stored as NaN.
+        """
+        with self._lock:
+            index = self._count
+            offset = HEADER_SIZE + (index % self.capacity) * RECORD_SIZE
+            try:
+                _RECORD.pack_into(self._mm, offset, timestamp, in_mask, out_mask,
+                                  *innums, *outnums)
+            except struct.error:
+                _RECORD.pack_into(self._mm, offset, timestamp, in_mask, out_mask,
+                                  *map(_as_float, innums), *map(_as_float, outnums))
+            self._count = index + 1
+            _COUNT.pack_into(self._mm, _COUNT_OFFSET, index + 1)
+
+    def close(self):
+        self._mm.flush()
+        super().close()
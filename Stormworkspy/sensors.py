@@ -1,3 +1,10 @@
+from collections import namedtuple
+from operator import attrgetter
+
+NUM = "num"
+BOOL = "bool"
+
+
 def _idx(channel: int | None) -> int | None:
     """Convert a 1-based channel number to a zero-based index."""
     if channel is None:
@@ -5,7 +12,115 @@ def _idx(channel: int | None) -> int | None:
     return channel - 1
 
 
-class SW_PlayerSensor:
+def _make_init(cls):
+    """Generate an ``__init__`` taking one ``channel_<field>`` keyword per field."""
+    params = "".join(f", channel_{name}: int = None" for name, _, _ in cls.FIELDS)
+    lines = [f"def __init__(self{params}):"]
+    namespace = {"_idx": _idx}
+    for name, kind, convert in cls.FIELDS:
+        default = False if kind == BOOL else 0.0
+        namespace[f"_default_{name}"] = convert(default) if convert else default
+        lines.append(f"    self.channel_{name} = _idx(channel_{name})")
+        lines.append(f"    self._{name} = _default_{name}")
+    lines.append("    self._gather = None")
+    exec("\n".join(lines), namespace)
+    init = namespace["__init__"]
+    init.__qualname__ = f"{cls.__qualname__}.__init__"
+    return init
+
+
+def compile_gather(sensors, call_overrides: bool = True):
+    """Compile one function that refreshes ``sensors`` from the channel lists.
+
+    The returned ``gather(num_channels, bool_channels)`` copies every wired
+    field with direct indexing. The channel lists are length-checked once
+    per call; only lists too short for some wired channel fall back to
+    per-field checks. Sensors that override :meth:`Sensor.update` get a call
+    to it instead, unless ``call_overrides`` is false.
+    """
+    namespace = {}
+    params = []
+    calls = []
+    fields = []
+    for i, sensor in enumerate(sensors):
+        target = f"s{i}"
+        namespace[target] = sensor
+        params.append(f"{target}={target}")
+        if not isinstance(sensor, Sensor) or (
+                call_overrides and type(sensor).update is not Sensor.update):
+            calls.append(f"    {target}.update(n, b)")
+            continue
+        for name, kind, convert in sensor.FIELDS:
+            chan = getattr(sensor, "channel_" + name)
+            if chan is None or chan < 0:
+                continue
+            source = "b" if kind == BOOL else "n"
+            expr = f"{source}[{chan}]"
+            if convert is not None:
+                namespace[f"c{i}_{name}"] = convert
+                params.append(f"c{i}_{name}=c{i}_{name}")
+                expr = f"c{i}_{name}({expr})"
+            fields.append((source, chan, f"{target}._{name} = {expr}"))
+
+    need_n = max([chan + 1 for source, chan, _ in fields if source == "n"], default=0)
+    need_b = max([chan + 1 for source, chan, _ in fields if source == "b"], default=0)
+    lines = [f"def gather(n, b, {', '.join(params)}):"]
+    if fields:
+        lines.append(f"    if len(n) >= {need_n} and len(b) >= {need_b}:")
+        lines += [f"        {assign}" for _, _, assign in fields]
+        lines.append("    else:")
+        for source, chan, assign in fields:
+            lines.append(f"        if len({source}) > {chan}: {assign}")
+    lines += calls or ([] if fields else ["    pass"])
+    exec("\n".join(lines), namespace)
+    return namespace["gather"]
+
+
+class _SensorMeta(type):
+    """Metaclass giving sensor classes ``__slots__`` for their fields.
+
+    A class that declares ``FIELDS`` gets a ``channel_<name>`` and a
+    ``_<name>`` slot per new field, added to any ``__slots__`` it lists
+    itself. Classes without their own ``FIELDS`` are left alone, so plain
+    subclasses can still keep extra state in an instance dict.
+    """
+
+    def __new__(mcls, name, bases, namespace, **kwargs):
+        if "FIELDS" in namespace:
+            slots = list(namespace.get("__slots__", ()))
+            for field, _, _ in namespace["FIELDS"]:
+                for slot in (f"channel_{field}", f"_{field}"):
+                    if slot not in slots and not any(hasattr(base, slot) for base in bases):
+                        slots.append(slot)
+            namespace["__slots__"] = tuple(slots)
+        return super().__new__(mcls, name, bases, namespace, **kwargs)
+
+
+class Sensor(metaclass=_SensorMeta):
+    """Base class for sensors declared as a table of fields.
+
+    ``FIELDS`` lists ``(name, kind, convert)`` triples where ``kind`` is
+    ``NUM`` or ``BOOL`` and ``convert`` is an optional callable applied to the
+    raw channel value. Each field gets a ``channel_<name>`` constructor
+    keyword (1-based channel number) and stores its latest value in the
+    ``_<name>`` slot.
+    """
+    __slots__ = ("_gather",)
+    FIELDS = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "__init__" not in cls.__dict__:
+            cls.__init__ = _make_init(cls)
+
+    def update(self, num_channels: list[float], bool_channels: list[bool]):
+        gather = self._gather
+        if gather is None:
+            gather = self._gather = compile_gather([self], call_overrides=False)
+        gather(num_channels, bool_channels)
+
+
+class SW_PlayerSensor(Sensor):
     """
     Player Sensor.
     Summary:
@@ -18,12 +133,10 @@ class SW_PlayerSensor:
         players: Number of players detected
         detected: True if at least one player detected
     """
-    def __init__(self, channel_players: int = None, channel_detected: int = None):
-        self.channel_players = _idx(channel_players)
-        self.channel_detected = _idx(channel_detected)
-        # internal storage
-        self._players = 0
-        self._detected = False
+    FIELDS = (
+        ('players', NUM, int),
+        ('detected', BOOL, None),
+    )
 
     def get_players(self) -> int:
         return self._players
@@ -31,14 +144,8 @@ class SW_PlayerSensor:
     def is_detected(self) -> bool:
         return self._detected
 
-    def update(self, num_channels: list[float], bool_channels: list[bool]):
-        if self.channel_players is not None and self.channel_players < len(num_channels):
-            self._players = int(num_channels[self.channel_players])
-        if self.channel_detected is not None and self.channel_detected < len(bool_channels):
-            self._detected = bool_channels[self.channel_detected]
 
-
-class SW_WindSensor:
+class SW_WindSensor(Sensor):
     """
     Wind Sensor.
     Summary:
@@ -49,11 +156,10 @@ class SW_WindSensor:
         direction: Relative direction of the wind
         speed: Relative speed of the wind in m/s
     """
-    def __init__(self, channel_direction: int = None, channel_speed: int = None):
-        self.channel_direction = _idx(channel_direction)
-        self.channel_speed = _idx(channel_speed)
-        self._direction = 0.0
-        self._speed = 0.0
+    FIELDS = (
+        ('direction', NUM, None),
+        ('speed', NUM, None),
+    )
 
     def get_direction(self) -> float:
         return self._direction
@@ -61,14 +167,8 @@ class SW_WindSensor:
     def get_speed(self) -> float:
         return self._speed
 
-    def update(self, num_channels: list[float], bool_channels: list[bool]):
-        if self.channel_direction is not None and self.channel_direction < len(num_channels):
-            self._direction = num_channels[self.channel_direction]
-        if self.channel_speed is not None and self.channel_speed < len(num_channels):
-            self._speed = num_channels[self.channel_speed]
-
 
-class SW_RainSensor:
+class SW_RainSensor(Sensor):
     """
     Rain Sensor.
     Summary:
@@ -78,19 +178,15 @@ class SW_RainSensor:
     Outputs (values):
         intensity: Rain intensity (0-1)
     """
-    def __init__(self, channel_intensity: int = None):
-        self.channel_intensity = _idx(channel_intensity)
-        self._intensity = 0.0
+    FIELDS = (
+        ('intensity', NUM, None),
+    )
 
     def get_intensity(self) -> float:
         return self._intensity
 
-    def update(self, num_channels: list[float], bool_channels: list[bool]):
-        if self.channel_intensity is not None and self.channel_intensity < len(num_channels):
-            self._intensity = num_channels[self.channel_intensity]
 
-
-class SW_HumiditySensor:
+class SW_HumiditySensor(Sensor):
     """
     Humidity Sensor.
     Summary:
@@ -100,19 +196,15 @@ class SW_HumiditySensor:
     Outputs (values):
         humidity: Humidity value (0-1)
     """
-    def __init__(self, channel_humidity: int = None):
-        self.channel_humidity = _idx(channel_humidity)
-        self._humidity = 0.0
+    FIELDS = (
+        ('humidity', NUM, None),
+    )
 
     def get_humidity(self) -> float:
         return self._humidity
 
-    def update(self, num_channels: list[float], bool_channels: list[bool]):
-        if self.channel_humidity is not None and self.channel_humidity < len(num_channels):
-            self._humidity = num_channels[self.channel_humidity]
-
 
-class SW_TemperatureSensor:
+class SW_TemperatureSensor(Sensor):
     """
     Temperature Sensor.
     Summary:
@@ -122,23 +214,19 @@ class SW_TemperatureSensor:
     Outputs (values):
         temperature: Ambient temperature in °C
     """
-    def __init__(self, channel_temperature: int = None):
-        self.channel_temperature = _idx(channel_temperature)
-        self._temperature = 0.0
+    FIELDS = (
+        ('temperature', NUM, None),
+    )
 
     def get_temperature(self) -> float:
         return self._temperature
-    
+
     def get_temperature_fahrenheit(self) -> float:
         """Convert Celsius to Fahrenheit."""
         return (self._temperature * 9/5) + 32
 
-    def update(self, num_channels: list[float], bool_channels: list[bool]):
-        if self.channel_temperature is not None and self.channel_temperature < len(num_channels):
-            self._temperature = num_channels[self.channel_temperature]
-
 
-class SW_TiltSensor:
+class SW_TiltSensor(Sensor):
     """
     Tilt Sensor.
     Summary:
@@ -148,19 +236,57 @@ class SW_TiltSensor:
     Outputs (values):
         tilt: Tilt angle (-0.25 to 0.25)
     """
-    def __init__(self, channel_tilt: int = None):
-        self.channel_tilt = _idx(channel_tilt)
-        self._tilt = 0.0
+    FIELDS = (
+        ('tilt', NUM, None),
+    )
 
     def get_tilt(self) -> float:
         return self._tilt
 
-    def update(self, num_channels: list[float], bool_channels: list[bool]):
-        if self.channel_tilt is not None and self.channel_tilt < len(num_channels):
-            self._tilt = num_channels[self.channel_tilt]
+
+_PHYSICS_FIELDS = (
+    'pos_x', 'pos_y', 'pos_z', 'rot_x', 'rot_y', 'rot_z',
+    'vel_x', 'vel_y', 'vel_z', 'angvel_x', 'angvel_y', 'angvel_z',
+    'speed_absolute', 'angspeed_absolute', 'pitch', 'roll', 'heading',
+)
+_physics_values = attrgetter(*('_' + name for name in _PHYSICS_FIELDS))
+
+
+class PhysicsState(namedtuple('PhysicsState', _PHYSICS_FIELDS)):
+    """Immutable reading of a physics sensor.
+
+    Fields are accessed as attributes (``state.pos_x``) or, like the dict
+    returned by earlier versions, by name (``state['pos_x']``), and
+    ``in``, ``get``, ``keys``, ``values`` and ``items`` work with field
+    names. It is still a tuple, though: iterating yields the values, and it
+    never equals a dict. Use ``state._asdict()`` where a real dict is needed.
+    """
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key):
+        if isinstance(key, str):
+            return key in self._fields
+        return tuple.__contains__(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default) if key in self._fields else default
+
+    def keys(self):
+        return self._fields
+
+    def values(self):
+        return tuple(self)
+
+    def items(self):
+        return tuple(zip(self._fields, self))
 
 
-class SW_PhysicsSensor:
+class SW_PhysicsSensor(Sensor):
     """
     Physics Sensor.
     Summary:
@@ -172,67 +298,13 @@ class SW_PhysicsSensor:
         vel_x, vel_y, vel_z, angvel_x, angvel_y, angvel_z,
         speed_absolute, angspeed_absolute, pitch, roll, heading
     """
-    def __init__(
-        self,
-        channel_pos_x: int = None,
-        channel_pos_y: int = None,
-        channel_pos_z: int = None,
-        channel_rot_x: int = None,
-        channel_rot_y: int = None,
-        channel_rot_z: int = None,
-        channel_vel_x: int = None,
-        channel_vel_y: int = None,
-        channel_vel_z: int = None,
-        channel_angvel_x: int = None,
-        channel_angvel_y: int = None,
-        channel_angvel_z: int = None,
-        channel_speed_absolute: int = None,
-        channel_angspeed_absolute: int = None,
-        channel_pitch: int = None,
-        channel_roll: int = None,
-        channel_heading: int = None,
-    ):
-        self.channel_pos_x = _idx(channel_pos_x)
-        self.channel_pos_y = _idx(channel_pos_y)
-        self.channel_pos_z = _idx(channel_pos_z)
-        self.channel_rot_x = _idx(channel_rot_x)
-        self.channel_rot_y = _idx(channel_rot_y)
-        self.channel_rot_z = _idx(channel_rot_z)
-        self.channel_vel_x = _idx(channel_vel_x)
-        self.channel_vel_y = _idx(channel_vel_y)
-        self.channel_vel_z = _idx(channel_vel_z)
-        self.channel_angvel_x = _idx(channel_angvel_x)
-        self.channel_angvel_y = _idx(channel_angvel_y)
-        self.channel_angvel_z = _idx(channel_angvel_z)
-        self.channel_speed_absolute = _idx(channel_speed_absolute)
-        self.channel_angspeed_absolute = _idx(channel_angspeed_absolute)
-        self.channel_pitch = _idx(channel_pitch)
-        self.channel_roll = _idx(channel_roll)
-        self.channel_heading = _idx(channel_heading)
-        # internal storage
-        self._values = {k: 0.0 for k in [
-            'pos_x','pos_y','pos_z','rot_x','rot_y','rot_z',
-            'vel_x','vel_y','vel_z','angvel_x','angvel_y','angvel_z',
-            'speed_absolute','angspeed_absolute','pitch','roll','heading'
-        ]}
-
-    def get_all(self) -> dict:
-        return dict(self._values)
+    FIELDS = tuple((name, NUM, None) for name in _PHYSICS_FIELDS)
 
-    def update(self, num_channels: list[float], bool_channels: list[bool]):
-        for key, chan in [
-            ('pos_x', self.channel_pos_x), ('pos_y', self.channel_pos_y), ('pos_z', self.channel_pos_z),
-            ('rot_x', self.channel_rot_x), ('rot_y', self.channel_rot_y), ('rot_z', self.channel_rot_z),
-            ('vel_x', self.channel_vel_x), ('vel_y', self.channel_vel_y), ('vel_z', self.channel_vel_z),
-            ('angvel_x', self.channel_angvel_x), ('angvel_y', self.channel_angvel_y), ('angvel_z', self.channel_angvel_z),
-            ('speed_absolute', self.channel_speed_absolute), ('angspeed_absolute', self.channel_angspeed_absolute),
-            ('pitch', self.channel_pitch), ('roll', self.channel_roll), ('heading', self.channel_heading)
-        ]:
-            if chan is not None and chan < len(num_channels):
-                self._values[key] = num_channels[chan]
+    def get_all(self) -> PhysicsState:
+        return tuple.__new__(PhysicsState, _physics_values(self))
 
 
-class SW_LinearSpeedSensor:
+class SW_LinearSpeedSensor(Sensor):
     """
     Linear Speed Sensor.
     Summary:
@@ -242,19 +314,15 @@ class SW_LinearSpeedSensor:
     Outputs (values):
         speed: Speed in m/s
     """
-    def __init__(self, channel_speed: int = None):
-        self.channel_speed = _idx(channel_speed)
-        self._speed = 0.0
+    FIELDS = (
+        ('speed', NUM, None),
+    )
 
     def get_speed(self) -> float:
         return self._speed
 
-    def update(self, num_channels: list[float], bool_channels: list[bool]):
-        if self.channel_speed is not None and self.channel_speed < len(num_channels):
-            self._speed = num_channels[self.channel_speed]
-
 
-class SW_DistanceSensor:
+class SW_DistanceSensor(Sensor):
     """
     Distance Sensor.
     Summary:
@@ -264,19 +332,15 @@ class SW_DistanceSensor:
     Outputs (values):
         distance: Distance in meters
     """
-    def __init__(self, channel_distance: int = None):
-        self.channel_distance = _idx(channel_distance)
-        self._distance = 0.0
+    FIELDS = (
+        ('distance', NUM, None),
+    )
 
     def get_distance(self) -> float:
         return self._distance
 
-    def update(self, num_channels: list[float], bool_channels: list[bool]):
-        if self.channel_distance is not None and self.channel_distance < len(num_channels):
-            self._distance = num_channels[self.channel_distance]
-
 
-class SW_LaserDistanceSensor:
+class SW_LaserDistanceSensor(Sensor):
     """
     Laser Distance Sensor.
     Summary:
@@ -286,19 +350,15 @@ class SW_LaserDistanceSensor:
     Outputs (values):
         distance: Distance in meters
     """
-    def __init__(self, channel_distance: int = None):
-        self.channel_distance = _idx(channel_distance)
-        self._distance = 0.0
+    FIELDS = (
+        ('distance', NUM, None),
+    )
 
     def get_distance(self) -> float:
         return self._distance
 
-    def update(self, num_channels: list[float], bool_channels: list[bool]):
-        if self.channel_distance is not None and self.channel_distance < len(num_channels):
-            self._distance = num_channels[self.channel_distance]
-
 
-class SW_LaserPointSensor:
+class SW_LaserPointSensor(Sensor):
     """
     Laser Point Sensor.
     Summary:
@@ -308,19 +368,15 @@ class SW_LaserPointSensor:
     Outputs (values):
         direction: Direction to the beacon
     """
-    def __init__(self, channel_direction: int = None):
-        self.channel_direction = _idx(channel_direction)
-        self._direction = 0.0
+    FIELDS = (
+        ('direction', NUM, None),
+    )
 
     def get_direction(self) -> float:
         return self._direction
 
-    def update(self, num_channels: list[float], bool_channels: list[bool]):
-        if self.channel_direction is not None and self.channel_direction < len(num_channels):
-            self._direction = num_channels[self.channel_direction]
 
-
-class SW_CompassSensor:
+class SW_CompassSensor(Sensor):
     """
     Compass Sensor.
     Summary:
@@ -335,11 +391,10 @@ class SW_CompassSensor:
         heading: Orientation value
         backlight: Backlight on/off
     """
-    def __init__(self, channel_heading: int = None, channel_backlight: int = None):
-        self.channel_heading = _idx(channel_heading)
-        self.channel_backlight = _idx(channel_backlight)
-        self._heading = 0.0
-        self._backlight = False
+    FIELDS = (
+        ('heading', NUM, None),
+        ('backlight', BOOL, None),
+    )
 
     def get_heading(self) -> float:
         return self._heading
@@ -347,14 +402,8 @@ class SW_CompassSensor:
     def is_backlight_on(self) -> bool:
         return self._backlight
 
-    def update(self, num_channels: list[float], bool_channels: list[bool]):
-        if self.channel_heading is not None and self.channel_heading < len(num_channels):
-            self._heading = num_channels[self.channel_heading]
-        if self.channel_backlight is not None and self.channel_backlight < len(bool_channels):
-            self._backlight = bool_channels[self.channel_backlight]
-
 
-class SW_Altimeter:
+class SW_Altimeter(Sensor):
     """
     Altimeter.
     Summary:
@@ -364,19 +413,15 @@ class SW_Altimeter:
     Outputs (values):
         altitude: Altitude in meters
     """
-    def __init__(self, channel_altitude: int = None):
-        self.channel_altitude = _idx(channel_altitude)
-        self._altitude = 0.0
+    FIELDS = (
+        ('altitude', NUM, None),
+    )
 
     def get_altitude(self) -> float:
         return self._altitude
 
-    def update(self, num_channels: list[float], bool_channels: list[bool]):
-        if self.channel_altitude is not None and self.channel_altitude < len(num_channels):
-            self._altitude = num_channels[self.channel_altitude]
 
-
-class SW_GPS:
+class SW_GPS(Sensor):
     """
     GPS Sensor.
     Summary:
@@ -387,23 +432,16 @@ class SW_GPS:
         x: X coordinate
         y: Y coordinate
     """
-    def __init__(self, channel_x: int = None, channel_y: int = None):
-        self.channel_x = _idx(channel_x)
-        self.channel_y = _idx(channel_y)
-        self._x = 0.0
-        self._y = 0.0
+    FIELDS = (
+        ('x', NUM, None),
+        ('y', NUM, None),
+    )
 
     def get_position(self) -> tuple[float, float]:
         return (self._x, self._y)
 
-    def update(self, num_channels: list[float], bool_channels: list[bool]):
-        if self.channel_x is not None and self.channel_x < len(num_channels):
-            self._x = num_channels[self.channel_x]
-        if self.channel_y is not None and self.channel_y < len(num_channels):
-            self._y = num_channels[self.channel_y]
-
 
-class SW_TorqueMeter:
+class SW_TorqueMeter(Sensor):
     """
     Torque Meter.
     Summary:
@@ -414,11 +452,10 @@ class SW_TorqueMeter:
         rps: Rotations per second
         force: Torque force
     """
-    def __init__(self, channel_rps: int = None, channel_force: int = None):
-        self.channel_rps = _idx(channel_rps)
-        self.channel_force = _idx(channel_force)
-        self._rps = 0.0
-        self._force = 0.0
+    FIELDS = (
+        ('rps', NUM, None),
+        ('force', NUM, None),
+    )
 
     def get_rps(self) -> float:
         return self._rps
@@ -426,14 +463,8 @@ class SW_TorqueMeter:
     def get_force(self) -> float:
         return self._force
 
-    def update(self, num_channels: list[float], bool_channels: list[bool]):
-        if self.channel_rps is not None and self.channel_rps < len(num_channels):
-            self._rps = num_channels[self.channel_rps]
-        if self.channel_force is not None and self.channel_force < len(num_channels):
-            self._force = num_channels[self.channel_force]
-
 
-class SW_BasicRadar:
+class SW_BasicRadar(Sensor):
     """
     Basic Radar.
     Summary:
@@ -444,11 +475,10 @@ class SW_BasicRadar:
         direction: Bearing to target
         distance: Distance to target
     """
-    def __init__(self, channel_direction: int = None, channel_distance: int = None):
-        self.channel_direction = _idx(channel_direction)
-        self.channel_distance = _idx(channel_distance)
-        self._direction = 0.0
-        self._distance = 0.0
+    FIELDS = (
+        ('direction', NUM, None),
+        ('distance', NUM, None),
+    )
 
     def get_direction(self) -> float:
         return self._direction
@@ -456,14 +486,8 @@ class SW_BasicRadar:
     def get_distance(self) -> float:
         return self._distance
 
-    def update(self, num_channels: list[float], bool_channels: list[bool]):
-        if self.channel_direction is not None and self.channel_direction < len(num_channels):
-            self._direction = num_channels[self.channel_direction]
-        if self.channel_distance is not None and self.channel_distance < len(num_channels):
-            self._distance = num_channels[self.channel_distance]
-
 
-class SW_PhalanxRadar:
+class SW_PhalanxRadar(Sensor):
     """
     Phalanx Radar.
     Summary:
@@ -474,11 +498,10 @@ class SW_PhalanxRadar:
         direction: Bearing
         distance: Distance
     """
-    def __init__(self, channel_direction: int = None, channel_distance: int = None):
-        self.channel_direction = _idx(channel_direction)
-        self.channel_distance = _idx(channel_distance)
-        self._direction = 0.0
-        self._distance = 0.0
+    FIELDS = (
+        ('direction', NUM, None),
+        ('distance', NUM, None),
+    )
 
     def get_direction(self) -> float:
         return self._direction
@@ -486,14 +509,8 @@ class SW_PhalanxRadar:
     def get_distance(self) -> float:
         return self._distance
 
-    def update(self, num_channels: list[float], bool_channels: list[bool]):
-        if self.channel_direction is not None and self.channel_direction < len(num_channels):
-            self._direction = num_channels[self.channel_direction]
-        if self.channel_distance is not None and self.channel_distance < len(num_channels):
-            self._distance = num_channels[self.channel_distance]
-
 
-class SW_RadarDish:
+class SW_RadarDish(Sensor):
     """
     Radar Dish (Large Radar).
     Summary:
@@ -504,21 +521,16 @@ class SW_RadarDish:
         direction: Bearing
         distance: Distance
     """
-    def __init__(self, channel_direction: int = None, channel_distance: int = None):
-        self.channel_direction = _idx(channel_direction)
-        self.channel_distance = _idx(channel_distance)
-        self._direction = 0.0
-        self._distance = 0.0
+    FIELDS = (
+        ('direction', NUM, None),
+        ('distance', NUM, None),
+    )
 
     def get_direction(self) -> float: return self._direction
     def get_distance(self) -> float: return self._distance
 
-    def update(self, num_channels: list[float], bool_channels: list[bool]):
-        if self.channel_direction is not None and self.channel_direction < len(num_channels): self._direction = num_channels[self.channel_direction]
-        if self.channel_distance is not None and self.channel_distance < len(num_channels): self._distance = num_channels[self.channel_distance]
-
 
-class SW_RadarAWACS:
+class SW_RadarAWACS(Sensor):
     """
     Radar AWACS (Huge Radar).
     Summary:
@@ -529,18 +541,16 @@ class SW_RadarAWACS:
         direction: Bearing
         distance: Distance
     """
-    def __init__(self, channel_direction=None, channel_distance=None):
-        self.channel_direction = _idx(channel_direction)
-        self.channel_distance = _idx(channel_distance)
-        self._direction = 0.0; self._distance = 0.0
+    FIELDS = (
+        ('direction', NUM, None),
+        ('distance', NUM, None),
+    )
+
     def get_direction(self): return self._direction
     def get_distance(self): return self._distance
-    def update(self, num_channels, bool_channels):
-        if self.channel_direction is not None and self.channel_direction < len(num_channels): self._direction = num_channels[self.channel_direction]
-        if self.channel_distance is not None and self.channel_distance < len(num_channels): self._distance = num_channels[self.channel_distance]
 
 
-class SW_MissileRadar:
+class SW_MissileRadar(Sensor):
     """
     Missile Radar.
     Summary:
@@ -551,19 +561,16 @@ class SW_MissileRadar:
         direction: Bearing
         distance: Distance
     """
-    def __init__(self, channel_direction=None, channel_distance=None):
-        self.channel_direction = _idx(channel_direction)
-        self.channel_distance = _idx(channel_distance)
-        self._direction = 0.0
-        self._distance = 0.0
+    FIELDS = (
+        ('direction', NUM, None),
+        ('distance', NUM, None),
+    )
+
     def get_direction(self): return self._direction
     def get_distance(self): return self._distance
-    def update(self, num_channels, bool_channels):
-        if self.channel_direction!=None and self.channel_direction<len(num_channels): self._direction=num_channels[self.channel_direction]
-        if self.channel_distance!=None and self.channel_distance<len(num_channels): self._distance=num_channels[self.channel_distance]
 
 
-class SW_Sonar:
+class SW_Sonar(Sensor):
     """
     Sonar Sensor.
     Summary:
@@ -575,19 +582,16 @@ class SW_Sonar:
     Outputs (values):
         angle: Relative angle to object
     """
-    def __init__(self, channel_ping=None, channel_angle=None):
-        self.channel_ping = _idx(channel_ping)
-        self.channel_angle = _idx(channel_angle)
-        self._angle = 0.0
-        self._ping = False
+    FIELDS = (
+        ('ping', BOOL, None),
+        ('angle', NUM, None),
+    )
+
     def is_ping(self): return self._ping
     def get_angle(self): return self._angle
-    def update(self, num_channels, bool_channels):
-        if self.channel_ping!=None and self.channel_ping<len(bool_channels): self._ping=bool_channels[self.channel_ping]
-        if self.channel_angle!=None and self.channel_angle<len(num_channels): self._angle=num_channels[self.channel_angle]
 
 
-class SW_FluidPressureSensor:
+class SW_FluidPressureSensor(Sensor):
     """
     Fluid Pressure Sensor.
     Summary:
@@ -597,15 +601,14 @@ class SW_FluidPressureSensor:
     Outputs (values):
         pressure: Pressure reading
     """
-    def __init__(self, channel_pressure=None):
-        self.channel_pressure = _idx(channel_pressure)
-        self._pressure = 0.0
+    FIELDS = (
+        ('pressure', NUM, None),
+    )
+
     def get_pressure(self): return self._pressure
-    def update(self, num_channels, bool_channels):
-        if self.channel_pressure!=None and self.channel_pressure<len(num_channels): self._pressure=num_channels[self.channel_pressure]
 
 
-class SW_FluidMeter:
+class SW_FluidMeter(Sensor):
     """
     Fluid Meter.
     Summary:
@@ -616,19 +619,16 @@ class SW_FluidMeter:
         capacity: Room capacity (L)
         amount: Fluid amount (L)
     """
-    def __init__(self, channel_capacity=None, channel_amount=None):
-        self.channel_capacity = _idx(channel_capacity)
-        self.channel_amount = _idx(channel_amount)
-        self._capacity = 0.0
-        self._amount = 0.0
+    FIELDS = (
+        ('capacity', NUM, None),
+        ('amount', NUM, None),
+    )
+
     def get_capacity(self): return self._capacity
     def get_amount(self): return self._amount
-    def update(self, num_channels, bool_channels):
-        if self.channel_capacity!=None and self.channel_capacity<len(num_channels): self._capacity=num_channels[self.channel_capacity]
-        if self.channel_amount!=None and self.channel_amount<len(num_channels): self._amount=num_channels[self.channel_amount]
 
 
-class SW_ClockSensor:
+class SW_ClockSensor(Sensor):
     """
     Clock Sensor.
     Summary:
@@ -638,10 +638,9 @@ class SW_ClockSensor:
     Outputs (values):
         time: Fraction of day
     """
-    def __init__(self, channel_time=None):
-        self.channel_time = _idx(channel_time)
-        self._time = 0.0
+    FIELDS = (
+        ('time', NUM, None),
+    )
+
     def get_time(self): return self._time
-    def update(self, num_channels, bool_channels):
-        if self.channel_time!=None and self.channel_time<len(num_channels): self._time=num_channels[self.channel_time]
 
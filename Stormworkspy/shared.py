@@ -0,0 +1,269 @@
+"""Serve the API from its own process and share frames through shared memory.
+
+Control code that does heavy math holds the GIL long enough to delay the
+request thread, and the game sees late replies. :class:`SharedServer`
+runs the HTTP server in a separate process instead. Each request publishes
+its input frame to a shared memory block and replies with the outputs that
+the control processes last wrote there, so reply latency does not depend
+on how busy those processes are.
+
+Both directions are single-writer slots guarded by a seqlock. The writer
+makes the sequence number odd, writes the payload and makes it even again.
+A reader copies the payload and retries if the sequence number was odd or
+changed meanwhile. Neither side ever waits for the other.
+
+Block layout (little endian)::
+
+    header   channels u8
+    inputs   seq u8, counter u8, timestamp f8, nums channels*f8, bools channels*u1
+    outputs  seq u8, nums channels*f8, bools channels*u1
+"""
+
+import multiprocessing
+import struct
+import threading
+import time
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+
+from .channels import Frame
+from .codec import CHANNELS
+from .Stormworkspy import Stormworkspy
+from .transport import make_flask_app, start_transport
+
+_HEADER = struct.Struct("<Q")
+_SEQ = struct.Struct("<Q")
+
+
+# names of the blocks created by this process
+_created = set()
+
+
+def _attach(name, child=False):
+    try:
+        return SharedMemory(name, track=False)
+    except TypeError:
+        pass
+    # Python < 3.13 registers every attachment with the resource tracker,
+    # which unlinks the block when its process exits. The creator and the
+    # processes it starts share one tracker, where the registration is the
+    # creator's own and must stay. Any other process has a tracker of its
+    # own, so the attachment is unregistered there.
+    shm = SharedMemory(name)
+    if not child and shm.name not in _created:
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+class SharedFrames:
+    """Input and output frames in a shared memory block.
+
+    The serving process writes inputs and reads outputs; one control
+    process writes outputs and any number of processes read inputs. Pass
+    ``name`` to attach to an existing block, or ``channels`` to create one.
+    A process started by the creator attaches with ``child=True``, because
+    on Python < 3.13 it shares the creator's resource tracker.
+    """
+
+    def __init__(self, name=None, channels=CHANNELS, child=False):
+        if name is None:
+            self._input = struct.Struct(f"<Qd{channels}d{channels}?")
+            self._output = struct.Struct(f"<{channels}d{channels}?")
+            size = _HEADER.size + 2 * _SEQ.size + self._input.size + self._output.size
+            self.shm = SharedMemory(create=True, size=size)
+            self.owner = True
+            _created.add(self.shm.name)
+            _HEADER.pack_into(self.shm.buf, 0, channels)
+        else:
+            self.shm = _attach(name, child)
+            self.owner = False
+            channels = _HEADER.unpack_from(self.shm.buf, 0)[0]
+            self._input = struct.Struct(f"<Qd{channels}d{channels}?")
+            self._output = struct.Struct(f"<{channels}d{channels}?")
+        self.name = self.shm.name
+        self.channels = channels
+        self._buf = self.shm.buf
+        self._input_offset = _HEADER.size
+        self._output_offset = self._input_offset + _SEQ.size + self._input.size
+
+    def _write(self, offset, packer, *values):
+        buf = self._buf
+        seq = _SEQ.unpack_from(buf, offset)[0]
+        _SEQ.pack_into(buf, offset, seq + 1)
+        packer.pack_into(buf, offset + _SEQ.size, *values)
+        _SEQ.pack_into(buf, offset, seq + 2)
+
+    def _read(self, offset, packer):
+        buf = self._buf
+        while True:
+            before = _SEQ.unpack_from(buf, offset)[0]
+            if not before & 1:
+                values = packer.unpack_from(buf, offset + _SEQ.size)
+                if _SEQ.unpack_from(buf, offset)[0] == before:
+                    return before, values
+            time.sleep(0)
+
+    def write_inputs(self, frame):
+        """Publish an input :class:`~Stormworkspy.channels.Frame`."""
+        self._write(self._input_offset, self._input,
+                    frame.counter, frame.timestamp, *frame.nums, *frame.bools)
+
+    def read_inputs(self) -> Frame:
+        """Return the newest input frame; its ``counter`` is 0 before the first."""
+        _, values = self._read(self._input_offset, self._input)
+        channels = self.channels
+        return Frame(list(values[2:2 + channels]), list(values[2 + channels:]),
+                     values[1], values[0])
+
+    @property
+    def frame_counter(self) -> int:
+        """Counter of the newest input frame, read without the payload."""
+        return _SEQ.unpack_from(self._buf, self._input_offset + _SEQ.size)[0]
+
+    def wait_for_frame(self, timeout=None, after=None, poll=0.0005):
+        """Wait for an input frame newer than ``after`` and return it.
+
+        Shared memory has no notification, so this polls every ``poll``
+        seconds. Returns ``None`` if ``timeout`` seconds pass first.
+        """
+        if after is None:
+            after = self.frame_counter
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            frame = self.read_inputs()
+            if frame.counter > after:
+                return frame
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(poll)
+
+    def write_outputs(self, nums, bools):
+        """Publish a full set of output values for the next replies."""
+        if len(nums) != self.channels or len(bools) != self.channels:
+            raise ValueError(f"expected {self.channels} numeric and boolean outputs")
+        self._write(self._output_offset, self._output, *nums, *map(bool, bools))
+
+    @property
+    def output_seq(self) -> int:
+        """Sequence number of the output slot; it changes on every write."""
+        return _SEQ.unpack_from(self._buf, self._output_offset)[0]
+
+    def read_outputs(self):
+        """Return ``(seq, nums, bools)`` as last written by a control process."""
+        seq, values = self._read(self._output_offset, self._output)
+        return seq, list(values[:self.channels]), list(values[self.channels:])
+
+    def close(self):
+        self._buf = None
+        self.shm.close()
+        if self.owner:
+            _created.discard(self.name)
+            self.shm.unlink()
+
+
+class _SharedBridge:
+    """Request handler of the server process: a ``Stormworkspy`` fed from shared memory."""
+
+    def __init__(self, sw, frames):
+        self.sw = sw
+        self.frames = frames
+        self.app = make_flask_app(self)
+        self.app.logger.disabled = True
+        self._lock = threading.Lock()
+        self._output_seq = 0
+        self._published = 0
+
+    def handle_request(self, path, query):
+        sw = self.sw
+        if self.frames.output_seq != self._output_seq:
+            with self._lock:
+                self._pull_outputs()
+        response = sw.handle_request(path, query)
+        frame = sw.snapshot()
+        if frame.counter > self._published:
+            with self._lock:
+                if frame.counter > self._published:
+                    self.frames.write_inputs(frame)
+                    self._published = frame.counter
+        return response
+
+    def _pull_outputs(self):
+        seq, nums, bools = self.frames.read_outputs()
+        if seq == self._output_seq:
+            return
+        sw = self.sw
+        # only write the slots that changed so delta replies stay small
+        with sw.batch():
+            outnums, outbools = sw.outnums, sw.outbools
+            for i, value in enumerate(nums):
+                if outnums[i] != value:
+                    outnums[i] = value
+            for i, value in enumerate(bools):
+                if outbools[i] != value:
+                    outbools[i] = value
+        self._output_seq = seq
+
+
+def _serve(shm_name, name, pages, host, port, backend, ready, stop):
+    frames = SharedFrames(shm_name, child=True)
+    bridge = _SharedBridge(Stormworkspy(name, pages), frames)
+    transport = start_transport(bridge, host, port, backend=backend)
+    ready.set()
+    try:
+        stop.wait()
+    finally:
+        transport.stop()
+        frames.close()
+
+
+class SharedServer:
+    """Run the API in a separate process that exchanges frames through shared memory.
+
+    ``frames`` is this process's :class:`SharedFrames`; other processes
+    attach with ``SharedFrames(server.frames.name)``::
+
+        server = SharedServer(port=5000)
+        server.start()
+        frame = server.frames.wait_for_frame()
+        server.frames.write_outputs(nums, bools)
+        server.stop()
+    """
+
+    def __init__(self, host='localhost', port=5000, backend='http', name="default", pages=1):
+        self.host = host
+        self.port = port
+        self.backend = backend
+        self.name = name
+        self.pages = pages
+        self.frames = None
+        self.process = None
+
+    def start(self, timeout=30.0):
+        """Start the server process and wait until it accepts requests."""
+        context = multiprocessing.get_context("spawn")
+        self.frames = SharedFrames(channels=CHANNELS * self.pages)
+        self._ready = context.Event()
+        self._stop = context.Event()
+        self.process = context.Process(
+            target=_serve, daemon=True,
+            args=(self.frames.name, self.name, self.pages, self.host, self.port,
+                  self.backend, self._ready, self._stop),
+        )
+        self.process.start()
+        deadline = time.monotonic() + timeout
+        while not self._ready.wait(0.05):
+            if not self.process.is_alive() or time.monotonic() > deadline:
+                self.stop()
+                raise RuntimeError("the server process failed to start")
+
+    def stop(self):
+        if self.process is None:
+            return
+        self._stop.set()
+        self.process.join(5)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.process = None
+        self.frames.close()
+        self.frames = None
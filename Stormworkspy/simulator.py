@@ -0,0 +1,329 @@
+"""Game-side load generator standing in for ``SW_lua/sw.lua``.
+
+Each virtual vehicle ticks at the game's 60 Hz and follows the Lua script's
+flow control: a request is due every ``interval`` ticks, but only one may be
+in flight (``is_reply_pending``), so a due tick that finds the previous
+reply outstanding is counted as dropped and the request goes out on the
+first tick after the reply arrives.  In pipelined mode a request goes out
+on every tick while fewer than ``MAX_IN_FLIGHT`` are pending.  All vehicles
+share one asyncio event loop and keep one keep-alive connection per request
+in flight.
+
+From the command line::
+
+    python -m Stormworkspy.simulator --vehicles 50 --duration 30 --compact
+"""
+
+import argparse
+import asyncio
+import bisect
+import json
+import math
+import time
+
+from . import codec
+
+#: Upper bounds of the latency histogram buckets, in milliseconds.
+LATENCY_BUCKETS = (0.5, 1, 2, 5, 10, 20, 50, 100, 250, 500, 1000)
+
+
+class SimulationReport:
+    """Counters and latencies collected by :func:`simulate`."""
+
+    def __init__(self, vehicles, duration):
+        self.vehicles = vehicles
+        self.duration = duration
+        self.ticks = 0
+        self.requests = 0
+        self.responses = 0
+        self.dropped_ticks = 0
+        self.errors = 0
+        self.invalid = 0
+        self.stale_replies = 0
+        self.latencies = []
+
+    @property
+    def throughput(self) -> float:
+        """Answered requests per second over all vehicles."""
+        return self.responses / self.duration if self.duration else 0.0
+
+    def percentile(self, p) -> float:
+        """Latency percentile ``p`` (0-100) in seconds."""
+        if not self.latencies:
+            return math.nan
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+    def histogram(self, buckets=LATENCY_BUCKETS) -> list[tuple[float, int]]:
+        """Count latencies per bucket as ``(upper bound in ms, count)`` pairs."""
+        counts = [0] * (len(buckets) + 1)
+        for latency in self.latencies:
+            counts[bisect.bisect_left(buckets, latency * 1000)] += 1
+        return list(zip((*buckets, math.inf), counts))
+
+    def __str__(self):
+        lines = [
+            f"vehicles       {self.vehicles}",
+            f"duration       {self.duration:.2f} s",
+            f"requests       {self.requests} ({self.throughput:.1f}/s answered)",
+            f"dropped ticks  {self.dropped_ticks} of {self.ticks}",
+            f"errors         {self.errors}",
+            f"invalid        {self.invalid}",
+            f"stale replies  {self.stale_replies}",
+        ]
+        if self.latencies:
+            lines.append("latency        p50 {:.2f} ms  p90 {:.2f} ms  p99 {:.2f} ms  max {:.2f} ms".format(
+                self.percentile(50) * 1000, self.percentile(90) * 1000,
+                self.percentile(99) * 1000, max(self.latencies) * 1000,
+            ))
+            for bound, count in self.histogram():
+                if count:
+                    label = "inf" if bound == math.inf else f"{bound:g}"
+                    lines.append(f"  <= {label:>5} ms  {count}")
+        return "\n".join(lines)
+
+
+class _Connection:
+    """Minimal keep-alive HTTP/1.1 GET client on asyncio streams."""
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = self.writer = None
+
+    async def get(self, target):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        self.writer.write(
+            f"GET {target} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\n\r\n".encode("latin-1"))
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("connection closed by server")
+        version, status, _ = status_line.decode("latin-1").split(" ", 2)
+        keep_alive = version == "HTTP/1.1"
+        length = None
+        while True:
+            header = await self.reader.readline()
+            if header in (b"\r\n", b"\n", b""):
+                break
+            key, _, value = header.decode("latin-1").partition(":")
+            key = key.strip().lower()
+            value = value.strip().lower()
+            if key == "content-length":
+                length = int(value)
+            elif key == "connection":
+                keep_alive = value == "keep-alive" or (keep_alive and value != "close")
+        if length is None:
+            body = await self.reader.read()
+            keep_alive = False
+        else:
+            body = await self.reader.readexactly(length)
+        if not keep_alive:
+            self.close()
+        return int(status), body
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+def _valid_reply(body, compact, delta):
+    try:
+        if compact:
+            # every field is a number; a malformed one raises ValueError
+            values = [float(v) for v in body.decode().split(",")]
+            if delta:
+                return len(values) % 2 == 0
+            return len(values) == codec.CHANNELS + 1
+        data = json.loads(body)
+        if delta:
+            return "seq" in data
+        return all(name in data for name in codec.NUM_NAMES + codec.BOOL_NAMES)
+    except ValueError:
+        return False
+
+
+def _reply_seq(body, compact):
+    if compact:
+        return body.split(b",", 1)[0].decode()
+    return str(json.loads(body)["seq"])
+
+
+class _Vehicle:
+    """One emulated Lua bridge."""
+
+    def __init__(self, number, base, host, port, report, interval, compact, delta,
+                 pipeline, page):
+        self.number = number
+        self.page = page
+        self.endpoint = base + ("c" if compact else "")
+        self.host = host
+        self.port = port
+        self.report = report
+        self.interval = interval
+        self.compact = compact
+        self.delta = delta
+        self.pipeline = pipeline
+        # one keep-alive connection per request in flight
+        self.idle = []
+        # same start values as sw.lua
+        self.tick_interval = 10
+        self.is_reply_pending = True
+        self.in_flight = 0
+        self.frame_seq = 0
+        self.applied_seq = 0
+        self.output_seq = 0
+        self.tick = 0
+
+    def inputs(self):
+        # smooth, vehicle specific signals with a few toggling switches
+        t = self.tick / 60.0 + self.number
+        nums = [round(math.sin(t * (i + 1) * 0.1) * (i + 1) * 10, 3) for i in range(codec.CHANNELS)]
+        bools = [(self.tick >> (i % 8)) & 1 == 1 for i in range(codec.CHANNELS)]
+        return nums, bools
+
+    def on_tick(self):
+        report = self.report
+        report.ticks += 1
+        self.tick += 1
+        if self.pipeline:
+            if self.in_flight < self.pipeline:
+                self.in_flight += 1
+                self.frame_seq += 1
+                return asyncio.ensure_future(self.transmit(self.frame_seq))
+            report.dropped_ticks += 1
+            return None
+        self.tick_interval -= 1
+        if self.tick_interval < 1:
+            if self.is_reply_pending:
+                self.tick_interval = self.interval
+                self.is_reply_pending = False
+                return asyncio.ensure_future(self.transmit())
+            report.dropped_ticks += 1
+        return None
+
+    async def transmit(self, frame_seq=None):
+        nums, bools = self.inputs()
+        if self.compact:
+            query = "d=" + codec.encode_frame(nums, bools)
+        else:
+            query = codec.encode_query(nums, bools)
+        if self.page:
+            query += f"&b={self.page}"
+        if frame_seq is not None:
+            query += f"&f={frame_seq}"
+        if self.delta:
+            query += f"&s={self.output_seq}" if self.compact else f"&seq={self.output_seq}"
+        report = self.report
+        report.requests += 1
+        connection = self.idle.pop() if self.idle else _Connection(self.host, self.port)
+        started = time.perf_counter()
+        try:
+            status, body = await connection.get(f"{self.endpoint}?{query}")
+        except (OSError, ValueError, asyncio.IncompleteReadError):
+            report.errors += 1
+            connection.close()
+        else:
+            self.idle.append(connection)
+            report.latencies.append(time.perf_counter() - started)
+            report.responses += 1
+            if status != 200 or not _valid_reply(body, self.compact, self.delta):
+                report.invalid += 1
+            elif frame_seq is not None and frame_seq <= self.applied_seq:
+                report.stale_replies += 1
+            else:
+                if frame_seq is not None:
+                    self.applied_seq = frame_seq
+                if self.delta:
+                    self.output_seq = _reply_seq(body, self.compact)
+        finally:
+            self.is_reply_pending = True
+            self.in_flight -= frame_seq is not None
+
+    def close(self):
+        for connection in self.idle:
+            connection.close()
+        self.idle.clear()
+
+
+async def simulate_async(host="localhost", port=5000, vehicles=1, duration=10.0,
+                         tick_rate=60.0, interval=5, compact=False, delta=False,
+                         names=None, pipeline=None, pages=1) -> SimulationReport:
+    """Run the simulation on the current event loop; see :func:`simulate`."""
+    report = SimulationReport(vehicles, duration)
+    fleet = []
+    for number in range(vehicles):
+        base = "/" if names is None else f"/{names[number % len(names)]}/"
+        fleet.append(_Vehicle(number, base, host, port, report,
+                              interval, compact, delta, pipeline, number % pages))
+
+    loop = asyncio.get_running_loop()
+    period = 1.0 / tick_rate
+    started = loop.time()
+    pending = set()
+    tick = 0
+    while True:
+        # ticks are scheduled on an absolute timeline so a slow loop catches up
+        tick += 1
+        due = started + tick * period
+        if due - started > duration:
+            break
+        delay = due - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        for vehicle in fleet:
+            task = vehicle.on_tick()
+            if task is not None:
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+    report.duration = loop.time() - started
+    # let requests still in flight finish so their latency is counted
+    if pending:
+        await asyncio.wait(pending, timeout=5.0)
+    for vehicle in fleet:
+        vehicle.close()
+    return report
+
+
+def simulate(host="localhost", port=5000, vehicles=1, duration=10.0, tick_rate=60.0,
+             interval=5, compact=False, delta=False, names=None,
+             pipeline=None, pages=1) -> SimulationReport:
+    """Emulate ``vehicles`` Lua bridges polling a server for ``duration`` seconds.
+
+    ``interval`` is the Lua ``tick_interval`` reset value, ``compact`` and
+    ``delta`` select the ``/c`` endpoint and delta replies like the script's
+    constants of the same name, and ``names`` spreads the vehicles over the
+    given :class:`~Stormworkspy.hub.StormworkspyHub` vehicle names.
+    ``pipeline`` emulates the script's ``PIPELINE`` mode with that many
+    requests in flight (``MAX_IN_FLIGHT``), and ``pages`` spreads the
+    vehicles over that many channel pages like bridges with different
+    ``PAGE`` settings.
+    """
+    return asyncio.run(simulate_async(host, port, vehicles, duration, tick_rate,
+                                      interval, compact, delta, names, pipeline, pages))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="localhost")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument("--vehicles", type=int, default=1)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--tick-rate", type=float, default=60.0)
+    parser.add_argument("--interval", type=int, default=5)
+    parser.add_argument("--compact", action="store_true")
+    parser.add_argument("--delta", action="store_true")
+    parser.add_argument("--names", nargs="+", help="hub vehicle names to spread the load over")
+    parser.add_argument("--pipeline", type=int, metavar="MAX_IN_FLIGHT",
+                        help="send every tick with up to this many requests in flight")
+    parser.add_argument("--pages", type=int, default=1,
+                        help="spread the vehicles over this many channel pages")
+    args = parser.parse_args(argv)
+    print(simulate(args.host, args.port, args.vehicles, args.duration, args.tick_rate,
+                   args.interval, args.compact, args.delta, args.names, args.pipeline,
+                   args.pages))
+
+
+if __name__ == "__main__":
+    main()
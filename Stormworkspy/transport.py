@@ -0,0 +1,242 @@
+"""HTTP transports that serve a request handler in the background.
+
+A handler is any object with a ``handle_request(path, query)`` method that
+returns ``(status, content_type, body)``; :class:`~Stormworkspy.Stormworkspy`
+is one.  Three backends are available:
+
+``flask``
+    The Flask app exposed as ``handler.app``, served by Werkzeug.
+``http``
+    A lean ``http.server`` handler speaking HTTP/1.1 with keep-alive.
+``asyncio``
+    A minimal HTTP/1.1 server on an asyncio event loop.
+"""
+
+import asyncio
+import logging
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from flask import Flask, Response, request
+from werkzeug.serving import make_server
+
+logger = logging.getLogger(__name__)
+
+
+def make_flask_app(handler, import_name=__name__):
+    """Create a Flask app that forwards every GET request to ``handler``."""
+    app = Flask(import_name)
+
+    @app.route('/', defaults={'path': ''}, methods=['GET'])
+    @app.route('/<path:path>', methods=['GET'])
+    def dispatch(path):
+        status, content_type, body = handler.handle_request(
+            '/' + path, request.query_string.decode('latin-1'))
+        return Response(body, status=status, mimetype=content_type)
+
+    return app
+
+
+def _dispatch(handler, path, query):
+    """Call ``handler``, answering 500 like Flask does if it raises."""
+    try:
+        return handler.handle_request(path, query)
+    except Exception:
+        logger.exception("error while handling %s", path)
+        return 500, 'text/plain', b'Internal Server Error'
+
+
+def _http_response(status, content_type, body, keep_alive=True):
+    """Serialise a complete HTTP/1.1 response."""
+    head = (
+        f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+        f"Content-Type: {content_type}\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode('latin-1') + body
+
+
+class Transport:
+    """Base class for background HTTP servers."""
+    name = None
+
+    def __init__(self, handler, host='localhost', port=5000, debug=False):
+        self.handler = handler
+        self.host = host
+        self.port = port
+        self.debug = debug
+        self.thread = None
+
+    def start(self):
+        raise NotImplementedError
+
+    def stop(self):
+        raise NotImplementedError
+
+
+class FlaskTransport(Transport):
+    """Serve ``handler.app`` with Werkzeug's threaded server."""
+    name = 'flask'
+
+    def start(self):
+        app = getattr(self.handler, 'app', None) or make_flask_app(self.handler)
+        app.debug = self.debug
+        self._server = make_server(self.host, self.port, app, threaded=True)
+        self.thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self.thread.join()
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        path, _, query = self.path.partition('?')
+        status, content_type, body = _dispatch(self.server.handler, path, query)
+        self.wfile.write(_http_response(status, content_type, body, not self.close_connection))
+
+    def log_message(self, format, *args):
+        pass
+
+
+class HTTPServerTransport(Transport):
+    """Serve the handler with ``http.server``, one thread per connection."""
+    name = 'http'
+
+    def start(self):
+        self._server = ThreadingHTTPServer((self.host, self.port), _RequestHandler)
+        self._server.daemon_threads = True
+        self._server.handler = self.handler
+        self.thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self.thread.join()
+
+
+class AsyncioTransport(Transport):
+    """Serve the handler from an asyncio event loop.
+
+    :meth:`start` runs a private loop in a background thread; code that
+    already runs an event loop can ``await serve()`` and ``await close()``
+    instead.
+    """
+    name = 'asyncio'
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._server = None
+        self._loop = None
+        self._clients = {}
+
+    async def serve(self):
+        """Start listening on the current event loop."""
+        self._server = await asyncio.start_server(self._client, self.host, self.port)
+
+    async def close(self):
+        self._server.close()
+        # closing the sockets ends each client loop at its next read
+        clients = list(self._clients)
+        for writer in self._clients.values():
+            writer.close()
+        await asyncio.gather(*clients, return_exceptions=True)
+        await self._server.wait_closed()
+
+    async def _client(self, reader, writer):
+        handler = self.handler
+        task = asyncio.current_task()
+        self._clients[task] = writer
+        try:
+            while True:
+                try:
+                    # readline raises ValueError past the stream limit
+                    line = await reader.readline()
+                    if not line:
+                        break
+                    method, target, version = line.decode('latin-1').split(' ', 2)
+                    keep_alive = version.strip() == 'HTTP/1.1'
+                    length = 0
+                    while True:
+                        header = await reader.readline()
+                        if header in (b'\r\n', b'\n', b''):
+                            break
+                        key, _, value = header.decode('latin-1').partition(':')
+                        key = key.strip().lower()
+                        value = value.strip().lower()
+                        if key == 'connection':
+                            keep_alive = value == 'keep-alive' or (keep_alive and value != 'close')
+                        elif key == 'content-length':
+                            length = int(value)
+                except ValueError:
+                    # too long or not HTTP; answer and drop the connection
+                    writer.write(_http_response(400, 'text/plain', b'Bad Request', False))
+                    await writer.drain()
+                    break
+                if length:
+                    await reader.readexactly(length)
+
+                if method == 'GET':
+                    path, _, query = target.partition('?')
+                    status, content_type, body = _dispatch(handler, path, query)
+                else:
+                    status, content_type, body = 405, 'text/plain', b'Method Not Allowed'
+                writer.write(_http_response(status, content_type, body, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._clients.pop(task, None)
+            writer.close()
+
+    def start(self):
+        ready = threading.Event()
+        error = []
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            try:
+                self._loop.run_until_complete(self.serve())
+            except OSError as exc:
+                error.append(exc)
+                self._loop.close()
+                return
+            finally:
+                ready.set()
+            self._loop.run_forever()
+            self._loop.run_until_complete(self.close())
+            self._loop.close()
+
+        self.thread = threading.Thread(target=run, daemon=True)
+        self.thread.start()
+        ready.wait()
+        if error:
+            raise error[0]
+
+    def stop(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self.thread.join()
+
+
+TRANSPORTS = {
+    cls.name: cls for cls in (FlaskTransport, HTTPServerTransport, AsyncioTransport)
+}
+
+
+def start_transport(handler, host, port, debug=False, backend='flask'):
+    """Create the ``backend`` transport for ``handler`` and start it."""
+    if backend not in TRANSPORTS:
+        raise ValueError(f"Unknown backend {backend!r}")
+    transport = TRANSPORTS[backend](handler, host, port, debug)
+    transport.start()
+    return transport
@@ -0,0 +1,106 @@
+"""Vectorised views of channels and sensors, across one or many vehicles.
+
+Needs NumPy, which the rest of the package does not. Channel banks stay
+plain lists, because every slot carries the write version that delta
+replies rely on. The functions here copy consistent snapshots into arrays
+instead: one row per vehicle, one column per channel. All derived
+quantities work on arrays of any shape, so a whole fleet is one call::
+
+    nums, bools = fleet_arrays(hub)
+    gps = sensor_arrays(hub, "gps")
+    moved = gps_distance(last["x"], last["y"], gps["x"], gps["y"])
+"""
+
+import numpy as np
+
+from .sensors import BOOL
+
+
+def frame_arrays(frame):
+    """Return ``(nums, bools)`` of a :class:`~Stormworkspy.channels.Frame` as arrays."""
+    return np.array(frame.nums, dtype=np.float64), np.array(frame.bools, dtype=bool)
+
+
+def _instances(source):
+    vehicles = getattr(source, "vehicles", None)
+    if vehicles is not None:
+        return list(vehicles.values())
+    return list(source)
+
+
+def fleet_arrays(source):
+    """Stack the latest inputs of many instances into ``(vehicles, channels)`` arrays.
+
+    ``source`` is a :class:`~Stormworkspy.StormworkspyHub` or an iterable of
+    ``Stormworkspy`` instances; rows follow its order. Every row comes from
+    one snapshot, so the numbers and booleans of a vehicle always match.
+    """
+    frames = [sw.snapshot() for sw in _instances(source)]
+    width = max((len(frame.nums) for frame in frames), default=0)
+    nums = np.zeros((len(frames), width), dtype=np.float64)
+    bools = np.zeros((len(frames), width), dtype=bool)
+    for row, frame in enumerate(frames):
+        nums[row, :len(frame.nums)] = frame.nums
+        bools[row, :len(frame.bools)] = frame.bools
+    return nums, bools
+
+
+def sensor_columns(sensor, nums, bools):
+    """Return ``{field: array}`` for ``sensor`` read from channel arrays.
+
+    The channels are the last axis, so ``nums`` may be one frame or a
+    fleet. The arrays are views, not copies. Unwired fields are left out.
+    """
+    columns = {}
+    for name, kind, _ in sensor.FIELDS:
+        channel = getattr(sensor, "channel_" + name)
+        if channel is not None and channel >= 0:
+            columns[name] = (bools if kind == BOOL else nums)[..., channel]
+    return columns
+
+
+def sensor_arrays(source, name):
+    """Return ``{field: array}`` of the sensor ``name`` registered on every instance.
+
+    Each vehicle may wire the sensor to different channels. Numeric fields
+    a vehicle does not wire read as NaN and boolean ones as False.
+    """
+    instances = _instances(source)
+    if not instances:
+        return {}
+    nums, bools = fleet_arrays(instances)
+    rows = np.arange(len(instances))
+    sensors = [sw.sensors[name] for sw in instances]
+    columns = {}
+    for field, kind, _ in type(sensors[0]).FIELDS:
+        channels = [getattr(sensor, "channel_" + field) for sensor in sensors]
+        channels = np.array([-1 if channel is None else channel for channel in channels])
+        wired = channels >= 0
+        if kind == BOOL:
+            column = np.zeros(len(instances), dtype=bool)
+            column[wired] = bools[rows[wired], channels[wired]]
+        else:
+            column = np.full(len(instances), np.nan)
+            column[wired] = nums[rows[wired], channels[wired]]
+        columns[field] = column
+    return columns
+
+
+def gps_distance(x1, y1, x2, y2):
+    """Distance in metres between GPS fixes ``(x1, y1)`` and ``(x2, y2)``."""
+    return np.hypot(np.subtract(x2, x1), np.subtract(y2, y1))
+
+
+def heading_delta(before, after):
+    """Signed change between compass headings, in turns within [-0.5, 0.5).
+
+    Compass sensors report -0.5 to 0.5 turns, so the difference is wrapped
+    across north.
+    """
+    return (np.subtract(after, before) + 0.5) % 1.0 - 0.5
+
+
+def velocity_magnitude(vx, vy, vz=0.0):
+    """Speed from velocity components, such as a physics sensor's ``vel_*``."""
+    vx, vy, vz = np.asarray(vx), np.asarray(vy), np.asarray(vz)
+    return np.sqrt(vx * vx + vy * vy + vz * vz)
@@ -0,0 +1,60 @@
+"""Micro-benchmark of the ``/`` request handler.
+
+Compares the original handler (``request.args``-style lookups of 64 keys,
+per-request f-strings and ``json.dumps`` of a fresh dict) with
+``Stormworkspy.handle_request``.  Both run in-process without HTTP.  The
+original handler writes into plain lists, as it did before channel banks
+carried write versions, so the comparison does not charge it for them.
+
+    python benchmarks/bench_query_parse.py
+"""
+
+import json
+import timeit
+from urllib.parse import parse_qsl
+
+from werkzeug.datastructures import MultiDict
+
+from Stormworkspy import Stormworkspy
+
+QUERY = "&".join(
+    [f"num{i}={i * 1.25}" for i in range(1, 33)]
+    + [f"bool{i}={'true' if i % 2 else 'false'}" for i in range(1, 33)]
+)
+
+
+def legacy_handler(state, query):
+    """The handler as it was before the single-pass parser."""
+    innums, inbools, outnums, outbools = state
+    args = MultiDict(parse_qsl(query, keep_blank_values=True))
+    for i in range(1, 33):
+        param = f'num{i}'
+        try:
+            innums[i - 1] = float(args.get(param, 0.0))
+        except ValueError:
+            innums[i - 1] = 0.0
+    for i in range(1, 33):
+        param = f'bool{i}'
+        bool_str = args.get(param, "false").lower()
+        inbools[i - 1] = bool_str in ["true", "1", "yes"]
+    response_data = {}
+    for i in range(1, 33):
+        response_data[f'num{i}'] = outnums[i - 1]
+        response_data[f'bool{i}'] = str(outbools[i - 1]).lower()
+    return json.dumps(response_data).encode()
+
+
+def main(number=20000):
+    sw = Stormworkspy()
+    state = ([0.0] * 32, [False] * 32, [0.0] * 32, [False] * 32)
+    results = {
+        "before": timeit.timeit(lambda: legacy_handler(state, QUERY), number=number),
+        "after": timeit.timeit(lambda: sw.handle_request('/', QUERY), number=number),
+    }
+    for label, seconds in results.items():
+        print(f"{label:>6}: {number / seconds:10.0f} requests/s  ({seconds / number * 1e6:.1f} us/request)")
+    print(f"speed-up: {results['before'] / results['after']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
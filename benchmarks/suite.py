@@ -0,0 +1,243 @@
+"""Benchmark suite for the request path, named channels and sensors.
+
+Every case is timed in batches; the per-operation times of the batches give
+the median and the latency percentiles.  Results can be saved as JSON and
+compared against the file of another commit::
+
+    python benchmarks/suite.py --output before.json
+    git checkout my-branch
+    python benchmarks/suite.py --output after.json --compare before.json
+
+``--compare`` exits with status 1 when a case got slower than
+``--threshold`` (10% by default).  ``--filter`` runs only the cases whose
+name contains the given text.
+"""
+
+import argparse
+import http.client
+import inspect
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+from Stormworkspy import Stormworkspy, codec, sensors
+
+QUERY = codec.encode_query(
+    [i * 1.25 for i in range(1, 33)], [i % 2 == 1 for i in range(1, 33)])
+COMPACT_QUERY = "d=" + codec.encode_frame(
+    [i * 1.25 for i in range(1, 33)], [i % 2 == 1 for i in range(1, 33)])
+HTTP_PORT = 5690
+
+
+class Case:
+    """One benchmark: ``func`` is called ``inner`` times per timed batch."""
+
+    def __init__(self, name, func, inner=1000, setup=None, teardown=None):
+        self.name = name
+        self.func = func
+        self.inner = inner
+        self.setup = setup
+        self.teardown = teardown
+
+    def run(self, seconds):
+        if self.setup is not None:
+            self.setup()
+        try:
+            func = self.func
+            loop = range(self.inner)
+            for _ in loop:  # warm up caches and lazily compiled code
+                func()
+            samples = []
+            deadline = time.perf_counter() + seconds
+            while time.perf_counter() < deadline or len(samples) < 5:
+                start = time.perf_counter_ns()
+                for _ in loop:
+                    func()
+                samples.append((time.perf_counter_ns() - start) / self.inner)
+        finally:
+            if self.teardown is not None:
+                self.teardown()
+        samples.sort()
+
+        def percentile(p):
+            return samples[min(len(samples) - 1, int(len(samples) * p / 100))]
+
+        median = statistics.median(samples)
+        return {
+            "ns_per_op": median,
+            "ops_per_s": 1e9 / median if median else None,
+            "min": samples[0],
+            "p50": percentile(50),
+            "p90": percentile(90),
+            "p99": percentile(99),
+            "batches": len(samples),
+            "inner": self.inner,
+        }
+
+
+def request_cases():
+    sw = Stormworkspy()
+    client = sw.app.test_client()
+    cases = [
+        Case("request.json", lambda: sw.handle_request("/", QUERY), inner=1),
+        Case("request.json_delta", lambda: sw.handle_request("/", QUERY + "&seq=0"), inner=1),
+        Case("request.compact", lambda: sw.handle_request("/c", COMPACT_QUERY), inner=1),
+        Case("request.flask_test_client", lambda: client.get("/?" + QUERY), inner=1),
+    ]
+
+    server = Stormworkspy()
+    connection = http.client.HTTPConnection("localhost", HTTP_PORT)
+
+    def get():
+        connection.request("GET", "/?" + QUERY)
+        connection.getresponse().read()
+
+    def start():
+        server.run_api(port=HTTP_PORT, backend="http")
+
+    def stop():
+        connection.close()
+        server.stop_api()
+
+    cases.append(Case("request.http_keepalive", get, inner=1, setup=start, teardown=stop))
+    return cases
+
+
+def named_channel_cases():
+    sw = Stormworkspy()
+    sw.set_num_output("motor", 3)
+    sw.set_bool_output("lamp", 3)
+    sw.set_num_input("speed", 3)
+    sw.set_bool_input("gear", 3)
+
+    def set_motor():
+        sw.motor = 1.5
+
+    return [
+        Case("named.get_num_output", lambda: sw.motor),
+        Case("named.set_num_output", set_motor),
+        Case("named.get_bool_output", lambda: sw.lamp),
+        Case("named.get_num_input", lambda: sw.speed),
+        Case("named.get_bool_input", lambda: sw.gear),
+        Case("named.index_outnums", lambda: sw.outnums[3]),
+    ]
+
+
+def _wired(cls):
+    """Instantiate ``cls`` with its fields wired to consecutive channels."""
+    channels = {"num": 0, "bool": 0}
+    kwargs = {}
+    for name, kind, _ in cls.FIELDS:
+        channels[kind] += 1
+        kwargs[f"channel_{name}"] = channels[kind]
+    return cls(**kwargs)
+
+
+def sensor_cases():
+    nums = [i * 0.5 for i in range(32)]
+    bools = [i % 2 == 0 for i in range(32)]
+    classes = [
+        cls for name, cls in inspect.getmembers(sensors, inspect.isclass)
+        if name.startswith("SW_") and issubclass(cls, sensors.Sensor)
+    ]
+    cases = []
+    for cls in classes:
+        sensor = _wired(cls)
+        cases.append(Case(f"sensor.{cls.__name__}.update",
+                          lambda update=sensor.update: update(nums, bools)))
+
+    # reading a registered sensor right after a new frame refreshes all of them
+    sw = Stormworkspy()
+    for cls in classes:
+        sensor = _wired(cls)
+        sw.register_sensor(cls.__name__, cls, **{
+            f"channel_{name}": getattr(sensor, f"channel_{name}") + 1
+            for name, _, _ in cls.FIELDS
+        })
+
+    def refresh_all():
+        sw.innums[0] = 1.0
+        return sw.SW_GPS
+
+    cases.append(Case("sensor.refresh_all_registered", refresh_all))
+    return cases
+
+
+def all_cases():
+    return request_cases() + named_channel_cases() + sensor_cases()
+
+
+def _commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(cases, seconds):
+    results = {}
+    for case in cases:
+        result = case.run(seconds)
+        results[case.name] = result
+        print(f"{case.name:<40} {result['ns_per_op'] / 1000:10.3f} us/op"
+              f"  p99 {result['p99'] / 1000:10.3f} us")
+    return {
+        "meta": {
+            "commit": _commit(),
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def compare(baseline, current, threshold):
+    """Print the change per case and return the names that regressed."""
+    regressions = []
+    print(f"\n{'case':<40} {'before':>10} {'after':>10} {'change':>8}")
+    for name, result in current["results"].items():
+        old = baseline["results"].get(name)
+        if old is None:
+            continue
+        ratio = result["ns_per_op"] / old["ns_per_op"]
+        flag = ""
+        if ratio > 1 + threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<40} {old['ns_per_op'] / 1000:10.3f} {result['ns_per_op'] / 1000:10.3f}"
+              f" {(ratio - 1) * 100:+7.1f}%{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stormworkspy benchmark suite")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="compare against a previous JSON result file")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="slowdown counted as a regression (default 0.10)")
+    parser.add_argument("--filter", default="", help="only run cases containing this text")
+    parser.add_argument("--seconds", type=float, default=0.5, help="time per case")
+    args = parser.parse_args(argv)
+
+    cases = [case for case in all_cases() if args.filter in case.name]
+    report = run(cases, args.seconds)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(baseline, report, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
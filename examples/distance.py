@@ -1,5 +1,4 @@
 import os
-import time
 
 from Stormworkspy.Stormworkspy import Stormworkspy
 from Stormworkspy.sensors import SW_LaserDistanceSensor
@@ -14,6 +13,10 @@ sw.run_api(host="0.0.0.0", port=5000, debug=False)
 
 try:
     while True:
+        # block until the game sends the next frame instead of sleeping
+        if sw.wait_for_frame(timeout=1.0) is None:
+            continue
+
         # fetch the latest value (accessing sw.distance auto-updates the sensor)
         dist = sw.distance.get_distance()
 
@@ -21,8 +24,5 @@ try:
         print(f"Laser distance on channel 2 → {dist}")
         print(f"raw numeric buffer        → {sw.innums}")
 
-        # give Flask a chance to run & keep output readable
-        time.sleep(0.1)
-
 except KeyboardInterrupt:
     sw.stop_api()
@@ -13,6 +13,9 @@ setup(
     install_requires=[                   # List any dependencies your package needs
         'Flask'
     ],
+    extras_require={                     # optional array helpers (Stormworkspy.vector)
+        'numpy': ['numpy'],
+    },
     classifiers=[                        # Additional metadata about your package
         'Programming Language :: Python :: 3',
         'License :: OSI Approved :: MIT License',  # Change if using another license
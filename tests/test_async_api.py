@@ -0,0 +1,96 @@
+import unittest
+import asyncio
+from Stormworkspy import Stormworkspy, StormworkspyHub
+from Stormworkspy.sensors import SW_GPS
+
+
+async def get(port, target):
+    reader, writer = await asyncio.open_connection("localhost", port)
+    writer.write(f"GET {target} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n".encode())
+    response = await reader.read()
+    writer.close()
+    return response.partition(b"\r\n\r\n")[2]
+
+
+class TestAsyncAPI(unittest.TestCase):
+    def test_start_and_next_frame(self):
+        async def main():
+            sw = Stormworkspy()
+            sw.outnums[0] = 3.0
+            await sw.start(port=5651)
+            try:
+                waiter = asyncio.create_task(sw.next_frame(timeout=2))
+                await asyncio.sleep(0)
+                body = await get(5651, "/c?d=1.5")
+                frame = await waiter
+            finally:
+                await sw.stop()
+            self.assertTrue(body.startswith(b"3.0,"))
+            self.assertEqual(frame.nums[0], 1.5)
+            self.assertIsNone(await sw.next_frame(timeout=0.01))
+
+        asyncio.run(main())
+
+    def test_read_sensor(self):
+        async def main():
+            sw = Stormworkspy()
+            sw.register_sensor("gps", SW_GPS, channel_x=1, channel_y=2)
+            reader = asyncio.create_task(sw.read_sensor("gps", fresh=True))
+            await asyncio.sleep(0)
+            self.assertFalse(reader.done())
+            sw.handle_request("/", "num1=4&num2=5")
+            gps = await reader
+            self.assertEqual(gps.get_position(), (4.0, 5.0))
+            with self.assertRaises(KeyError):
+                await sw.read_sensor("missing")
+
+        asyncio.run(main())
+
+    def test_controllers_share_one_loop(self):
+        async def controller(sw, frames):
+            frame = await sw.next_frame(timeout=2)
+            sw.outnums[0] = frame.nums[0] * 2
+            frames.append(frame)
+
+        async def main():
+            hub = StormworkspyHub()
+            truck, boat = hub.create("truck"), hub.create("boat")
+            await hub.start(port=5652)
+            frames = []
+            try:
+                tasks = [asyncio.create_task(controller(sw, frames)) for sw in (truck, boat)]
+                await asyncio.sleep(0)
+                await get(5652, "/truck/c?d=1")
+                await get(5652, "/boat/c?d=2")
+                await asyncio.gather(*tasks)
+            finally:
+                await hub.stop()
+            self.assertEqual(len(frames), 2)
+            self.assertEqual((truck.outnums[0], boat.outnums[0]), (2.0, 4.0))
+
+        asyncio.run(main())
+
+    def test_timed_out_waiters_are_dropped(self):
+        sw = Stormworkspy()
+        fired = []
+        sw.on_num_input_change(0, lambda old, new: fired.append(new))
+
+        async def main():
+            for _ in range(3):
+                self.assertIsNone(await sw.next_frame(timeout=0.01))
+
+        asyncio.run(main())
+        self.assertEqual(sw._async_waiters, [])
+        self.assertEqual(sw.handle_request("/", "num1=1")[0], 200)
+        self.assertEqual(fired, [1.0])
+
+    def test_closed_loop_does_not_fail_requests(self):
+        sw = Stormworkspy()
+        loop = asyncio.new_event_loop()
+        sw._async_waiters.append((loop, loop.create_future()))
+        loop.close()
+        self.assertEqual(sw.handle_request("/", "num1=1")[0], 200)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import json
+import unittest
+from Stormworkspy import Stormworkspy
+
+
+def reply(sw, query=""):
+    return json.loads(sw.handle_request("/", query)[2])
+
+
+class TestBatchOutputs(unittest.TestCase):
+    def test_replies_see_all_or_nothing(self):
+        sw = Stormworkspy()
+        sw.set_num_output("motor")
+        with sw.batch():
+            sw.motor = 11
+            sw.outnums[3] = 4
+            sw.outbools[1] = True
+            self.assertEqual(sw.motor, 11)
+            mid = reply(sw)
+        after = reply(sw)
+        self.assertEqual((mid["num1"], mid["num4"], mid["bool2"]), (0.0, 0.0, "false"))
+        self.assertEqual((after["num1"], after["num4"], after["bool2"]), (11, 4, "true"))
+
+    def test_delta_carries_the_batch_once(self):
+        sw = Stormworkspy()
+        seq = reply(sw, "seq=0")["seq"]
+        with sw.batch():
+            sw.outnums[0] = 1
+            seq_mid = reply(sw, f"seq={seq}")
+            self.assertNotIn("num1", seq_mid)
+            sw.outnums[5] = 2
+        delta = reply(sw, f"seq={seq_mid['seq']}")
+        self.assertEqual((delta["num1"], delta["num6"]), (1, 2))
+        self.assertNotIn("num1", reply(sw, f"seq={delta['seq']}"))
+
+    def test_exception_discards_staged_writes(self):
+        sw = Stormworkspy()
+        sw.outnums[0] = 1
+        with self.assertRaises(RuntimeError):
+            with sw.batch():
+                sw.outnums[0] = 2
+                with sw.batch():
+                    sw.outnums[1] = 3
+                raise RuntimeError
+        self.assertEqual(sw.outnums[:2], [1, 0.0])
+        self.assertEqual(reply(sw)["num1"], 1)
+
+    def test_write_outputs(self):
+        sw = Stormworkspy()
+        sw.set_num_output("motor", index=2)
+        sw.set_bool_output("lamp")
+        sw.set_num_input("speed")
+        sw.write_outputs({"motor": 5, "lamp": True})
+        self.assertEqual((sw.outnums[2], sw.outbools[0]), (5, True))
+        with self.assertRaises(KeyError):
+            sw.write_outputs({"motor": 6, "speed": 1})
+        self.assertEqual(sw.motor, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+import time
+import urllib.request
+from Stormworkspy import Stormworkspy
+from Stormworkspy import codec
+
+
+class TestCodec(unittest.TestCase):
+    def test_round_trip(self):
+        nums = [float(i) / 4 for i in range(32)]
+        bools = [i % 3 == 0 for i in range(32)]
+        decoded_nums, decoded_bools = codec.decode_frame(codec.encode_frame(nums, bools))
+        self.assertEqual(decoded_nums, nums)
+        self.assertEqual(decoded_bools, bools)
+
+    def test_bool_mask(self):
+        self.assertEqual(codec.pack_bools([True, False, True]), 5)
+        self.assertEqual(codec.unpack_bools(5, 3), [True, False, True])
+
+    def test_malformed_values(self):
+        nums, bools = codec.decode_frame("1.5,abc")
+        self.assertEqual(nums[:3], [1.5, 0.0, 0.0])
+        self.assertEqual(bools, [False] * 32)
+
+    def test_none_encodes_as_zero(self):
+        nums = [None, 1.5] + [0.0] * 30
+        body = codec.encode_frame(nums, [False] * 32)
+        self.assertTrue(body.startswith("0,1.5,"))
+        self.assertEqual(codec.decode_frame(body)[0][:2], [0.0, 1.5])
+        self.assertEqual(codec.encode_delta(7, nums, [False] * 32, [0]), "7,0,1,0")
+
+
+class TestCompactEndpoint(unittest.TestCase):
+    def test_none_output(self):
+        sw = Stormworkspy()
+        sw.outnums[3] = None
+        seq = sw.handle_request("/c", "d=&s=0")[2].split(b",")[0].decode()
+        status, _, body = sw.handle_request("/c", "d=")
+        self.assertEqual(status, 200)
+        self.assertEqual(codec.decode_frame(body.decode())[0][3], 0.0)
+        sw.outnums[4] = None
+        self.assertEqual(sw.handle_request("/c", "d=&s=" + seq)[2].split(b",")[2:], [b"5", b"0"])
+
+    def test_compact_updates_and_returns(self):
+        sw = Stormworkspy()
+        sw.outnums[1] = 2.5
+        sw.outbools[2] = True
+        sw.run_api(host="127.0.0.1", port=5603)
+        time.sleep(0.5)
+        frame = codec.encode_frame([42.0, -1.25] + [0.0] * 30, [True, True] + [False] * 30)
+        with urllib.request.urlopen("http://127.0.0.1:5603/c?d=" + frame) as resp:
+            body = resp.read().decode()
+        nums, bools = codec.decode_frame(body)
+        self.assertEqual(nums[1], 2.5)
+        self.assertTrue(bools[2])
+        self.assertEqual(sw.innums[:3], [42.0, -1.25, 0.0])
+        self.assertEqual(sw.inbools[:3], [True, True, False])
+
+
+if __name__ == "__main__":
+    unittest.main()
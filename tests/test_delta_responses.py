@@ -0,0 +1,113 @@
+import unittest
+from Stormworkspy import Stormworkspy
+from Stormworkspy import codec
+from Stormworkspy.channels import ChannelBank, VersionClock
+
+
+class TestChannelBank(unittest.TestCase):
+    def test_tracks_writes(self):
+        clock = VersionClock()
+        bank = ChannelBank([0.0] * 4, clock)
+        seq = clock.value
+        bank[2] = 1.0
+        self.assertEqual(bank.changed_since(seq), [2])
+        bank[:] = [1.0, 2.0, 3.0, 4.0]
+        self.assertEqual(bank.changed_since(seq), [0, 1, 2, 3])
+        with self.assertRaises(ValueError):
+            bank[:] = [1.0]
+
+    def test_same_value_is_not_a_change(self):
+        clock = VersionClock()
+        bank = ChannelBank([0.0, 5.0, 0.0], clock)
+        seq = clock.value
+        bank[1] = 5.0
+        bank[:] = [0.0, 5.0, 1.0]
+        self.assertEqual(bank.changed_since(seq), [2])
+
+    def test_fixed_size(self):
+        clock = VersionClock()
+        bank = ChannelBank([3.0, 1.0, 2.0], clock)
+        for change in (lambda: bank.append(1.0), lambda: bank.extend([1.0]),
+                       lambda: bank.insert(0, 1.0), bank.pop, bank.clear):
+            with self.assertRaises(TypeError):
+                change()
+        with self.assertRaises(TypeError):
+            del bank[0]
+        with self.assertRaises(TypeError):
+            bank += [1.0]
+        self.assertEqual(len(bank), 3)
+
+    def test_reordering_stamps_versions(self):
+        clock = VersionClock()
+        bank = ChannelBank([3.0, 1.0, 2.0], clock)
+        seq = clock.value
+        bank.sort()
+        self.assertEqual(bank, [1.0, 2.0, 3.0])
+        self.assertEqual(bank.changed_since(seq), [0, 1, 2])
+        seq = clock.value
+        bank.reverse()
+        self.assertEqual(bank.changed_since(seq), [0, 1, 2])
+
+
+class TestDeltaResponses(unittest.TestCase):
+    def setUp(self):
+        self.sw = Stormworkspy()
+        self.client = self.sw.app.test_client()
+
+    def test_json_delta(self):
+        full = self.client.get("/?seq=0").get_json()
+        self.assertEqual(len(full), 65)
+
+        self.sw.set_num_output("oMotor", index=3)
+        self.sw.oMotor = 7.5
+        self.sw.outbools[1] = True
+        delta = self.client.get(f"/?seq={full['seq']}").get_json()
+        self.assertEqual(set(delta), {"seq", "num4", "bool2"})
+        self.assertEqual(delta["num4"], 7.5)
+
+        unchanged = self.client.get(f"/?seq={delta['seq']}").get_json()
+        self.assertEqual(unchanged, {"seq": delta["seq"]})
+
+    def test_full_and_delta_coerce_numbers_alike(self):
+        seq = self.client.get("/?seq=0").get_json()["seq"]
+        self.sw.outnums[0] = 11
+        self.sw.outnums[1] = None
+        full = self.client.get("/").get_json()
+        delta = self.client.get(f"/?seq={seq}").get_json()
+        for data in (full, delta):
+            self.assertEqual(repr(data["num1"]), "11.0")
+            self.assertIsNone(data["num2"])
+
+    def test_reasserted_output_leaves_delta_empty(self):
+        self.sw.set_num_output("m")
+        self.sw.m = 5.0
+        seq = self.client.get("/?seq=0").get_json()["seq"]
+        self.sw.m = 5.0
+        self.assertEqual(self.client.get(f"/?seq={seq}").get_json(), {"seq": seq})
+        compact = self.sw.handle_request("/c", f"d=&s={seq}")[2]
+        self.assertEqual(compact, f"{seq},0".encode())
+
+    def test_stale_sequence_gets_snapshot(self):
+        data = self.client.get("/?seq=12345").get_json()
+        self.assertEqual(len(data), 65)
+
+    def test_list_assignment_keeps_tracking(self):
+        seq = self.client.get("/?seq=0").get_json()["seq"]
+        self.sw.outnums = [1.0] * 32
+        delta = self.client.get(f"/?seq={seq}").get_json()
+        self.assertEqual(len(delta), 33)
+
+    def test_compact_delta(self):
+        nums, bools = [0.0] * 32, [False] * 32
+        seq = codec.apply_delta(self.client.get("/c?s=0").get_data(as_text=True), nums, bools)
+        self.sw.outnums[5] = 2.5
+        self.sw.outbools[0] = True
+        body = self.client.get(f"/c?s={seq}").get_data(as_text=True)
+        self.assertEqual(body.split(",")[2:], ["6", "2.5"])
+        codec.apply_delta(body, nums, bools)
+        self.assertEqual(nums[5], 2.5)
+        self.assertTrue(bools[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+import asyncio
+import threading
+from Stormworkspy import Stormworkspy
+
+
+class TestFrameEvents(unittest.TestCase):
+    def test_wait_for_frame(self):
+        sw = Stormworkspy()
+        self.assertIsNone(sw.wait_for_frame(timeout=0.01))
+        timer = threading.Timer(0.05, sw.handle_request, ("/", "num1=3"))
+        timer.start()
+        frame = sw.wait_for_frame(timeout=2)
+        timer.join()
+        self.assertEqual(frame.counter, 1)
+        self.assertEqual(frame.nums[0], 3.0)
+
+    def test_wait_after_returns_missed_frame(self):
+        sw = Stormworkspy()
+        sw.handle_request("/", "num1=1")
+        self.assertEqual(sw.wait_for_frame(timeout=0.01, after=0).counter, 1)
+
+    def test_async_frames(self):
+        sw = Stormworkspy()
+
+        async def consume():
+            loop = asyncio.get_running_loop()
+            loop.call_later(0.01, lambda: threading.Thread(
+                target=sw.handle_request, args=("/", "num2=5")).start())
+            async for frame in sw.frames():
+                return frame
+
+        frame = asyncio.run(asyncio.wait_for(consume(), 2))
+        self.assertEqual(frame.nums[1], 5.0)
+
+    def test_change_callbacks(self):
+        sw = Stormworkspy()
+        sw.set_bool_input("iGear", index=2)
+        changes = []
+        sw.on_num_input_change(0, lambda old, new: changes.append(("num1", old, new)))
+        sw.on_bool_input_change("iGear", lambda old, new: changes.append(("gear", old, new)))
+        sw.handle_request("/", "num1=1&bool3=true")
+        sw.handle_request("/", "num1=1&bool3=true")
+        sw.handle_request("/", "num1=2")
+        self.assertEqual(changes, [
+            ("num1", 0.0, 1.0), ("gear", False, True),
+            ("num1", 1.0, 2.0), ("gear", True, False),
+        ])
+
+    def test_unknown_input_name(self):
+        with self.assertRaises(KeyError):
+            Stormworkspy().on_num_input_change("missing", print)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+import http.client
+import json
+from Stormworkspy import Stormworkspy, StormworkspyHub
+
+
+class TestHub(unittest.TestCase):
+    def setUp(self):
+        self.hub = StormworkspyHub()
+        self.truck = self.hub.create("truck")
+        self.boat = self.hub.add(Stormworkspy("boat"))
+        self.boat.outnums[0] = 9.0
+
+    def test_route_by_path(self):
+        status, _, body = self.hub.handle_request("/truck/", "num1=4")
+        self.assertEqual(status, 200)
+        self.assertEqual(self.truck.innums[0], 4.0)
+        self.assertEqual(self.boat.innums[0], 0.0)
+        status, _, body = self.hub.handle_request("/boat/c", "d=1")
+        self.assertEqual(body.decode().split(",")[0], "9.0")
+        self.assertEqual(self.boat.innums[0], 1.0)
+
+    def test_route_by_parameter(self):
+        status, _, body = self.hub.handle_request("/", "vehicle=boat&num2=3")
+        self.assertEqual(json.loads(body)["num1"], 9.0)
+        self.assertEqual(self.boat.innums[1], 3.0)
+
+    def test_unknown_vehicle(self):
+        self.assertEqual(self.hub.handle_request("/plane/", "")[0], 404)
+        self.assertEqual(self.hub.handle_request("/", "vehicle=plane")[0], 404)
+        with self.assertRaises(ValueError):
+            self.hub.create("truck")
+
+    def test_served_over_http(self):
+        self.hub.run_api(host="127.0.0.1", port=5621, backend="http")
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", 5621)
+            for name, value in (("truck", 1), ("boat", 2)):
+                conn.request("GET", f"/{name}/?num1={value}")
+                conn.getresponse().read()
+            conn.close()
+        finally:
+            self.hub.stop_api()
+        self.assertEqual(self.truck.innums[0], 1.0)
+        self.assertEqual(self.boat.innums[0], 2.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+from Stormworkspy import Stormworkspy
+from Stormworkspy.sensors import SW_Altimeter
+
+
+class CountingAltimeter(SW_Altimeter):
+    def __init__(self, **channels):
+        super().__init__(**channels)
+        self.updates = 0
+
+    def update(self, num_channels, bool_channels):
+        self.updates += 1
+        super().update(num_channels, bool_channels)
+
+
+class TestLazySensors(unittest.TestCase):
+    def test_updates_once_per_frame(self):
+        sw = Stormworkspy()
+        sensor = sw.register_sensor("alt", CountingAltimeter, channel_altitude=1)
+        for _ in range(3):
+            sw.alt.get_altitude()
+        self.assertEqual(sensor.updates, 1)
+
+        sw.handle_request("/", "num1=12.5")
+        self.assertEqual(sw.alt.get_altitude(), 12.5)
+        sw.alt.get_altitude()
+        self.assertEqual(sensor.updates, 2)
+
+        sw.innums[0] = 3.0
+        self.assertEqual(sw.alt.get_altitude(), 3.0)
+        self.assertEqual(sensor.updates, 3)
+
+    def test_sensor_attributes_are_per_instance(self):
+        first, second = Stormworkspy(), Stormworkspy()
+        first.register_sensor("alt", SW_Altimeter, channel_altitude=1)
+        self.assertIsInstance(first, Stormworkspy)
+        self.assertIn("alt", type(first).__dict__)
+        self.assertFalse(hasattr(second, "alt"))
+        self.assertNotIn("alt", getattr(type(second), "__annotations__", {}))
+
+    def test_replace_sensor(self):
+        sw = Stormworkspy()
+        sw.register_sensor("alt", SW_Altimeter, channel_altitude=1)
+        replacement = SW_Altimeter(channel_altitude=2)
+        sw.alt = replacement
+        sw.innums[1] = 7.0
+        self.assertIs(sw.alt, replacement)
+        self.assertEqual(sw.alt.get_altitude(), 7.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
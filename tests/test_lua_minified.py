@@ -0,0 +1,46 @@
+import unittest
+import importlib.util
+import os
+
+LUA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "SW_lua")
+spec = importlib.util.spec_from_file_location("minify", os.path.join(LUA_DIR, "minify.py"))
+minify = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(minify)
+
+
+class TestLuaMinified(unittest.TestCase):
+    def setUp(self):
+        with open(minify.SOURCE) as f:
+            self.source = f.read()
+        with open(minify.TARGET) as f:
+            self.minified = f.read()
+
+    def test_minified_build_is_in_sync(self):
+        self.assertEqual(self.minified, minify.minify(self.source) + "\n",
+                         "run python SW_lua/minify.py to rebuild sw_minified.lua")
+
+    def test_fits_the_game_script_limit(self):
+        self.assertLessEqual(len(self.minified.strip()), 4096)
+
+    def test_only_locals_are_renamed(self):
+        source = minify.tokenize(self.source)
+        minified = minify.tokenize(self.minified)
+        self.assertEqual([kind for kind, _ in source], [kind for kind, _ in minified])
+        for (kind, old), (_, new) in zip(source, minified):
+            if kind != "name":
+                self.assertEqual(old, new)
+        for name in ("onTick", "httpReply", "onDraw", "COMPACT", "compactDecode"):
+            self.assertIn(name, [text for _, text in minified])
+
+    def test_local_scoping(self):
+        code = minify.minify(
+            "local x = x + 1 "
+            "local function f(a) local t = {a = a, x = x} return t.a end "
+            "for i = 1, 2 do print(i + 1) end")
+        self.assertEqual(
+            code, "local b=x+1 local function f(c)local d={a=c,x=b}return d.a end "
+                  "for e=1,2 do print(e+1)end")
+
+
+if __name__ == "__main__":
+    unittest.main()
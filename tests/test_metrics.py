@@ -0,0 +1,69 @@
+import unittest
+from Stormworkspy import Stormworkspy, StormworkspyHub
+from Stormworkspy.metrics import Counter, Histogram, Metrics, render
+
+
+class TestMetrics(unittest.TestCase):
+    def test_counts_requests_and_malformed_values(self):
+        sw = Stormworkspy()
+        sw.handle_request("/", "num1=1&num2=abc")
+        sw.handle_request("/c", "d=1,x,3")
+        sw.handle_request("/nowhere", "")
+
+        snapshot = sw.metrics.snapshot()
+        self.assertEqual(snapshot["stormworkspy_requests_total"], {"/": 1, "/c": 1})
+        self.assertEqual(snapshot["stormworkspy_malformed_values_total"], 2)
+        self.assertEqual(snapshot["stormworkspy_handler_seconds"]["count"], 2)
+        self.assertEqual(snapshot["stormworkspy_frame_interval_seconds"]["count"], 1)
+        self.assertGreater(sw.metrics.handler_seconds.sum, 0)
+
+    def test_metrics_endpoint(self):
+        sw = Stormworkspy()
+        sw.handle_request("/", "num1=1")
+        status, content_type, body = sw.handle_request("/metrics", "")
+        self.assertEqual(status, 200)
+        self.assertTrue(content_type.startswith("text/plain"))
+        text = body.decode()
+        self.assertIn("# TYPE stormworkspy_handler_seconds histogram", text)
+        self.assertIn('stormworkspy_requests_total{endpoint="/"} 1', text)
+        self.assertIn('stormworkspy_handler_seconds_bucket{le="+Inf"} 1', text)
+        self.assertIn("stormworkspy_malformed_values_total 0", text)
+
+    def test_metrics_can_be_disabled(self):
+        sw = Stormworkspy()
+        sw.metrics = None
+        self.assertEqual(sw.handle_request("/", "num1=1")[0], 200)
+        self.assertEqual(sw.handle_request("/metrics", "")[0], 404)
+
+    def test_hub_labels_vehicles(self):
+        hub = StormworkspyHub()
+        hub.create("truck")
+        hub.create("boat")
+        hub.handle_request("/truck/", "num1=1")
+        text = hub.handle_request("/metrics", "")[2].decode()
+        self.assertEqual(text.count("# TYPE stormworkspy_requests_total counter"), 1)
+        self.assertIn('stormworkspy_requests_total{vehicle="truck",endpoint="/"} 1', text)
+        self.assertIn('stormworkspy_handler_seconds_count{vehicle="boat"} 0', text)
+
+    def test_label_values_are_escaped(self):
+        text = render([({"vehicle": 'a"b\\c\nd'}, Metrics())])
+        self.assertIn('{vehicle="a\\"b\\\\c\\nd"}', text)
+
+    def test_new_label_during_render(self):
+        counter = Counter("c", "test", "endpoint")
+        counter.inc("/")
+        samples = counter.samples({})
+        next(samples)
+        counter.inc("/c")
+        self.assertEqual(list(samples), [])
+
+    def test_histogram_quantile(self):
+        histogram = Histogram("h", "test", (1.0, 2.0, 4.0))
+        for value in (0.5, 1.5, 1.5, 3.0):
+            histogram.observe(value)
+        self.assertEqual(histogram.counts, [1, 2, 1, 0])
+        self.assertEqual(histogram.quantile(0.5), 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -23,6 +23,35 @@ class TestNamedChannels(unittest.TestCase):
         with self.assertRaises(ValueError):
             sw.set_num_output("extra")
 
+    def test_free_slots_fill_gaps(self):
+        sw = Stormworkspy(pages=2)
+        sw.set_num_output("fixed", index=0)
+        sw.set_num_output("far", index=40)
+        self.assertEqual(sw.set_num_output("next"), 1)
+        for i in range(2, 63):
+            sw.set_num_output(f"ch{i}")
+        self.assertEqual(sw.num_out_names["ch40"], 41)
+        with self.assertRaises(ValueError):
+            sw.set_num_output("extra")
+        with self.assertRaises(ValueError):
+            sw.set_num_output("taken", index=40)
+
+    def test_names_are_unique_and_per_instance(self):
+        sw = Stormworkspy()
+        sw.set_num_output("speed")
+        with self.assertRaises(ValueError):
+            sw.set_num_input("speed")
+        with self.assertRaises(ValueError):
+            sw.set_num_output("outnums")
+        other = Stormworkspy()
+        self.assertFalse(hasattr(other, "speed"))
+
+    def test_named_input_follows_new_frames(self):
+        sw = Stormworkspy()
+        sw.set_num_input("speed", index=2)
+        sw.handle_request("/", "num3=7")
+        self.assertEqual(sw.speed, 7.0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+import time
+from Stormworkspy import Stormworkspy
+
+
+def delta(sw, seq):
+    parts = sw.handle_request("/c", f"d=&s={seq}")[2].decode().split(",")
+    return int(parts[0]), [int(i) - 1 for i in parts[2::2]]
+
+
+class TestOutputScheduling(unittest.TestCase):
+    def setUp(self):
+        self.sw = Stormworkspy()
+        self.seq, _ = delta(self.sw, 0)
+
+    def test_budget_prefers_priority_and_resends_the_rest(self):
+        sw = self.sw
+        sw.set_num_output("throttle", 5, priority=10)
+        sw.reply_budget = 2
+        for i in (1, 2, 3, 5):
+            sw.outnums[i] = 1.0
+        seq, sent = delta(sw, self.seq)
+        self.assertEqual(sent, [1, 5])
+        # the priority channel changed after the ones left out, so it rides along
+        seq, sent = delta(sw, seq)
+        self.assertEqual(sent, [2, 5])
+        seq, sent = delta(sw, seq)
+        self.assertEqual(sent, [3, 5])
+        seq, sent = delta(sw, seq)
+        self.assertEqual(sent, [])
+
+    def test_rate_limited_channel_waits(self):
+        sw = self.sw
+        sw.set_num_output("temperature", 4, max_rate=20)
+        sw.temperature = 1.0
+        seq, sent = delta(sw, self.seq)
+        self.assertEqual(sent, [4])
+        sw.temperature = 2.0
+        sw.outnums[0] = 1.0
+        seq, sent = delta(sw, seq)
+        self.assertEqual(sent, [0])
+        time.sleep(0.06)
+        seq, sent = delta(sw, seq)
+        self.assertEqual(sent, [0, 4])
+        seq, sent = delta(sw, seq)
+        self.assertEqual(sent, [])
+
+    def test_json_bools_are_scheduled(self):
+        sw = self.sw
+        sw.set_bool_output("lamp", 2, max_rate=1)
+        sw.lamp = True
+        self.assertIn('"bool3"', sw.handle_request("/", f"seq={self.seq}")[2].decode())
+        sw.lamp = False
+        body = sw.handle_request("/", f"seq={self.seq}")[2].decode()
+        self.assertNotIn('"bool3"', body)
+
+    def test_full_replies_are_not_limited(self):
+        sw = self.sw
+        sw.set_num_output("slow", 0, max_rate=0.1)
+        sw.reply_budget = 1
+        sw.slow = 3.0
+        self.assertTrue(sw.handle_request("/c", "d=")[2].startswith(b"3.0,"))
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            self.sw.set_num_output("x", max_rate=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from Stormworkspy import Stormworkspy, codec
+
+
+class TestPages(unittest.TestCase):
+    def setUp(self):
+        self.sw = Stormworkspy(pages=3)
+
+    def test_page_inputs_fill_their_slice(self):
+        sw = self.sw
+        self.assertEqual(len(sw.innums), 96)
+        sw.handle_request("/", "num1=1&bool2=true")
+        sw.handle_request("/c", "d=" + codec.encode_frame([2.0] * 32, [True] * 32) + "&b=2")
+        self.assertEqual(sw.innums[0], 1.0)
+        self.assertTrue(sw.inbools[1])
+        self.assertEqual(sw.innums[32:64], [0.0] * 32)
+        self.assertEqual(sw.innums[64:], [2.0] * 32)
+        self.assertTrue(all(sw.inbools[64:]))
+        self.assertEqual(sw.snapshot().nums[64], 2.0)
+
+    def test_replies_carry_their_page(self):
+        sw = self.sw
+        sw.set_num_output("flaps", 40)
+        sw.flaps = 7.5
+        sw.outbools[33] = True
+        status, _, body = sw.handle_request("/c", "d=&b=1")
+        nums, bools = codec.decode_frame(body.decode())
+        self.assertEqual(nums[8], 7.5)
+        self.assertTrue(bools[1])
+        self.assertEqual(codec.decode_frame(sw.handle_request("/c", "d=")[2].decode())[0], [0.0] * 32)
+
+    def test_delta_indices_are_page_relative(self):
+        sw = self.sw
+        seq = sw.handle_request("/c", "d=&b=1&s=0")[2].decode().split(",")[0]
+        sw.outnums[35] = 4.0
+        sw.outnums[3] = 1.0
+        body = sw.handle_request("/c", f"d=&b=1&s={seq}")[2].decode()
+        self.assertEqual(body.split(",")[2:], ["4", "4.0"])
+
+    def test_frame_numbers_are_tracked_per_page(self):
+        sw = self.sw
+        sw.handle_request("/", "num1=1&f=50")
+        sw.handle_request("/", "num1=2&b=1&f=3")
+        self.assertEqual(sw.innums[32], 2.0)
+
+    def test_bad_page(self):
+        self.assertEqual(self.sw.handle_request("/", "b=3")[0], 400)
+        self.assertEqual(self.sw.handle_request("/c", "b=x")[0], 400)
+        with self.assertRaises(ValueError):
+            Stormworkspy(pages=0)
+
+    def test_named_channels_span_pages(self):
+        sw = self.sw
+        self.assertEqual(sw.set_num_input("airspeed", 90), 90)
+        sw.handle_request("/", "num27=120&b=2")
+        self.assertEqual(sw.airspeed, 120.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import unittest
+from Stormworkspy import Stormworkspy
+from Stormworkspy.simulator import simulate
+
+
+class TestPipelining(unittest.TestCase):
+    def test_out_of_order_frames_are_dropped(self):
+        sw = Stormworkspy()
+        sw.handle_request("/", "num1=2&f=2")
+        status, _, body = sw.handle_request("/", "num1=1&f=1")
+        self.assertEqual(status, 200)
+        self.assertIn(b'"num1"', body)
+        self.assertEqual(sw.innums[0], 2.0)
+        self.assertEqual(sw.snapshot().counter, 1)
+        self.assertEqual(sw.metrics.stale_frames.value, 1)
+
+        sw.handle_request("/c", "d=3&f=3")
+        self.assertEqual(sw.innums[0], 3.0)
+
+    def test_restarted_client_is_accepted(self):
+        sw = Stormworkspy()
+        sw.handle_request("/", "num1=5&f=1000")
+        sw.handle_request("/", "num1=1&f=1")
+        self.assertEqual(sw.innums[0], 1.0)
+
+    def test_restart_below_the_reorder_window(self):
+        sw = Stormworkspy()
+        for f in range(1, 31):
+            sw.handle_request("/", f"num1={f}&f={f}")
+        sw.handle_request("/", "num1=-1&f=1")
+        self.assertEqual(sw.innums[0], -1.0)
+        sw.handle_request("/", "num1=-2&f=2")
+        self.assertEqual(sw.innums[0], -2.0)
+        # a late frame of the new run is still stale
+        sw.handle_request("/", "num1=-1&f=1")
+        self.assertEqual(sw.innums[0], -2.0)
+
+    def test_unnumbered_frames_always_apply(self):
+        sw = Stormworkspy()
+        sw.handle_request("/", "num1=5&f=10")
+        sw.handle_request("/", "num1=1")
+        self.assertEqual(sw.innums[0], 1.0)
+
+    def test_simulated_pipelined_clients(self):
+        sw = Stormworkspy()
+        sw.run_api(port=5641, backend="http")
+        self.addCleanup(sw.stop_api)
+        report = simulate(port=5641, vehicles=2, duration=0.3, tick_rate=240,
+                          compact=True, delta=True, pipeline=3)
+        self.assertGreater(report.responses, 0)
+        self.assertEqual(report.errors + report.invalid, 0)
+        self.assertGreater(sw.snapshot().counter, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+import json
+from Stormworkspy import codec
+
+
+class TestQueryParsing(unittest.TestCase):
+    def test_parse_channels(self):
+        nums, mask, args = codec.parse_query("num1=1.5&num32=-2&bool1=true&bool3=YES&bool4=0&seq=7")
+        self.assertEqual(nums[0], 1.5)
+        self.assertEqual(nums[31], -2.0)
+        self.assertEqual(nums[1], 0.0)
+        self.assertEqual(mask, 0b101)
+        self.assertEqual(args, {"seq": "7"})
+
+    def test_malformed_and_encoded_values(self):
+        nums, _, _ = codec.parse_query("num1=abc&num2=1e+20&num3=%2D4.5&num4=")
+        self.assertEqual(nums[:4], [0.0, 1e20, -4.5, 0.0])
+
+    def test_first_occurrence_wins(self):
+        nums, mask, args = codec.parse_query("num1=1&num1=2&bool1=true&bool1=false&s=1&s=2")
+        self.assertEqual(nums[0], 1.0)
+        self.assertEqual(mask, 1)
+        self.assertEqual(args["s"], "1")
+
+    def test_encode_json(self):
+        nums = [float(i) for i in range(32)]
+        bools = [i % 2 == 0 for i in range(32)]
+        data = json.loads(codec.encode_json(nums, bools))
+        self.assertEqual(len(data), 64)
+        self.assertEqual(data["num5"], 4.0)
+        self.assertEqual(data["bool1"], "true")
+        self.assertEqual(data["bool2"], "false")
+
+
+if __name__ == "__main__":
+    unittest.main()
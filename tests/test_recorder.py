@@ -0,0 +1,111 @@
+import unittest
+import os
+import tempfile
+import threading
+from Stormworkspy import Stormworkspy
+from Stormworkspy.recorder import TelemetryReader, TelemetryRecorder
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestRecorder(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".swtr")
+        os.close(handle)
+        self.addCleanup(os.remove, self.path)
+
+    def test_records_exchanges(self):
+        sw = Stormworkspy()
+        sw.start_recording(self.path, capacity=10)
+        sw.outnums[0] = 2.5
+        sw.outbools[1] = True
+        sw.handle_request("/", "num1=1&bool3=true")
+        sw.handle_request("/c", "d=4")
+        sw.stop_recording()
+
+        with TelemetryReader(self.path) as reader:
+            frames = list(reader.frames())
+        self.assertEqual(len(frames), 2)
+        self.assertEqual(frames[0].innums[0], 1.0)
+        self.assertTrue(frames[0].inbools[2])
+        self.assertEqual(frames[0].outnums[0], 2.5)
+        self.assertTrue(frames[0].outbools[1])
+        self.assertEqual(frames[1].innums[0], 4.0)
+        self.assertLessEqual(frames[0].timestamp, frames[1].timestamp)
+
+    def test_ring_wraps_and_time_range(self):
+        recorder = TelemetryRecorder(self.path, capacity=3)
+        for t in range(5):
+            recorder.append(float(t), [float(t)] * 32, 0, [0.0] * 32, 0)
+        self.assertEqual(len(recorder), 3)
+        self.assertEqual(recorder.count, 5)
+        self.assertEqual([f.timestamp for f in recorder.frames()], [2.0, 3.0, 4.0])
+        self.assertEqual([f.timestamp for f in recorder.frames(3.0, 4.0)], [3.0])
+        self.assertEqual(len(recorder.views(2.0, 5.0)), 2)
+        recorder.close()
+
+        recorder = TelemetryRecorder(self.path, capacity=3)
+        recorder.append(5.0, [0.0] * 32, 0, [0.0] * 32, 0)
+        self.assertEqual([f.timestamp for f in recorder.frames()], [3.0, 4.0, 5.0])
+        recorder.close()
+
+    def test_none_output_is_recorded_as_nan(self):
+        sw = Stormworkspy()
+        sw.start_recording(self.path, capacity=10)
+        sw.outnums[3] = None
+        self.assertEqual(sw.handle_request("/", "num1=1")[0], 200)
+        sw.stop_recording()
+
+        with TelemetryReader(self.path) as reader:
+            (frame,) = reader.frames()
+        self.assertEqual(frame.innums[0], 1.0)
+        self.assertNotEqual(frame.outnums[3], frame.outnums[3])
+
+    def test_recording_errors_do_not_fail_requests(self):
+        sw = Stormworkspy()
+        recorder = sw.start_recording(self.path, capacity=10)
+        recorder._mm.close()
+        with self.assertLogs("Stormworkspy.Stormworkspy", "ERROR"):
+            self.assertEqual(sw.handle_request("/", "num1=1")[0], 200)
+        sw.recorder = None
+        recorder._file.close()
+
+    def test_concurrent_appends_keep_every_record(self):
+        recorder = TelemetryRecorder(self.path, capacity=4000)
+        zeros = [0.0] * 32
+
+        def append(thread):
+            for i in range(500):
+                recorder.append(float(i), zeros, thread, zeros, 0)
+
+        threads = [threading.Thread(target=append, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        recorder.close()
+
+        with TelemetryReader(self.path) as reader:
+            self.assertEqual(reader.count, 4000)
+            frames = list(reader.frames())
+        for n in range(8):
+            self.assertEqual(sum(frame.inbools == [bool(n >> i & 1) for i in range(32)]
+                                 for frame in frames), 500)
+
+    @unittest.skipIf(numpy is None, "numpy not installed")
+    def test_numpy_view(self):
+        recorder = TelemetryRecorder(self.path, capacity=4)
+        for t in range(3):
+            recorder.append(float(t), [float(t)] * 32, 1, [0.0] * 32, 0)
+        array = recorder.to_numpy(1.0)
+        self.assertEqual(list(array["timestamp"]), [1.0, 2.0])
+        self.assertEqual(array["innums"][1][5], 2.0)
+        del array
+        recorder.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import os
+import tempfile
+import time
+from Stormworkspy import Stormworkspy
+from Stormworkspy.recorder import Record, TelemetryReader
+from Stormworkspy.replay import diff_outputs, replay
+
+
+def double_first_input(sw):
+    sw.outnums[0] = sw.innums[0] * 2
+    sw.outbools[0] = sw.inbools[0]
+
+
+def make_frames(count, step=0.0):
+    return [
+        Record(t * step, [float(t)] + [0.0] * 31, [t % 2 == 1] + [False] * 31,
+               [0.0] * 32, [False] * 32)
+        for t in range(count)
+    ]
+
+
+class TestReplay(unittest.TestCase):
+    def test_replay_captures_reply_outputs(self):
+        result = replay(Stormworkspy(), make_frames(3), control=double_first_input)
+        # each reply carries what control computed for the previous frame
+        self.assertEqual([r.outnums[0] for r in result], [0.0, 0.0, 2.0])
+        self.assertEqual([r.outbools[0] for r in result], [False, False, True])
+        self.assertEqual(result[2].innums[0], 2.0)
+
+    def test_compact_path_matches_json_path(self):
+        frames = make_frames(5)
+        json_run = replay(Stormworkspy(), frames, control=double_first_input)
+        compact_run = replay(Stormworkspy(), frames, control=double_first_input, path="/c")
+        self.assertEqual(diff_outputs(json_run, compact_run), [])
+
+    def test_replay_recorded_session(self):
+        handle, path = tempfile.mkstemp(suffix=".swtr")
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+
+        sw = Stormworkspy()
+        sw.start_recording(path, capacity=10)
+        for t in range(4):
+            sw.handle_request("/", f"num1={t}")
+            double_first_input(sw)
+        sw.stop_recording()
+
+        with TelemetryReader(path) as reader:
+            expected = list(reader.frames())
+        self.assertEqual(diff_outputs(expected, replay(Stormworkspy(), path, control=double_first_input)), [])
+
+        mismatches = diff_outputs(expected, replay(Stormworkspy(), path))
+        self.assertEqual([(m.frame, m.channel) for m in mismatches], [(2, "num1"), (3, "num1")])
+
+    def test_speed_follows_recorded_timing(self):
+        started = time.perf_counter()
+        replay(Stormworkspy(), make_frames(3, step=0.1), speed=4.0)
+        self.assertGreaterEqual(time.perf_counter() - started, 0.05)
+
+    def test_unknown_path(self):
+        with self.assertRaises(ValueError):
+            replay(Stormworkspy(), make_frames(1), path="/x")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+from Stormworkspy import Stormworkspy, codec
+
+
+class TestReplyCache(unittest.TestCase):
+    def counts(self, sw):
+        return sw.metrics.snapshot()["stormworkspy_reply_cache_total"]
+
+    def test_unchanged_outputs_are_served_from_cache(self):
+        sw = Stormworkspy()
+        sw.outnums[0] = 1.5
+        first = sw.handle_request("/", "num1=1")[2]
+        second = sw.handle_request("/", "num1=2")[2]
+        self.assertIs(first, second)
+        self.assertEqual(self.counts(sw), {"miss": 1, "hit": 1})
+
+        sw.outnums[0] = 2.5
+        third = sw.handle_request("/", "num1=3")[2]
+        self.assertIn(b'"num1":2.5', third.replace(b" ", b""))
+        self.assertEqual(self.counts(sw), {"miss": 2, "hit": 1})
+
+    def test_formats_and_deltas_are_cached_separately(self):
+        sw = Stormworkspy()
+        sw.outnums[1] = 4.0
+        full = sw.handle_request("/c", "d=")[2]
+        self.assertEqual(codec.decode_frame(full.decode())[0][1], 4.0)
+        seq = sw.handle_request("/c", "d=&s=0")[2].split(b",")[0].decode()
+        delta = sw.handle_request("/c", "d=&s=" + seq)[2]
+        self.assertEqual(delta, seq.encode() + b",0")
+        self.assertIs(sw.handle_request("/c", "d=&s=" + seq)[2], delta)
+        self.assertIs(sw.handle_request("/c", "d=")[2], full)
+        self.assertEqual(self.counts(sw), {"miss": 3, "hit": 2})
+
+    def test_batch_commit_invalidates(self):
+        sw = Stormworkspy()
+        before = sw.handle_request("/c", "d=")[2]
+        with sw.batch():
+            sw.outnums[0] = 7
+            self.assertEqual(sw.handle_request("/c", "d=")[2], before)
+        nums, _ = codec.decode_frame(sw.handle_request("/c", "d=")[2].decode())
+        self.assertEqual(nums[0], 7)
+
+    def test_scheduled_deltas_are_not_cached(self):
+        sw = Stormworkspy()
+        sw.reply_budget = 1
+        sw.handle_request("/", "seq=0")
+        sw.handle_request("/", "seq=0")
+        self.assertEqual(self.counts(sw), {"miss": 2})
+
+    def test_scheduling_set_later_bypasses_cached_deltas(self):
+        sw = Stormworkspy()
+        seq = sw.handle_request("/c", "d=&s=0")[2].split(b",")[0].decode()
+        for i in range(4):
+            sw.outnums[i] = i + 1.0
+        unbudgeted = sw.handle_request("/c", "d=&s=" + seq)[2]
+        self.assertEqual(unbudgeted.count(b","), 9)
+        sw.reply_budget = 1
+        budgeted = sw.handle_request("/c", "d=&s=" + seq)[2]
+        self.assertEqual(budgeted.count(b","), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
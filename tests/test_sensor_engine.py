@@ -0,0 +1,51 @@
+import unittest
+import inspect
+from Stormworkspy import Stormworkspy
+from Stormworkspy.sensors import (
+    BOOL, NUM, Sensor, SW_GPS, SW_PlayerSensor, compile_gather,
+)
+
+
+class SW_Gearbox(Sensor):
+    FIELDS = (
+        ("gear", NUM, int),
+        ("clutch", BOOL, None),
+    )
+
+
+class TestSensorEngine(unittest.TestCase):
+    def test_generated_init(self):
+        params = list(inspect.signature(SW_Gearbox.__init__).parameters)
+        self.assertEqual(params, ["self", "channel_gear", "channel_clutch"])
+        sensor = SW_Gearbox(channel_gear=3)
+        self.assertEqual(sensor.channel_gear, 2)
+        self.assertIsNone(sensor.channel_clutch)
+        self.assertEqual(sensor._gear, 0)
+        self.assertIs(sensor._clutch, False)
+
+    def test_conversion_and_range(self):
+        sensor = SW_PlayerSensor(channel_players=2, channel_detected=40)
+        sensor.update([0.0, 3.7], [True])
+        self.assertEqual(sensor.get_players(), 3)
+        self.assertFalse(sensor.is_detected())
+
+    def test_batch_gather(self):
+        gps = SW_GPS(channel_x=1, channel_y=2)
+        gearbox = SW_Gearbox(channel_gear=3, channel_clutch=1)
+        gather = compile_gather([gps, gearbox])
+        gather([5.0, 6.0, 2.0] + [0.0] * 29, [True] + [False] * 31)
+        self.assertEqual(gps.get_position(), (5.0, 6.0))
+        self.assertEqual(gearbox._gear, 2)
+        self.assertTrue(gearbox._clutch)
+
+    def test_registered_sensors_refresh_together(self):
+        sw = Stormworkspy()
+        sw.register_sensor("gps", SW_GPS, channel_x=1, channel_y=2)
+        sw.register_sensor("gearbox", SW_Gearbox, channel_gear=3)
+        sw.handle_request("/", "num1=1&num2=2&num3=4")
+        sw.gps
+        self.assertEqual(sw.sensors["gearbox"]._gear, 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -18,6 +18,13 @@ class TestSensorRegistration(unittest.TestCase):
         with self.assertRaises(ValueError):
             sw.register_sensor('alt', SW_Altimeter, channel_altitude=1)
 
+    def test_name_cannot_shadow_attribute(self):
+        sw = Stormworkspy()
+        for name in ('metrics', 'innums', 'handle_request'):
+            with self.assertRaises(ValueError):
+                sw.register_sensor(name, SW_Altimeter, channel_altitude=1)
+        self.assertEqual(sw.handle_request('/', 'num1=1')[0], 200)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+import pickle
+from Stormworkspy.sensors import PhysicsState, SW_Altimeter, SW_PhysicsSensor
+
+
+class TestSensorState(unittest.TestCase):
+    def test_sensors_use_slots(self):
+        sensor = SW_Altimeter(channel_altitude=1)
+        self.assertFalse(hasattr(sensor, "__dict__"))
+        with self.assertRaises(AttributeError):
+            sensor.unexpected = 1
+
+    def test_physics_state(self):
+        sensor = SW_PhysicsSensor(channel_pos_x=1, channel_heading=2)
+        sensor.update([1.5, 0.25] + [0.0] * 30, [False] * 32)
+        state = sensor.get_all()
+        self.assertIsInstance(state, PhysicsState)
+        self.assertEqual(state.pos_x, 1.5)
+        self.assertEqual(state["heading"], 0.25)
+        self.assertEqual(state[0], 1.5)
+        self.assertEqual(state._asdict()["heading"], 0.25)
+        self.assertEqual(pickle.loads(pickle.dumps(state)), state)
+        with self.assertRaises(AttributeError):
+            state.pos_x = 2.0
+
+    def test_physics_state_mapping_methods(self):
+        sensor = SW_PhysicsSensor(channel_pos_x=1)
+        sensor.update([1.5] + [0.0] * 31, [False] * 32)
+        state = sensor.get_all()
+        self.assertIn("pos_x", state)
+        self.assertNotIn("missing", state)
+        self.assertEqual(state.get("pos_x"), 1.5)
+        self.assertEqual(state.get("missing", -1), -1)
+        self.assertEqual(dict(state.items()), state._asdict())
+        self.assertEqual(list(state.keys())[0], "pos_x")
+        self.assertEqual(state.values()[0], 1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
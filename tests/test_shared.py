@@ -0,0 +1,80 @@
+import unittest
+import http.client
+import json
+import os
+import subprocess
+import sys
+from Stormworkspy.channels import Frame
+from Stormworkspy.shared import SharedFrames, SharedServer
+
+
+class TestSharedFrames(unittest.TestCase):
+    def test_round_trip_between_handles(self):
+        owner = SharedFrames(channels=64)
+        other = SharedFrames(owner.name)
+        try:
+            self.assertEqual(other.channels, 64)
+            self.assertEqual(other.read_inputs().counter, 0)
+            self.assertIsNone(other.wait_for_frame(timeout=0.01))
+            owner.write_inputs(Frame([1.5] * 64, [True] * 64, 12.0, 3))
+            frame = other.wait_for_frame(after=2, timeout=1)
+            self.assertEqual((frame.counter, frame.timestamp), (3, 12.0))
+            self.assertEqual((frame.nums[63], frame.bools[0]), (1.5, True))
+
+            seq = owner.output_seq
+            other.write_outputs([2.0] * 64, [0] * 64)
+            new_seq, nums, bools = owner.read_outputs()
+            self.assertEqual(new_seq, seq + 2)
+            self.assertEqual((nums[0], bools[0]), (2.0, False))
+            with self.assertRaises(ValueError):
+                other.write_outputs([0.0] * 32, [False] * 32)
+        finally:
+            other.close()
+            owner.close()
+
+
+class TestSharedServer(unittest.TestCase):
+    def test_control_runs_in_another_process(self):
+        server = SharedServer(host="127.0.0.1", port=5661)
+        server.start()
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", 5661)
+            conn.request("GET", "/?num1=4&bool2=true")
+            self.assertEqual(json.loads(conn.getresponse().read())["num1"], 0.0)
+            frame = server.frames.wait_for_frame(after=0, timeout=5)
+            self.assertEqual((frame.nums[0], frame.bools[1]), (4.0, True))
+
+            server.frames.write_outputs([frame.nums[0] * 2] + [0.0] * 31, [True] + [False] * 31)
+            conn.request("GET", "/?num1=5")
+            data = json.loads(conn.getresponse().read())
+            self.assertEqual((data["num1"], data["bool1"]), (8.0, "true"))
+            conn.close()
+        finally:
+            server.stop()
+        self.assertIsNone(server.process)
+
+    def test_resource_tracker_stays_quiet(self):
+        # the tracker reports to the stderr of the process that started it
+        script = (
+            "from Stormworkspy.shared import SharedFrames, SharedServer\n"
+            "import subprocess, sys\n"
+            "owner = SharedFrames()\n"
+            "SharedFrames(owner.name).close()\n"
+            "attach = 'from Stormworkspy.shared import SharedFrames; SharedFrames(%r).close()'\n"
+            "subprocess.run([sys.executable, '-c', attach % owner.name], check=True)\n"
+            "SharedFrames(owner.name).close()  # still there after the other process exited\n"
+            "owner.close()\n"
+            "server = SharedServer(host='127.0.0.1', port=5662)\n"
+            "server.start()\n"
+            "server.stop()\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        env = dict(os.environ, PYTHONPATH=root)
+        result = subprocess.run([sys.executable, "-c", script], capture_output=True,
+                                text=True, env=env, timeout=60)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stderr, "")
+
+
+if __name__ == "__main__":
+    unittest.main()
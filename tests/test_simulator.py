@@ -0,0 +1,55 @@
+import unittest
+import math
+from Stormworkspy import Stormworkspy, StormworkspyHub
+from Stormworkspy.simulator import SimulationReport, simulate
+
+
+class TestSimulator(unittest.TestCase):
+    def test_load_against_server(self):
+        sw = Stormworkspy()
+        sw.outnums[0] = 1.5
+        sw.run_api(port=5631, backend="http")
+        self.addCleanup(sw.stop_api)
+
+        for compact in (False, True):
+            for delta in (False, True):
+                report = simulate(port=5631, vehicles=3, duration=0.3, tick_rate=240,
+                                  interval=2, compact=compact, delta=delta)
+                self.assertGreater(report.responses, 0)
+                self.assertEqual(report.errors, 0)
+                self.assertEqual(report.invalid, 0)
+                self.assertEqual(len(report.latencies), report.responses)
+        self.assertNotEqual(sw.innums, [0.0] * 32)
+
+    def test_hub_vehicle_names(self):
+        hub = StormworkspyHub()
+        truck, boat = hub.create("truck"), hub.create("boat")
+        hub.run_api(port=5632, backend="http")
+        self.addCleanup(hub.stop_api)
+
+        report = simulate(port=5632, vehicles=2, duration=0.2, tick_rate=240,
+                          compact=True, names=["truck", "boat"])
+        self.assertEqual(report.errors + report.invalid, 0)
+        self.assertGreater(truck.snapshot().counter, 0)
+        self.assertGreater(boat.snapshot().counter, 0)
+
+    def test_unreachable_server_counts_errors(self):
+        report = simulate(port=5639, duration=0.1, tick_rate=240, interval=1)
+        self.assertGreater(report.errors, 0)
+        self.assertEqual(report.responses, 0)
+
+    def test_report_statistics(self):
+        report = SimulationReport(1, 2.0)
+        report.responses = 4
+        report.latencies = [0.0004, 0.003, 0.003, 2.0]
+        self.assertEqual(report.throughput, 2.0)
+        self.assertEqual(report.percentile(50), 0.003)
+        histogram = dict(report.histogram())
+        self.assertEqual(histogram[0.5], 1)
+        self.assertEqual(histogram[5], 2)
+        self.assertEqual(histogram[math.inf], 1)
+        self.assertIn("p99", str(report))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+from Stormworkspy import Stormworkspy
+
+
+class TestSnapshot(unittest.TestCase):
+    def test_snapshot_is_consistent(self):
+        sw = Stormworkspy()
+        self.assertEqual(sw.snapshot().counter, 0)
+
+        sw.handle_request("/", "num1=1&bool1=true")
+        first = sw.snapshot()
+        self.assertEqual(first.counter, 1)
+        self.assertEqual(first.nums[0], 1.0)
+        self.assertTrue(first.bools[0])
+        self.assertGreater(first.timestamp, 0.0)
+
+        sw.handle_request("/c", "d=2,0,0")
+        second = sw.snapshot()
+        self.assertEqual(second.counter, 2)
+        self.assertEqual(second.nums[0], 2.0)
+        self.assertFalse(second.bools[0])
+        # the earlier frame is left untouched by the new request
+        self.assertEqual(first.nums[0], 1.0)
+        self.assertTrue(first.bools[0])
+        self.assertIs(sw.innums, second.nums)
+
+
+if __name__ == "__main__":
+    unittest.main()
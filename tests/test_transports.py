@@ -0,0 +1,94 @@
+import unittest
+import http.client
+import json
+import logging
+import socket
+from Stormworkspy import Stormworkspy
+from Stormworkspy.transport import make_flask_app, start_transport
+
+
+class FailingHandler:
+    def __init__(self):
+        self.app = make_flask_app(self)
+        self.app.logger.disabled = True
+
+    def handle_request(self, path, query):
+        if path == "/fail":
+            raise ValueError("broken handler")
+        return 200, "text/plain", b"ok"
+
+
+class TestTransports(unittest.TestCase):
+    def check_backend(self, backend, port):
+        sw = Stormworkspy()
+        sw.outnums[0] = 1.5
+        sw.run_api(host="127.0.0.1", port=port, backend=backend)
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port)
+            # two requests on one keep-alive connection
+            for value in (1, 2):
+                conn.request("GET", f"/?num1={value}&bool2=true")
+                resp = conn.getresponse()
+                data = json.loads(resp.read())
+                self.assertEqual(resp.status, 200)
+                self.assertEqual(data["num1"], 1.5)
+                self.assertEqual(sw.innums[0], float(value))
+                self.assertTrue(sw.inbools[1])
+            conn.request("GET", "/missing")
+            resp = conn.getresponse()
+            resp.read()
+            self.assertEqual(resp.status, 404)
+            conn.close()
+        finally:
+            sw.stop_api()
+        self.assertIsNone(sw.thread)
+
+    def test_flask_backend(self):
+        self.check_backend("flask", 5611)
+
+    def test_http_backend(self):
+        self.check_backend("http", 5612)
+
+    def test_asyncio_backend(self):
+        self.check_backend("asyncio", 5613)
+
+    def test_handler_errors_answer_500(self):
+        logging.getLogger("Stormworkspy.transport").disabled = True
+        self.addCleanup(setattr, logging.getLogger("Stormworkspy.transport"), "disabled", False)
+        for backend, port in (("flask", 5614), ("http", 5615), ("asyncio", 5616)):
+            with self.subTest(backend=backend):
+                transport = start_transport(FailingHandler(), "127.0.0.1", port, backend=backend)
+                try:
+                    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+                    conn.request("GET", "/fail")
+                    resp = conn.getresponse()
+                    resp.read()
+                    self.assertEqual(resp.status, 500)
+                    conn.request("GET", "/")
+                    resp = conn.getresponse()
+                    self.assertEqual((resp.status, resp.read()), (200, b"ok"))
+                    conn.close()
+                finally:
+                    transport.stop()
+
+    def test_asyncio_rejects_bad_request_lines(self):
+        transport = start_transport(FailingHandler(), "127.0.0.1", 5617, backend="asyncio")
+        try:
+            for line in (b"GET /?" + b"a" * 70000 + b" HTTP/1.1\r\n", b"garbage\r\n"):
+                with self.subTest(length=len(line)):
+                    with socket.create_connection(("127.0.0.1", 5617), timeout=5) as sock:
+                        sock.sendall(line + b"\r\n")
+                        reply = b""
+                        while chunk := sock.recv(4096):
+                            reply += chunk
+                    self.assertTrue(reply.startswith(b"HTTP/1.1 400 "), reply[:40])
+        finally:
+            transport.stop()
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            Stormworkspy().run_api(backend="carrier-pigeon")
+
+
+if __name__ == "__main__":
+    unittest.main()
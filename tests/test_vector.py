@@ -0,0 +1,51 @@
+import unittest
+from Stormworkspy import Stormworkspy, StormworkspyHub
+from Stormworkspy.sensors import SW_CompassSensor, SW_GPS
+
+try:
+    import numpy
+    from Stormworkspy import vector
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "numpy not installed")
+class TestVector(unittest.TestCase):
+    def test_to_numpy(self):
+        sw = Stormworkspy()
+        sw.handle_request("/", "num2=1.5&bool3=true")
+        sw.outnums[0] = 2.0
+        innums, inbools, outnums, outbools = sw.to_numpy()
+        self.assertEqual((innums[1], inbools[2], outnums[0]), (1.5, True, 2.0))
+        self.assertEqual(outbools.dtype, bool)
+
+    def test_fleet_sensor_arrays(self):
+        hub = StormworkspyHub()
+        for name, channel, query in (("a", 1, "num1=3&num2=4"), ("b", 3, "num3=6&num4=8")):
+            sw = hub.create(name)
+            sw.register_sensor("gps", SW_GPS, channel_x=channel, channel_y=channel + 1)
+            sw.handle_request("/", query)
+        nums, bools = vector.fleet_arrays(hub)
+        self.assertEqual(nums.shape, (2, 32))
+        gps = vector.sensor_arrays(hub, "gps")
+        self.assertEqual(gps["x"].tolist(), [3.0, 6.0])
+        distance = vector.gps_distance(0, 0, gps["x"], gps["y"])
+        self.assertEqual(distance.tolist(), [5.0, 10.0])
+
+    def test_sensor_columns_are_views(self):
+        compass = SW_CompassSensor(channel_heading=2, channel_backlight=1)
+        nums = numpy.zeros((3, 32))
+        bools = numpy.zeros((3, 32), dtype=bool)
+        columns = vector.sensor_columns(compass, nums, bools)
+        nums[:, 1] = 0.25
+        self.assertEqual(columns["heading"].tolist(), [0.25] * 3)
+        self.assertEqual(sorted(columns), ["backlight", "heading"])
+
+    def test_derived_quantities(self):
+        delta = vector.heading_delta([0.45, -0.25], [-0.45, 0.25])
+        numpy.testing.assert_allclose(delta, [0.1, -0.5])
+        self.assertEqual(vector.velocity_magnitude([2.0], [3.0], [6.0]).tolist(), [7.0])
+
+
+if __name__ == "__main__":
+    unittest.main()